@@ -0,0 +1,188 @@
+"""
+Benchmarks for the svg_icon Render Path
+=======================================
+
+Standalone benchmark of the template tags against the icon libraries
+bundled under ``icons/``. Each scenario renders a template containing
+1, 100 or 1000 icons and reports timings as JSON so runs can be compared
+across commits.
+
+Dimensions:
+    tag      svg_icon, icon (preset tag) and svg_icon_simple (filter)
+    library  bootstrap, heroicons-outline, heroicons-solid
+    icons    icons per template render
+    mode     inline SVG or <img>
+    debug    DEBUG on (no Django cache) or off
+    cache    cold (every process-local cache, markup folded into
+             templates and the Django cache cleared before every run;
+             only the icon registry built at startup is kept)
+             or warm (primed by one untimed render)
+
+Usage:
+    python benchmarks/bench_render.py
+    python benchmarks/bench_render.py --quick --output bench.json
+    python benchmarks/bench_render.py --library bootstrap --icons 100 --repeat 20
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from itertools import islice, cycle, product
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import django  # noqa: E402
+from django.conf import settings  # noqa: E402
+
+LIBRARIES = ('bootstrap', 'heroicons-outline', 'heroicons-solid')
+ICON_COUNTS = (1, 100, 1000)
+
+TEMPLATES = {
+    'svg_icon': (
+        '{% load svg_icon_tags %}{% for n in names %}'
+        '{% svg_icon n library=library inline=inline class_name="w-4 h-4" %}'
+        '{% endfor %}'
+    ),
+    'icon': (
+        '{% load svg_icon_tags %}{% for n in names %}'
+        '{% icon n library=library size="lg" color="primary" %}'
+        '{% endfor %}'
+    ),
+    'svg_icon_simple': (
+        '{% load svg_icon_tags %}{% for n in qualified_names %}'
+        '{{ n|svg_icon_simple }}'
+        '{% endfor %}'
+    ),
+}
+
+
+def configure():
+    settings.configure(
+        DEBUG=False,
+        SECRET_KEY='benchmark',
+        INSTALLED_APPS=['django.contrib.staticfiles', 'django_svg_icon_tags'],
+        STATIC_URL='/static/',
+        STATICFILES_DIRS=[str(ROOT)],
+        TEMPLATES=[{'BACKEND': 'django.template.backends.django.DjangoTemplates', 'APP_DIRS': True}],
+        CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+    )
+    django.setup()
+
+
+def icon_names(library, count):
+    names = sorted(path.stem for path in (ROOT / 'icons' / library).glob('*.svg'))
+    return list(islice(cycle(names), count))
+
+
+def clear_caches():
+    from django.core.cache import cache
+    from django_svg_icon_tags import static_urls
+    from django_svg_icon_tags.templatetags import svg_icon_tags
+
+    svg_icon_tags.clear_icon_cache()
+    # Also bumps the render generation, which drops folded template markup.
+    svg_icon_tags.clear_render_cache()
+    svg_icon_tags._url_cache = None
+    svg_icon_tags._miss_cache = None
+    static_urls._url_manifest = static_urls._UNSET
+    cache.clear()
+
+
+def run_scenario(tag, library, count, inline, debug, warm, repeat):
+    from django.template import Context, Template
+    from django.test import override_settings
+    from django_svg_icon_tags.templatetags import svg_icon_tags
+
+    template = Template(TEMPLATES[tag])
+    names = icon_names(library, count)
+    context = {
+        'names': names,
+        'qualified_names': [f"{library}:{name}" for name in names],
+        'library': library,
+        'inline': inline,
+    }
+
+    timings = []
+    with override_settings(DEBUG=debug):
+        use_django_cache = svg_icon_tags._USE_DJANGO_CACHE
+        svg_icon_tags._USE_DJANGO_CACHE = not debug
+        try:
+            if warm:
+                template.render(Context(context))
+            for _ in range(repeat):
+                if not warm:
+                    clear_caches()
+                started = time.perf_counter()
+                template.render(Context(context))
+                timings.append(time.perf_counter() - started)
+        finally:
+            svg_icon_tags._USE_DJANGO_CACHE = use_django_cache
+
+    return {
+        'tag': tag,
+        'library': library,
+        'icons': count,
+        'mode': 'inline' if inline else 'img',
+        'debug': debug,
+        'cache': 'warm' if warm else 'cold',
+        'repeat': repeat,
+        'min_ms': min(timings) * 1000,
+        'median_ms': statistics.median(timings) * 1000,
+        'mean_ms': statistics.mean(timings) * 1000,
+        'per_icon_us': statistics.median(timings) * 1e6 / count,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--library', action='append', choices=LIBRARIES, help="Limit to a library (repeatable).")
+    parser.add_argument('--icons', action='append', type=int, help="Icons per template (repeatable).")
+    parser.add_argument('--tag', action='append', choices=sorted(TEMPLATES), help="Limit to a tag (repeatable).")
+    parser.add_argument('--repeat', type=int, default=5, help="Timed renders per scenario (default 5).")
+    parser.add_argument('--quick', action='store_true', help="svg_icon on bootstrap only, 3 repeats.")
+    parser.add_argument('--output', '-o', help="Write JSON results to this file instead of stdout.")
+    args = parser.parse_args(argv)
+
+    configure()
+
+    tags = args.tag or (['svg_icon'] if args.quick else sorted(TEMPLATES))
+    libraries = args.library or (['bootstrap'] if args.quick else LIBRARIES)
+    counts = args.icons or ICON_COUNTS
+    repeat = 3 if args.quick else args.repeat
+
+    results = []
+    for tag, library, count, inline, debug, warm in product(
+        tags, libraries, counts, (True, False), (False, True), (False, True)
+    ):
+        if tag != 'svg_icon' and not inline:
+            continue
+        result = run_scenario(tag, library, count, inline, debug, warm, repeat)
+        results.append(result)
+        print(
+            f"{tag:16} {library:18} {count:5} {result['mode']:6} "
+            f"debug={str(debug):5} {result['cache']:4} {result['median_ms']:9.3f} ms",
+            file=sys.stderr,
+        )
+
+    report = {
+        'meta': {
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'platform': platform.platform(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        },
+        'results': results,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + '\n', encoding='utf-8')
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
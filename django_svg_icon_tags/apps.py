@@ -1,7 +1,10 @@
 """
 Django App Configuration for SVG Icon Tags
 """
+import threading
+
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class SvgIconTagsConfig(AppConfig):
@@ -12,4 +15,38 @@ class SvgIconTagsConfig(AppConfig):
     
     def ready(self):
         """Initialize app when ready"""
-        pass
\ No newline at end of file
+        from django_svg_icon_tags.bundle import get_icon_bundle
+        from django_svg_icon_tags.registry import get_invalidation_mode, get_registry_mode, icon_registry
+
+        get_icon_bundle()
+        if get_registry_mode() == 'eager':
+            icon_registry.build()
+        if get_registry_mode() and get_invalidation_mode() == 'watch':
+            from django_svg_icon_tags.watcher import should_autostart, start_icon_watcher
+            if should_autostart():
+                start_icon_watcher()
+        if getattr(settings, 'SVG_ICON_SEARCH_INDEX', 'lazy') == 'eager':
+            from django_svg_icon_tags.search import get_search_index
+            get_search_index()
+
+        patterns = getattr(settings, 'SVG_ICON_PRELOAD', None)
+        preload_used = getattr(settings, 'SVG_ICON_PRELOAD_USED', False)
+        if patterns or preload_used:
+            from django_svg_icon_tags.templatetags.svg_icon_tags import preload_icons, preload_used_icons
+
+            if patterns:
+                self._preload(preload_icons, patterns)
+            if preload_used:
+                self._preload(preload_used_icons)
+
+    def _preload(self, function, *args):
+        """Warm the icon cache at startup, optionally off the boot path."""
+        if getattr(settings, 'SVG_ICON_PRELOAD_BACKGROUND', False):
+            threading.Thread(
+                target=function,
+                args=args,
+                name='svg-icon-preload',
+                daemon=True,
+            ).start()
+        else:
+            function(*args)
\ No newline at end of file
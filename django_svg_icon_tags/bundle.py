@@ -0,0 +1,158 @@
+"""
+Packed Icon Bundles
+===================
+
+A bundle is a single file holding every sanitized icon, produced by
+``manage.py build_svg_icons``. It is memory-mapped read-only, so all
+worker processes share the same pages through the OS page cache instead
+of each keeping its own copy of every icon.
+
+File layout::
+
+    b"SVGICON1"                magic
+    uint32 (little endian)     length of the JSON index
+    JSON index                 {"icons": {"<library>/<name>": [offset, length, prefix, attrs]}}
+    payloads                   concatenated UTF-8 icon bodies
+
+Each payload is the icon body after the root ``<svg>`` start tag; the
+root attributes are stored pre-parsed in the index so loading an icon
+needs no parsing at all.
+
+Settings:
+    SVG_ICON_BUNDLE: Path of the bundle to serve icons from (optional)
+"""
+import json
+import logging
+import mmap
+import os
+import struct
+import tempfile
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+from django_svg_icon_tags.compiled import CompiledSvg
+
+logger = logging.getLogger(__name__)
+
+BUNDLE_MAGIC = b'SVGICON1'
+_HEADER = struct.Struct('<I')
+
+_UNSET = object()
+_bundle = _UNSET
+
+
+def _bundle_key(name: str, library: Optional[str]) -> str:
+    return f"{library or ''}/{name}"
+
+
+class IconBundle:
+    """Read-only, memory-mapped view of a packed icon bundle."""
+
+    def __init__(self, path: str):
+        self.path = str(path)
+        with open(self.path, 'rb') as bundle_file:
+            self.mtime = os.fstat(bundle_file.fileno()).st_mtime
+            self._mmap = mmap.mmap(bundle_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        header_size = len(BUNDLE_MAGIC) + _HEADER.size
+        if self._mmap[:len(BUNDLE_MAGIC)] != BUNDLE_MAGIC:
+            self._mmap.close()
+            raise ValueError(f"Not an SVG icon bundle: {self.path}")
+
+        (index_size,) = _HEADER.unpack_from(self._mmap, len(BUNDLE_MAGIC))
+        index_end = header_size + index_size
+        index = json.loads(self._mmap[header_size:index_end].decode('utf-8'))
+        self._icons: Dict[str, list] = index['icons']
+        self._payload_start = index_end
+        self._view = memoryview(self._mmap)
+
+    def __len__(self) -> int:
+        return len(self._icons)
+
+    def __contains__(self, key: Tuple[Optional[str], str]) -> bool:
+        library, name = key
+        return _bundle_key(name, library) in self._icons
+
+    def keys(self) -> Iterator[Tuple[Optional[str], str]]:
+        """Iterate over ``(library, name)`` pairs in the bundle."""
+        for key in self._icons:
+            library, _, name = key.partition('/')
+            yield library or None, name
+
+    def get(self, name: str, library: Optional[str] = None) -> Optional[CompiledSvg]:
+        """Return the compiled icon, decoded straight from the mapped file."""
+        record = self._icons.get(_bundle_key(name, library))
+        if record is None:
+            return None
+        offset, length, prefix, attrs = record
+        start = self._payload_start + offset
+        body = str(self._view[start:start + length], 'utf-8')
+        return CompiledSvg(prefix, attrs, body)
+
+    def close(self) -> None:
+        self._view.release()
+        self._mmap.close()
+
+
+def write_bundle(path: str, icons: Iterable[Tuple[Optional[str], str, CompiledSvg]]) -> Tuple[int, int]:
+    """
+    Write compiled icons to a bundle file atomically.
+
+    Args:
+        path: Destination file
+        icons: ``(library, name, compiled)`` triples
+
+    Returns:
+        tuple: Number of icons and total payload size in bytes
+    """
+    index: Dict[str, list] = {}
+    payloads = []
+    offset = 0
+    for library, name, compiled in icons:
+        body = compiled.body.encode('utf-8')
+        index[_bundle_key(name, library)] = [offset, len(body), compiled.prefix, compiled.attrs]
+        payloads.append(body)
+        offset += len(body)
+
+    index_bytes = json.dumps({'icons': index}, separators=(',', ':')).encode('utf-8')
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as bundle_file:
+            bundle_file.write(BUNDLE_MAGIC)
+            bundle_file.write(_HEADER.pack(len(index_bytes)))
+            bundle_file.write(index_bytes)
+            bundle_file.writelines(payloads)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+    return len(index), offset
+
+
+def get_icon_bundle() -> Optional[IconBundle]:
+    """Return the bundle configured by SVG_ICON_BUNDLE, opened once per process."""
+    global _bundle
+    if _bundle is _UNSET:
+        path = getattr(settings, 'SVG_ICON_BUNDLE', None)
+        bundle = None
+        if path:
+            try:
+                bundle = IconBundle(path)
+            except (OSError, ValueError) as e:
+                logger.error(f"Failed to open SVG icon bundle {path}: {e}")
+        _bundle = bundle
+    return _bundle
+
+
+@receiver(setting_changed)
+def _reset_bundle(*, setting, **kwargs):
+    global _bundle
+    if setting == 'SVG_ICON_BUNDLE':
+        _bundle = _UNSET
\ No newline at end of file
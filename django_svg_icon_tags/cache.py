@@ -0,0 +1,130 @@
+"""
+Process-Local Caches
+====================
+
+Small thread-safe LRU cache used for compiled icons and memoized
+rendered markup.
+"""
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, NamedTuple, Optional
+
+_MISSING = object()
+
+
+class CacheInfo(NamedTuple):
+    """Cache statistics, mirroring ``functools.lru_cache().cache_info()``."""
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+    evictions: int = 0
+    bytes: int = 0
+    max_bytes: Optional[int] = None
+    pinned: int = 0
+
+
+def encoded_size(value: Any) -> int:
+    """Return the size of a value in bytes, counting text as UTF-8."""
+    if isinstance(value, str):
+        return len(value.encode('utf-8'))
+    return len(value)
+
+
+class LRUCache:
+    """Bounded least-recently-used mapping with hit/miss counters.
+
+    The cache is bounded by entry count (``maxsize``) and optionally by the
+    total ``sizeof()`` of its values (``max_bytes``). Pinned entries are
+    never evicted and do not count towards either bound's eviction order.
+    A ``maxsize`` of 0 disables storage of unpinned entries.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 128,
+        max_bytes: Optional[int] = None,
+        sizeof: Callable[[Any], int] = encoded_size,
+    ):
+        self.maxsize = max(int(maxsize), 0)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes = 0
+        self._sizeof = sizeof
+        self._data: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        self._pinned: Dict[Hashable, Any] = {}
+        self._sizes: Dict[Hashable, int] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data) + len(self._pinned)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data or key in self._pinned
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Return the cached value for ``key`` and mark it recently used."""
+        with self._lock:
+            value = self._pinned.get(key, _MISSING)
+            if value is _MISSING:
+                value = self._data.get(key, _MISSING)
+                if value is _MISSING:
+                    self.misses += 1
+                    return default
+                self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, pin: bool = False) -> None:
+        """Store ``value``, evicting least recently used entries if over a bound."""
+        if not self.maxsize and not pin:
+            return
+        size = self._sizeof(value)
+        with self._lock:
+            self._discard(key)
+            if pin:
+                self._pinned[key] = value
+            else:
+                self._data[key] = value
+            self._sizes[key] = size
+            self.bytes += size
+            self._evict()
+
+    def _discard(self, key: Hashable) -> None:
+        if self._data.pop(key, _MISSING) is _MISSING and self._pinned.pop(key, _MISSING) is _MISSING:
+            return
+        self.bytes -= self._sizes.pop(key)
+
+    def _evict(self) -> None:
+        while self._data and (
+            len(self._data) > self.maxsize
+            or (self.max_bytes is not None and self.bytes > self.max_bytes)
+        ):
+            key, _ = self._data.popitem(last=False)
+            self.bytes -= self._sizes.pop(key)
+            self.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        """Remove ``key`` if present, pinned or not."""
+        with self._lock:
+            self._discard(key)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._data.clear()
+            self._pinned.clear()
+            self._sizes.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.bytes = 0
+
+    def info(self) -> CacheInfo:
+        """Return hit/miss/eviction counters and current size."""
+        return CacheInfo(
+            self.hits, self.misses, self.maxsize, len(self),
+            self.evictions, self.bytes, self.max_bytes, len(self._pinned),
+        )
\ No newline at end of file
@@ -0,0 +1,104 @@
+"""
+Compiled SVG Icons
+==================
+
+Sanitized icons are split once, at load time, into the text before the
+root ``<svg>`` tag, the root attribute map and the inner body. Rendering
+with custom attributes then becomes a single join: the source is never
+re-scanned and an injected ``width``/``fill``/``class`` replaces the
+icon's own value instead of producing a duplicate attribute.
+"""
+import re
+from typing import Dict, NamedTuple, Optional
+
+_ROOT_TAG_PATTERN = re.compile(r'<svg(?=[\s/>])')
+_ROOT_END_PATTERN = re.compile(r'\s*(/?)>')
+_SYMBOL_ATTRS = ('viewBox', 'preserveAspectRatio')
+_ROOT_ATTR_PATTERN = re.compile(
+    r'''\s+([^\s"'=<>/]+)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'=<>`]+)))?'''
+)
+
+
+class CompiledSvg(NamedTuple):
+    """Pre-split SVG icon.
+
+    Attributes:
+        prefix: Markup preceding the root ``<svg`` tag (usually empty)
+        attrs: Root attribute values, already HTML-safe, in source order
+        body: Everything after the root start tag, including ``</svg>``
+    """
+    prefix: str
+    attrs: Dict[str, str]
+    body: str
+
+    def render(self, attrs: Optional[Dict[str, str]] = None, inner: str = '') -> str:
+        """Join the icon with overriding root attributes and inner markup.
+
+        ``attrs`` values must already be escaped. Overrides are emitted
+        first, followed by the icon's own attributes they do not replace.
+        """
+        if attrs:
+            merged = dict(attrs)
+            for key, value in self.attrs.items():
+                merged.setdefault(key, value)
+        else:
+            merged = self.attrs
+        attr_str = ''.join(f' {key}="{value}"' for key, value in merged.items())
+        return f'{self.prefix}<svg{attr_str}>{inner}{self.body}'
+
+    def render_use(self, href: str, attrs: Optional[Dict[str, str]] = None, inner: str = '') -> str:
+        """Render the root tag around a ``<use>`` reference to ``#href``."""
+        return self._replace(prefix='', body=f'<use href="#{href}"></use></svg>').render(attrs, inner)
+
+    def render_symbol(self, symbol_id: str) -> str:
+        """Render the icon body as a ``<symbol>`` for an SVG sprite.
+
+        Only geometry attributes move to the symbol; presentation
+        attributes stay on the referencing ``<svg>`` so overrides inherit.
+        """
+        attr_str = ''.join(
+            f' {key}="{self.attrs[key]}"' for key in _SYMBOL_ATTRS if key in self.attrs
+        )
+        inner = self.body.rstrip()
+        if inner.endswith('</svg>'):
+            inner = inner[:-len('</svg>')]
+        return f'<symbol id="{symbol_id}"{attr_str}>{inner}</symbol>'
+
+    @property
+    def size(self) -> int:
+        """Length of the default rendering, in UTF-8 bytes."""
+        return len(self.render().encode('utf-8'))
+
+
+def compile_svg(content: str) -> Optional[CompiledSvg]:
+    """Split sanitized SVG markup into a :class:`CompiledSvg`.
+
+    Returns None when no well-formed root ``<svg>`` start tag is found.
+    """
+    start = _ROOT_TAG_PATTERN.search(content)
+    if not start:
+        return None
+
+    attrs: Dict[str, str] = {}
+    pos = start.end()
+    while True:
+        end = _ROOT_END_PATTERN.match(content, pos)
+        if end:
+            break
+        match = _ROOT_ATTR_PATTERN.match(content, pos)
+        if not match:
+            return None
+        name, double_quoted, single_quoted, unquoted = match.groups()
+        if double_quoted is not None:
+            value = double_quoted
+        elif single_quoted is not None:
+            value = single_quoted.replace('"', '&quot;')
+        else:
+            value = unquoted or ''
+        attrs.setdefault(name, value)
+        pos = match.end()
+
+    body = content[end.end():]
+    if end.group(1):
+        body = '</svg>' + body
+    return CompiledSvg(content[:start.start()], attrs, body)
\ No newline at end of file
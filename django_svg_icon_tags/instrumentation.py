@@ -0,0 +1,105 @@
+"""
+Icon Render Instrumentation
+===========================
+
+Per-request counters and timings for icon rendering.
+
+Collection is scoped with :func:`collect_icon_stats`, which binds a fresh
+:class:`IconStats` to the current context (thread or asyncio task). While
+nothing is collecting, the render path only pays for one ``ContextVar``
+lookup per icon.
+
+Collections nest: the middleware and the Debug Toolbar panel can both
+be enabled, and each reports every icon rendered inside its own scope.
+
+When a collection ends, :data:`icon_stats_collected` is sent with the
+``stats`` and the ``request`` (if any). The middleware in
+:mod:`django_svg_icon_tags.middleware` collects per request and reports a
+``Server-Timing`` header, and the panel in :mod:`django_svg_icon_tags.panels`
+shows the same numbers in the Django Debug Toolbar.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional
+
+from django.dispatch import Signal
+
+# Sent with ``stats`` and ``request`` when collect_icon_stats() exits.
+icon_stats_collected = Signal()
+
+_current_stats: ContextVar[Optional['IconStats']] = ContextVar('svg_icon_stats', default=None)
+
+
+class IconStats:
+    """Counters for the icons rendered while collecting.
+
+    Attributes:
+        icons: Icons rendered, including fallbacks
+        inline: Icons rendered as inline ``<svg>``
+        img: Icons rendered as ``<img>`` tags
+        sprite: Icons rendered as sprite ``<use>`` references
+        fallbacks: Icons that could not be found or loaded
+        folded: Icons served from markup folded into a compiled template
+        render_hits: Icons served from the rendered-output cache
+        bundle_hits: Icons loaded from the prebuilt bundle
+        local_hits: Icons loaded from the process-local cache
+        shared_hits: Icons loaded from the Django cache
+        disk_loads: Icons read, sanitized and compiled from disk
+        bytes: UTF-8 bytes of markup emitted
+        duration: Seconds spent rendering icons
+    """
+
+    __slots__ = (
+        'icons', 'inline', 'img', 'sprite', 'fallbacks', 'folded', 'render_hits',
+        'bundle_hits', 'local_hits', 'shared_hits', 'disk_loads', 'bytes', 'duration',
+    )
+
+    def __init__(self):
+        for field in self.__slots__:
+            setattr(self, field, 0)
+        self.duration = 0.0
+
+    def merge(self, other: 'IconStats') -> None:
+        """Add the counters of ``other`` to these."""
+        for field in self.__slots__:
+            setattr(self, field, getattr(self, field) + getattr(other, field))
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the counters as a plain dictionary."""
+        return {field: getattr(self, field) for field in self.__slots__}
+
+    def __repr__(self) -> str:
+        counters = ', '.join(f'{field}={getattr(self, field)!r}' for field in self.__slots__)
+        return f'IconStats({counters})'
+
+
+def current_icon_stats() -> Optional[IconStats]:
+    """Return the stats being collected in this context, if any."""
+    return _current_stats.get()
+
+
+@contextmanager
+def collect_icon_stats(request: Any = None) -> Iterator[IconStats]:
+    """
+    Collect icon render stats for the enclosed block.
+
+    Collections nest: when an inner block ends, its counts are added to
+    the enclosing collection, so both report the icons rendered inside
+    the inner block.
+
+    Args:
+        request: Request passed on to :data:`icon_stats_collected`
+
+    Yields:
+        IconStats: The counters, updated as icons render
+    """
+    stats = IconStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+        outer = _current_stats.get()
+        if outer is not None:
+            outer.merge(stats)
+        icon_stats_collected.send(sender=IconStats, stats=stats, request=request)
\ No newline at end of file
@@ -0,0 +1,136 @@
+"""
+Jinja2 Extension
+================
+
+Renders icons in Jinja2 templates with the same loader, caches and
+renderer as the Django template tags::
+
+    TEMPLATES = [{
+        'BACKEND': 'django.template.backends.jinja2.Jinja2',
+        'OPTIONS': {'extensions': ['django_svg_icon_tags.jinja.SvgIconExtension']},
+    }]
+
+    {% svg_icon "bootstrap:house", class_name="w-4" %}
+    {{ svg_icon(name, library="heroicons-outline") }}
+    {{ icon("star", size="lg") }}
+    {{ "bootstrap:gear"|svg_icon_simple }}
+
+When every argument of the ``{% svg_icon %}`` tag is a literal, the icon
+is rendered while the template is compiled and the markup is stored in
+the compiled template. It is served from there until icon settings or
+caches change in this process, or the icon's registry entry changes,
+after which the tag renders normally.
+As with ``{% svg_icon %}`` in Django templates, nothing is folded when
+icons are re-stat()ed per render or the registry is disabled.
+
+Sprite icons are never folded; emit their symbols with
+``{{ render_sprite([...]) }}``.
+"""
+import uuid
+from inspect import signature
+from typing import Any, List, Optional, Tuple
+
+from django.utils.safestring import mark_safe
+from jinja2 import nodes
+from jinja2.exceptions import TemplateSyntaxError
+from jinja2.ext import Extension
+
+from django_svg_icon_tags.registry import IconEntry, get_invalidation_mode, get_registry_mode
+from django_svg_icon_tags.templatetags import svg_icon_tags
+
+# Folded markup is tied to the process that rendered it, so templates
+# loaded from a persistent bytecode cache render normally instead.
+_PROCESS_TOKEN = uuid.uuid4().hex
+_SVG_ICON_SIGNATURE = signature(svg_icon_tags.svg_icon)
+
+
+def _fold_key() -> str:
+    return f"{_PROCESS_TOKEN}:{svg_icon_tags._render_generation}"
+
+
+def _entry_stamp(entry: Optional[IconEntry]) -> Optional[Tuple[str, float]]:
+    """Return an icon entry as a plain tuple that can be stored in compiled templates."""
+    return tuple(entry) if entry is not None else None
+
+
+class SvgIconExtension(Extension):
+    """Adds the ``{% svg_icon %}`` tag and the icon globals and filters."""
+
+    tags = {'svg_icon'}
+
+    def __init__(self, environment):
+        super().__init__(environment)
+        environment.globals.update(
+            svg_icon=svg_icon_tags.svg_icon,
+            icon=svg_icon_tags.icon,
+            render_icons=svg_icon_tags.render_icons,
+            render_sprite=svg_icon_tags.render_sprite,
+            prefetch_icons=svg_icon_tags.prefetch_icons,
+        )
+        environment.filters['svg_icon_simple'] = svg_icon_tags.svg_icon_simple
+
+    def parse(self, parser):
+        lineno = next(parser.stream).lineno
+        args: List[nodes.Expr] = []
+        kwargs: List[nodes.Keyword] = []
+        while parser.stream.current.type != 'block_end':
+            if args or kwargs:
+                parser.stream.expect('comma')
+            if parser.stream.current.type == 'name' and parser.stream.look().type == 'assign':
+                key = next(parser.stream).value
+                parser.stream.skip()
+                kwargs.append(nodes.Keyword(key, parser.parse_expression(), lineno=lineno))
+            else:
+                args.append(parser.parse_expression())
+
+        folded = self._fold(args, kwargs, lineno, parser)
+        if folded is None:
+            call = self.call_method('_render', args, kwargs, lineno=lineno)
+        else:
+            fold_key, source, markup = folded
+            call = self.call_method(
+                '_render_folded', [nodes.Const(fold_key), nodes.Const(source), nodes.Const(markup)] + args,
+                kwargs, lineno=lineno,
+            )
+        return nodes.Output([call], lineno=lineno)
+
+    def _fold(
+        self,
+        args: List[nodes.Expr],
+        kwargs: List[nodes.Keyword],
+        lineno: int,
+        parser,
+    ) -> Optional[Tuple[str, tuple, str]]:
+        """Render an all-literal tag now, returning ``(fold key, source, markup)``."""
+        if not all(isinstance(arg, nodes.Const) for arg in args):
+            return None
+        if not all(isinstance(kwarg.value, nodes.Const) for kwarg in kwargs):
+            return None
+
+        values = [arg.value for arg in args]
+        options = {kwarg.key: kwarg.value.value for kwarg in kwargs}
+        try:
+            bound = _SVG_ICON_SIGNATURE.bind(*values, **options)
+        except TypeError as e:
+            raise TemplateSyntaxError(f"svg_icon: {e}", lineno, parser.name, parser.filename)
+
+        if options.get('sprite') or not get_registry_mode() or get_invalidation_mode() == 'stat':
+            return None
+        name = bound.arguments['name']
+        if not isinstance(name, str):
+            return None
+        name, library = svg_icon_tags._split_library(name, bound.arguments.get('library'))
+        if not svg_icon_tags._is_valid_icon(name, library):
+            return None
+        fold_key = _fold_key()
+        source = (name, library, _entry_stamp(svg_icon_tags._resolve_valid_icon(name, library)))
+        return fold_key, source, str(svg_icon_tags.svg_icon(*values, **options))
+
+    def _render(self, *args: Any, **kwargs: Any) -> str:
+        return svg_icon_tags.svg_icon(*args, **kwargs)
+
+    def _render_folded(self, fold_key: str, source: tuple, markup: str, *args: Any, **kwargs: Any) -> str:
+        name, library, stamp = source
+        if fold_key == _fold_key() and stamp == _entry_stamp(svg_icon_tags._resolve_valid_icon(name, library)):
+            return mark_safe(markup)
+        return svg_icon_tags.svg_icon(*args, **kwargs)
\ No newline at end of file
@@ -0,0 +1,134 @@
+"""
+Build a packed, memory-mappable bundle of every sanitized SVG icon.
+
+Usage:
+    python manage.py build_svg_icons --output var/svg_icons.bundle
+    python manage.py build_svg_icons --library bootstrap --library heroicons-solid
+    python manage.py build_svg_icons --report
+    python manage.py build_svg_icons --url-manifest var/svg_icon_urls.json
+    python manage.py build_svg_icons --usage-manifest var/svg_icons_used.json
+
+Point ``SVG_ICON_BUNDLE`` at the output file to serve icons from it.
+Icons are optimized first when ``SVG_ICON_OPTIMIZE`` is enabled.
+Point ``SVG_ICON_URL_MANIFEST`` at the URL manifest to version ``<img>``
+icon URLs without hashing files at runtime. The manifest only holds
+hashes; no hashed copies are written to ``STATIC_ROOT``, so there is
+nothing to prune (see :mod:`django_svg_icon_tags.static_urls`).
+With a used-icon manifest from ``scan_svg_icons`` (``SVG_ICON_USAGE_MANIFEST``)
+only the icons it lists are included; others are still served from their
+files. Pass ``--all-icons`` to ignore the manifest.
+"""
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from django_svg_icon_tags.bundle import write_bundle
+from django_svg_icon_tags.registry import icon_registry
+from django_svg_icon_tags.static_urls import file_hash, write_url_manifest
+from django_svg_icon_tags.usage import load_usage_manifest
+from django_svg_icon_tags.templatetags.svg_icon_tags import _compile_svg_file, optimization_report
+
+
+class Command(BaseCommand):
+    help = "Sanitize all SVG icons and pack them into a single bundle file."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--output', '-o',
+            default=getattr(settings, 'SVG_ICON_BUNDLE', None),
+            help="Bundle file to write (defaults to SVG_ICON_BUNDLE).",
+        )
+        parser.add_argument(
+            '--library', '-l',
+            action='append',
+            dest='libraries',
+            help="Only include this library (repeatable).",
+        )
+        parser.add_argument(
+            '--report',
+            action='store_true',
+            help="Print the bytes SVG_ICON_OPTIMIZE saves per library.",
+        )
+        parser.add_argument(
+            '--url-manifest',
+            default=getattr(settings, 'SVG_ICON_URL_MANIFEST', None),
+            help="Content-hash manifest for <img> URLs to write (defaults to SVG_ICON_URL_MANIFEST).",
+        )
+        parser.add_argument(
+            '--usage-manifest',
+            default=getattr(settings, 'SVG_ICON_USAGE_MANIFEST', None),
+            help="Only include icons listed in this used-icon manifest (defaults to SVG_ICON_USAGE_MANIFEST).",
+        )
+        parser.add_argument(
+            '--all-icons',
+            action='store_true',
+            help="Include every icon even when a used-icon manifest is configured.",
+        )
+
+    def handle(self, *args, **options):
+        output = options['output']
+        url_manifest = options['url_manifest']
+        if not output and not url_manifest:
+            if options['report']:
+                self._write_report(set(options['libraries'] or ()))
+                return
+            raise CommandError("No output path given and SVG_ICON_BUNDLE is not set.")
+
+        libraries = set(options['libraries'] or ())
+        used = None
+        if options['usage_manifest'] and not options['all_icons']:
+            try:
+                used = load_usage_manifest(options['usage_manifest'])
+            except (OSError, ValueError, KeyError) as e:
+                raise CommandError(f"Cannot read usage manifest {options['usage_manifest']}: {e}")
+
+        icon_registry.build()
+        entries = [
+            (key, entry)
+            for key, entry in sorted(icon_registry.items(), key=lambda item: (item[0][0] or '', item[0][1]))
+            if (not libraries or key[0] in libraries) and (used is None or key in used)
+        ]
+
+        if output:
+            self._write_bundle(output, entries)
+        if url_manifest:
+            self._write_url_manifest(url_manifest, entries)
+        if options['report']:
+            self._write_report(libraries)
+
+    def _write_bundle(self, output, entries):
+        icons = []
+        skipped = 0
+        for (library, name), entry in entries:
+            compiled = _compile_svg_file(entry.path)
+            if compiled is None:
+                skipped += 1
+                self.stderr.write(f"Skipping invalid icon: {entry.path}")
+                continue
+            icons.append((library, name, compiled))
+
+        count, size = write_bundle(output, icons)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Wrote {count} icons ({size / 1024:.1f} KB) to {output}"
+            + (f", skipped {skipped} invalid" if skipped else "")
+        ))
+
+    def _write_url_manifest(self, path, entries):
+        hashes = []
+        for (library, name), entry in entries:
+            digest = file_hash(entry.path)
+            if digest is not None:
+                hashes.append((library, name, digest))
+        count = write_url_manifest(path, hashes)
+        self.stdout.write(self.style.SUCCESS(f"Wrote URL hashes for {count} icons to {path}"))
+
+    def _write_report(self, libraries):
+        report = optimization_report(libraries or None)
+        for library in sorted(report, key=lambda library: library or ''):
+            stats = report[library]
+            percent = stats.saved_bytes * 100 / stats.original_bytes if stats.original_bytes else 0
+            self.stdout.write(
+                f"{library or 'default'}: {stats.icons} icons, "
+                f"{stats.original_bytes} -> {stats.optimized_bytes} bytes "
+                f"(saved {stats.saved_bytes}, {percent:.1f}%)"
+            )
\ No newline at end of file
@@ -0,0 +1,156 @@
+"""
+Validate every SVG icon and profile what each one costs to load.
+
+Usage:
+    python manage.py check_svg_icons
+    python manage.py check_svg_icons --library my-icons --workers 8
+    python manage.py check_svg_icons --sort time --top 50
+    python manage.py check_svg_icons --max-bytes 4096 --json var/svg_icon_check.json
+
+Every file goes through the same structure check, sanitizer and compiler
+as the render path, across a process pool. The report lists invalid
+icons, what the sanitizer stripped, and the heaviest icons by sanitized
+size (or raw size, parse/sanitize time, or stripped constructs), flagging
+those above ``--max-bytes``. The command fails if any icon is invalid.
+"""
+import json
+import os
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from django_svg_icon_tags.registry import icon_registry
+from django_svg_icon_tags.validation import check_icons
+
+SORT_KEYS = {
+    'size': lambda check: check.sanitized_bytes,
+    'raw': lambda check: check.raw_bytes,
+    'time': lambda check: check.parse_ms + check.sanitize_ms,
+    'stripped': lambda check: len(check.removed),
+}
+
+
+class Command(BaseCommand):
+    help = "Validate all SVG icons and report their size and load cost."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--library', '-l',
+            action='append',
+            dest='libraries',
+            help="Only check this library (repeatable).",
+        )
+        parser.add_argument(
+            '--workers', '-j',
+            type=int,
+            default=None,
+            help="Worker processes (defaults to the CPU count; 1 disables the pool).",
+        )
+        parser.add_argument(
+            '--sort',
+            choices=sorted(SORT_KEYS),
+            default='size',
+            help="Rank icons by sanitized size (default), raw size, time or stripped constructs.",
+        )
+        parser.add_argument(
+            '--top',
+            type=int,
+            default=20,
+            help="Icons to list in the ranking (0 lists all).",
+        )
+        parser.add_argument(
+            '--max-bytes',
+            type=int,
+            default=8192,
+            help="Flag icons whose sanitized markup is larger than this.",
+        )
+        parser.add_argument(
+            '--json',
+            dest='json_path',
+            help="Also write the full per-icon report to this JSON file.",
+        )
+
+    def handle(self, *args, **options):
+        libraries = set(options['libraries'] or ())
+        icon_registry.build()
+        icons = [
+            (library, name, entry.path)
+            for (library, name), entry in sorted(icon_registry.items(), key=lambda item: (item[0][0] or '', item[0][1]))
+            if not libraries or library in libraries
+        ]
+        if not icons:
+            raise CommandError("No icons found.")
+
+        workers = options['workers'] or os.cpu_count() or 1
+        start = time.perf_counter()
+        checks = check_icons(icons, workers)
+        elapsed = time.perf_counter() - start
+
+        invalid = [check for check in checks if not check.valid]
+        stripped = [check for check in checks if check.valid and check.removed]
+        heavy = [check for check in checks if check.sanitized_bytes > options['max_bytes']]
+
+        for check in invalid:
+            self.stderr.write(f"Invalid icon {check.spec}: {check.error} ({check.path})")
+        if stripped and options['verbosity'] >= 1:
+            self.stdout.write("Stripped by the sanitizer:")
+            for check in stripped if options['verbosity'] >= 2 else stripped[:options['top'] or None]:
+                self.stdout.write(f"  {check.spec}: {', '.join(check.removed)}")
+
+        self._write_ranking(checks, options)
+
+        if options['json_path']:
+            self._write_json(options['json_path'], checks, options['max_bytes'])
+
+        workers = min(workers, len(checks))
+        summary = (
+            f"Checked {len(checks)} icons in {elapsed:.2f}s with {workers} worker{'s' if workers != 1 else ''}: "
+            f"{len(checks) - len(invalid)} valid, {len(invalid)} invalid, "
+            f"{len(stripped)} sanitized, {len(heavy)} over {options['max_bytes']} bytes"
+        )
+        if invalid:
+            raise CommandError(summary)
+        self.stdout.write(self.style.WARNING(summary) if stripped or heavy else self.style.SUCCESS(summary))
+
+    def _write_ranking(self, checks, options):
+        ranked = sorted(
+            (check for check in checks if check.valid),
+            key=SORT_KEYS[options['sort']],
+            reverse=True,
+        )
+        if options['top']:
+            ranked = ranked[:options['top']]
+        if not ranked or options['verbosity'] < 1:
+            return
+
+        self.stdout.write(f"Heaviest icons by {options['sort']}:")
+        self.stdout.write(f"{'bytes':>8} {'raw':>8} {'parse ms':>9} {'sanitize ms':>12}  icon")
+        for check in ranked:
+            flag = self.style.WARNING('  heavy') if check.sanitized_bytes > options['max_bytes'] else ''
+            self.stdout.write(
+                f"{check.sanitized_bytes:>8} {check.raw_bytes:>8} {check.parse_ms:>9.3f} "
+                f"{check.sanitize_ms:>12.3f}  {check.spec}{flag}"
+            )
+
+    def _write_json(self, path, checks, max_bytes):
+        report = [
+            {
+                'icon': check.spec,
+                'path': check.path,
+                'valid': check.valid,
+                'error': check.error,
+                'removed': list(check.removed),
+                'raw_bytes': check.raw_bytes,
+                'sanitized_bytes': check.sanitized_bytes,
+                'parse_ms': round(check.parse_ms, 4),
+                'sanitize_ms': round(check.sanitize_ms, 4),
+                'heavy': check.sanitized_bytes > max_bytes,
+            }
+            for check in checks
+        ]
+        try:
+            with open(path, 'w', encoding='utf-8') as report_file:
+                json.dump({'icons': report}, report_file, indent=2)
+        except OSError as e:
+            raise CommandError(f"Cannot write report {path}: {e}")
+        self.stdout.write(f"Wrote the report for {len(report)} icons to {path}")
\ No newline at end of file
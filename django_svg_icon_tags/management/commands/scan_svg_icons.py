@@ -0,0 +1,83 @@
+"""
+Scan templates for the SVG icons a project uses and write a used-icon manifest.
+
+Usage:
+    python manage.py scan_svg_icons --output var/svg_icons_used.json
+    python manage.py scan_svg_icons extra/templates --usage-log var/svg_icons.log
+    python manage.py scan_svg_icons --verbosity 2
+
+Literal ``{% svg_icon %}``, ``{% icon %}`` and ``|svg_icon_simple`` usages
+are found in every Django template directory (plus the given paths).
+Icons named by variables are reported as dynamic; record them at runtime
+with ``SVG_ICON_USAGE_LOG`` and pass the log with ``--usage-log``.
+
+Point ``SVG_ICON_USAGE_MANIFEST`` at the output to build bundles with
+only these icons (``build_svg_icons --usage-manifest``) and to preload
+them with ``SVG_ICON_PRELOAD_USED``.
+"""
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from django_svg_icon_tags.registry import icon_registry
+from django_svg_icon_tags.usage import IconUsage, find_template_files, usage_key, write_usage_manifest
+
+
+class Command(BaseCommand):
+    help = "Scan templates for used SVG icons and write a used-icon manifest."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'paths',
+            nargs='*',
+            help="Extra template directories to scan.",
+        )
+        parser.add_argument(
+            '--output', '-o',
+            default=getattr(settings, 'SVG_ICON_USAGE_MANIFEST', None),
+            help="Manifest file to write (defaults to SVG_ICON_USAGE_MANIFEST).",
+        )
+        parser.add_argument(
+            '--usage-log',
+            default=getattr(settings, 'SVG_ICON_USAGE_LOG', None),
+            help="Runtime usage log to merge (defaults to SVG_ICON_USAGE_LOG).",
+        )
+
+    def handle(self, *args, **options):
+        usage = IconUsage()
+        templates = find_template_files(options['paths'])
+        for path in templates:
+            try:
+                with open(path, encoding='utf-8') as template_file:
+                    usage.add_template(template_file.read(), path)
+            except (OSError, UnicodeDecodeError) as e:
+                self.stderr.write(f"Skipping unreadable template {path}: {e}")
+
+        log = options['usage_log']
+        if log:
+            try:
+                usage.add_log(log)
+            except OSError as e:
+                raise CommandError(f"Cannot read usage log {log}: {e}")
+
+        icon_registry.build()
+        missing = [key for key in usage.icons if key not in icon_registry]
+        for library, name in sorted(missing, key=lambda key: (key[0] or '', key[1])):
+            self.stderr.write(
+                f"Unknown icon {usage_key(name, library)} used at {', '.join(usage.icons[library, name])}"
+            )
+
+        if options['verbosity'] >= 2:
+            for location in usage.dynamic:
+                self.stdout.write(f"Dynamic icon name at {location}")
+
+        self.stdout.write(
+            f"Found {len(usage.icons)} icons in {len(templates)} templates"
+            + (f", {len(usage.dynamic)} dynamic usages" if usage.dynamic else "")
+            + (f", {len(missing)} unknown" if missing else "")
+        )
+
+        output = options['output']
+        if output:
+            used = [key for key in usage.icons if key in icon_registry]
+            count = write_usage_manifest(output, used, len(usage.dynamic))
+            self.stdout.write(self.style.SUCCESS(f"Wrote {count} used icons to {output}"))
\ No newline at end of file
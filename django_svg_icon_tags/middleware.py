@@ -0,0 +1,56 @@
+"""
+Icon Timing Middleware
+======================
+
+Reports the time spent rendering SVG icons in a ``Server-Timing``
+response header, where browser developer tools show it next to the
+request timings::
+
+    MIDDLEWARE = [
+        ...,
+        'django_svg_icon_tags.middleware.icon_timing_middleware',
+    ]
+
+Works under both WSGI and ASGI.
+"""
+from asyncio import iscoroutinefunction
+
+from django.utils.decorators import sync_and_async_middleware
+
+from django_svg_icon_tags.instrumentation import IconStats, collect_icon_stats
+
+SERVER_TIMING_METRIC = 'svg-icons'
+
+
+def server_timing(stats: IconStats) -> str:
+    """Format icon stats as a ``Server-Timing`` metric."""
+    return (
+        f'{SERVER_TIMING_METRIC};dur={stats.duration * 1000:.3f};'
+        f'desc="{stats.icons} icons, {stats.disk_loads} from disk, {stats.bytes} bytes"'
+    )
+
+
+def _add_server_timing(response, stats: IconStats) -> None:
+    if not stats.icons:
+        return
+    metric = server_timing(stats)
+    existing = response.get('Server-Timing')
+    response['Server-Timing'] = f'{existing}, {metric}' if existing else metric
+
+
+@sync_and_async_middleware
+def icon_timing_middleware(get_response):
+    """Collect icon stats for each request and add a Server-Timing header."""
+    if iscoroutinefunction(get_response):
+        async def middleware(request):
+            with collect_icon_stats(request) as stats:
+                response = await get_response(request)
+            _add_server_timing(response, stats)
+            return response
+    else:
+        def middleware(request):
+            with collect_icon_stats(request) as stats:
+                response = get_response(request)
+            _add_server_timing(response, stats)
+            return response
+    return middleware
\ No newline at end of file
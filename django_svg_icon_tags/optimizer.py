@@ -0,0 +1,156 @@
+"""
+SVG Optimizer
+=============
+
+Lossless-in-practice minification applied to sanitized icons before they
+are compiled and cached, enabled with ``SVG_ICON_OPTIMIZE = True``.
+
+Passes:
+    - Comment removal
+    - Whitespace collapse between tags and inside geometry attributes
+    - Numeric precision reduction in geometry attributes
+    - Removal of attributes equal to their (non-inherited) defaults
+
+Settings:
+    SVG_ICON_OPTIMIZE: Enable the optimization pass (default False)
+    SVG_ICON_OPTIMIZE_PRECISION: Decimal places kept in coordinates (default 3)
+"""
+import re
+from typing import NamedTuple
+
+from django.conf import settings
+
+DEFAULT_PRECISION = 3
+
+_COMMENT_PATTERN = re.compile(r'<!--.*?-->', re.DOTALL)
+_INTER_TAG_WHITESPACE_PATTERN = re.compile(r'>\s+<')
+_TEXT_ELEMENT_PATTERN = re.compile(r'<(?:text|tspan|textPath)[\s/>]')
+_TAG_PATTERN = re.compile(r'<([A-Za-z][\w:.\-]*)([^<>"]*(?:"[^"]*"[^<>"]*)*)>')
+_ATTR_PATTERN = re.compile(r'\s+([^\s"=/]+)="([^"]*)"')
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+_COMMA_PATTERN = re.compile(r' ?, ?')
+# Starts with a literal so already-minified path data is scanned quickly.
+_PATH_SPACE_PATTERN = re.compile(r' (?:(?=[A-DF-Za-df-z\-])|(?<=[A-DF-Za-df-z] ))')
+
+_NUMERIC_ATTRIBUTES = frozenset({
+    'd', 'points', 'transform', 'x', 'y', 'x1', 'y1', 'x2', 'y2',
+    'cx', 'cy', 'r', 'rx', 'ry', 'width', 'height', 'stroke-width',
+})
+
+# Only attributes that are not inherited can be dropped: removing an
+# inherited one would let the parent's value through.
+_DEFAULT_ATTRIBUTES = {
+    (None, 'opacity'): '1',
+    (None, 'version'): '1.1',
+    ('rect', 'x'): '0', ('rect', 'y'): '0',
+    ('use', 'x'): '0', ('use', 'y'): '0',
+    ('image', 'x'): '0', ('image', 'y'): '0',
+    ('circle', 'cx'): '0', ('circle', 'cy'): '0',
+    ('ellipse', 'cx'): '0', ('ellipse', 'cy'): '0',
+    ('line', 'x1'): '0', ('line', 'y1'): '0', ('line', 'x2'): '0', ('line', 'y2'): '0',
+}
+_EMPTY_DROPPABLE = frozenset({'id', 'class', 'style'})
+
+
+class OptimizationStats(NamedTuple):
+    """Bytes before and after optimization for a group of icons."""
+    icons: int = 0
+    original_bytes: int = 0
+    optimized_bytes: int = 0
+
+    @property
+    def saved_bytes(self) -> int:
+        return self.original_bytes - self.optimized_bytes
+
+    def add(self, original: str, optimized: str) -> 'OptimizationStats':
+        return OptimizationStats(
+            self.icons + 1,
+            self.original_bytes + len(original.encode('utf-8')),
+            self.optimized_bytes + len(optimized.encode('utf-8')),
+        )
+
+
+def is_optimization_enabled() -> bool:
+    return bool(getattr(settings, 'SVG_ICON_OPTIMIZE', False))
+
+
+def get_precision() -> int:
+    return int(getattr(settings, 'SVG_ICON_OPTIMIZE_PRECISION', DEFAULT_PRECISION))
+
+
+def _number_pattern(precision: int) -> 're.Pattern[str]':
+    """Match only decimals that can be shortened: a leading zero, a trailing
+    zero or more than ``precision`` places. Numbers glued to a previous one
+    (``1.5.5``) are left alone so their boundaries never move."""
+    return re.compile(
+        r'(?<![\d.])(?:0\.\d+|\d*\.\d{%d}\d+|\d*\.\d*0(?!\d))' % precision
+    )
+
+
+_NUMBER_PATTERNS = {DEFAULT_PRECISION: _number_pattern(DEFAULT_PRECISION)}
+
+
+def _round_numbers(value: str, precision: int) -> str:
+    """Round decimals to ``precision`` places and drop redundant zeros."""
+    def shorten(match: 're.Match[str]') -> str:
+        digits = match.group()
+        if len(digits) - digits.index('.') - 1 > precision:
+            digits = f"{round(float(digits), precision):.{precision}f}"
+        digits = digits.rstrip('0').rstrip('.')
+        if digits.startswith('0.'):
+            digits = digits[1:]
+        if not digits:
+            digits = '0'
+        # "1.9999.5" must not become "2.5".
+        if '.' not in digits and match.string.startswith('.', match.end()):
+            digits += ' '
+        return digits
+
+    pattern = _NUMBER_PATTERNS.get(precision)
+    if pattern is None:
+        pattern = _NUMBER_PATTERNS[precision] = _number_pattern(precision)
+    return pattern.sub(shorten, value)
+
+
+def _optimize_tag(match: 're.Match[str]', precision: int, keep_xlink: bool) -> str:
+    element, attrs = match.groups()
+    self_closing = attrs.rstrip().endswith('/')
+    parts = []
+    for name, value in _ATTR_PATTERN.findall(attrs):
+        if name in _NUMERIC_ATTRIBUTES:
+            if '  ' in value or '\n' in value or '\t' in value:
+                value = _WHITESPACE_PATTERN.sub(' ', value)
+            if ' ,' in value or ', ' in value:
+                value = _COMMA_PATTERN.sub(',', value)
+            value = value.strip()
+            value = _round_numbers(value, precision)
+            if name == 'd':
+                value = _PATH_SPACE_PATTERN.sub('', value)
+        if not value and name in _EMPTY_DROPPABLE:
+            continue
+        if name == 'xmlns:xlink' and not keep_xlink:
+            continue
+        default = _DEFAULT_ATTRIBUTES.get((element, name), _DEFAULT_ATTRIBUTES.get((None, name)))
+        if default is not None and value == default:
+            continue
+        parts.append(f' {name}="{value}"')
+    return f"<{element}{''.join(parts)}{'/' if self_closing else ''}>"
+
+
+def optimize_svg(content: str, precision: int = DEFAULT_PRECISION) -> str:
+    """
+    Minify sanitized SVG markup.
+
+    Args:
+        content: Sanitized SVG markup (attribute values double-quoted)
+        precision: Decimal places kept in geometry attributes
+
+    Returns:
+        str: Optimized markup
+    """
+    content = _COMMENT_PATTERN.sub('', content)
+    if not _TEXT_ELEMENT_PATTERN.search(content):
+        content = _INTER_TAG_WHITESPACE_PATTERN.sub('><', content)
+    keep_xlink = 'xlink:' in content.replace('xmlns:xlink', '')
+    content = _TAG_PATTERN.sub(lambda match: _optimize_tag(match, precision, keep_xlink), content)
+    return content.strip()
\ No newline at end of file
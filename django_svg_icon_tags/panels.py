@@ -0,0 +1,65 @@
+"""
+Debug Toolbar Panel
+===================
+
+Django Debug Toolbar panel listing how many icons a request rendered,
+how they were rendered, which cache tier served them and how long it
+took. Requires ``django-debug-toolbar``::
+
+    DEBUG_TOOLBAR_PANELS = [
+        ...,
+        'django_svg_icon_tags.panels.SvgIconPanel',
+    ]
+"""
+from typing import Optional
+
+from debug_toolbar.panels import Panel
+from django.utils.translation import gettext_lazy as _
+
+from django_svg_icon_tags.instrumentation import IconStats, collect_icon_stats
+
+
+class SvgIconPanel(Panel):
+    """Per-request SVG icon render counters."""
+
+    title = _('SVG Icons')
+    template = 'svg_icon_tags/debug_toolbar_panel.html'
+
+    _stats: Optional[IconStats] = None
+
+    @property
+    def nav_subtitle(self) -> str:
+        stats = self.get_stats().get('stats')
+        if not stats:
+            return ''
+        return _('%(icons)d icons in %(duration).1f ms') % {
+            'icons': stats['icons'],
+            'duration': stats['duration'] * 1000,
+        }
+
+    def process_request(self, request):
+        with collect_icon_stats(request) as stats:
+            response = super().process_request(request)
+        self._stats = stats
+        return response
+
+    def generate_stats(self, request, response):
+        stats = (self._stats or IconStats()).as_dict()
+        self.record_stats({
+            'stats': stats,
+            'duration_ms': stats['duration'] * 1000,
+            'rendering': [
+                (_('Inline <svg>'), stats['inline']),
+                (_('<img> tags'), stats['img']),
+                (_('Sprite <use>'), stats['sprite']),
+                (_('Fallbacks'), stats['fallbacks']),
+            ],
+            'sources': [
+                (_('Folded into template'), stats['folded']),
+                (_('Rendered-output cache'), stats['render_hits']),
+                (_('Icon bundle'), stats['bundle_hits']),
+                (_('Process-local cache'), stats['local_hits']),
+                (_('Django cache'), stats['shared_hits']),
+                (_('Disk'), stats['disk_loads']),
+            ],
+        })
\ No newline at end of file
@@ -0,0 +1,340 @@
+"""
+Icon Registry
+=============
+
+In-memory index of every SVG icon reachable through the staticfiles
+finders, keyed by ``(library, name)``.
+
+The index is built once (at ``AppConfig.ready()`` or on first lookup) so
+resolving an icon on the render path is a dictionary lookup instead of a
+finder scan followed by ``exists()``/``stat()`` calls.
+
+Settings:
+    SVG_ICON_REGISTRY: ``"eager"`` (default) builds the index at startup,
+        ``"lazy"`` builds it on the first lookup and ``None`` disables the
+        registry so every render goes through the staticfiles finders.
+    SVG_ICON_INVALIDATION: How edits to indexed icons are noticed:
+        ``"stat"`` (default) re-stats the file on every render, like
+        lookups without the registry do, so the default still costs one
+        ``stat()`` per rendered icon; ``"none"`` treats icons as
+        immutable and never touches the disk after startup, and
+        ``"watch"`` polls the icon files from a background thread that
+        is started in server processes only, see
+        :mod:`django_svg_icon_tags.watcher`. Choose ``"none"`` or
+        ``"watch"`` to take ``stat()`` off the render path; only then are
+        all-literal ``{% svg_icon %}`` tags folded into templates.
+"""
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.core.signals import setting_changed
+from django.dispatch import Signal, receiver
+
+logger = logging.getLogger(__name__)
+
+ICON_ROOT = 'icons'
+REGISTRY_MODES = ('eager', 'lazy')
+INVALIDATION_MODES = ('none', 'stat', 'watch')
+
+IconKey = Tuple[Optional[str], str]
+
+# Sent with ``key``, ``old`` and ``new`` entries (either may be None) when
+# a refresh finds an icon that was added, edited or removed.
+icon_changed = Signal()
+
+_invalidation_mode: Optional[str] = None
+
+
+class IconEntry(NamedTuple):
+    """Resolved location of an icon file."""
+    path: str
+    mtime: float
+
+
+def get_registry_mode() -> Optional[str]:
+    """Return the configured registry mode, or None when disabled."""
+    mode = getattr(settings, 'SVG_ICON_REGISTRY', 'eager')
+    if not mode:
+        return None
+    if mode not in REGISTRY_MODES:
+        logger.warning(f"Unknown SVG_ICON_REGISTRY mode: {mode!r}, using 'lazy'")
+        return 'lazy'
+    return mode
+
+
+def get_invalidation_mode() -> str:
+    """Return the configured invalidation strategy for indexed icons."""
+    global _invalidation_mode
+    if _invalidation_mode is None:
+        mode = getattr(settings, 'SVG_ICON_INVALIDATION', None) or 'stat'
+        if mode not in INVALIDATION_MODES:
+            logger.warning(f"Unknown SVG_ICON_INVALIDATION mode: {mode!r}, using 'stat'")
+            mode = 'stat'
+        _invalidation_mode = mode
+    return _invalidation_mode
+
+
+def _split_static_path(static_path: str) -> Optional[IconKey]:
+    """Map ``icons/<library>/<name>.svg`` to a ``(library, name)`` key."""
+    prefix = f"{ICON_ROOT}/"
+    if not static_path.startswith(prefix) or not static_path.endswith('.svg'):
+        return None
+
+    parts = static_path[len(prefix):-len('.svg')].split('/')
+    if len(parts) == 1:
+        return None, parts[0]
+    if len(parts) == 2:
+        return parts[0], parts[1]
+    return None
+
+
+def _iter_finder_icons() -> Iterator[Tuple[IconKey, str]]:
+    """Yield ``(key, filesystem path)`` for icons in finder order."""
+    for finder in finders.get_finders():
+        for path, storage in finder.list([]):
+            static_path = path.replace(os.sep, '/')
+            prefix = getattr(storage, 'prefix', None)
+            if prefix:
+                static_path = f"{prefix}/{static_path}"
+
+            key = _split_static_path(static_path)
+            if key is not None:
+                yield key, storage.path(path)
+
+
+def _iter_staticfiles_dirs_icons() -> Iterator[Tuple[IconKey, str]]:
+    """Yield icons found directly under ``STATICFILES_DIRS``."""
+    for static_dir in settings.STATICFILES_DIRS or ():
+        if isinstance(static_dir, (list, tuple)):
+            continue
+        icon_root = Path(static_dir) / ICON_ROOT
+        if not icon_root.is_dir():
+            continue
+        for svg_path in icon_root.rglob('*.svg'):
+            static_path = svg_path.relative_to(static_dir).as_posix()
+            key = _split_static_path(static_path)
+            if key is not None:
+                yield key, str(svg_path)
+
+
+class IconRegistry:
+    """Thread-safe ``(library, name)`` → :class:`IconEntry` index."""
+
+    def __init__(self):
+        self._index: Dict[IconKey, IconEntry] = {}
+        # mtimes of the directories holding indexed icons (and their
+        # parents), so :meth:`poll` can tell when files were added or removed.
+        self._directories: Dict[str, float] = {}
+        self._built = False
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+        self._last_poll = 0.0
+        # Bumped whenever the index is rebuilt or an entry changes, so
+        # anything derived from many icons can tell it is stale.
+        self.generation = 0
+
+    @property
+    def is_built(self) -> bool:
+        return self._built
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, key: IconKey) -> bool:
+        self._ensure_built()
+        return key in self._index
+
+    def build(self) -> int:
+        """Scan the staticfiles finders and (re)build the index."""
+        with self._build_lock:
+            return self._build()
+
+    def _scan(self) -> Dict[IconKey, IconEntry]:
+        index: Dict[IconKey, IconEntry] = {}
+        sources = (_iter_finder_icons(), _iter_staticfiles_dirs_icons())
+        for source in sources:
+            for key, filepath in source:
+                if key in index:
+                    continue
+                try:
+                    index[key] = IconEntry(filepath, os.stat(filepath).st_mtime)
+                except OSError as e:
+                    logger.warning(f"Skipping unreadable icon {filepath}: {e}")
+        return index
+
+    @staticmethod
+    def _directory_mtimes(paths: Iterable[str], known: Optional[Dict[str, float]] = None) -> Dict[str, float]:
+        """Return the mtimes of the directories holding ``paths``, taken from ``known`` when listed there."""
+        known = known or {}
+        directories: Dict[str, float] = {}
+        for path in paths:
+            parent = os.path.dirname(path)
+            for directory in (parent, os.path.dirname(parent)):
+                if directory in directories:
+                    continue
+                if directory in known:
+                    directories[directory] = known[directory]
+                    continue
+                try:
+                    directories[directory] = os.stat(directory).st_mtime
+                except OSError:
+                    directories[directory] = 0.0
+        return directories
+
+    def _directories_changed(self) -> bool:
+        for directory, mtime in self._directories.items():
+            try:
+                if os.stat(directory).st_mtime != mtime:
+                    return True
+            except OSError:
+                return True
+        return False
+
+    def _build(self) -> int:
+        # Directories are stat'ed before the scan so files added while it
+        # runs are seen by the next poll.
+        known = self._directory_mtimes(entry.path for entry in self._index.values())
+        index = self._scan()
+        directories = self._directory_mtimes((entry.path for entry in index.values()), known)
+        with self._lock:
+            self._index = index
+            self._directories = directories
+            self._built = True
+            self.generation += 1
+        self._last_poll = time.monotonic()
+
+        logger.debug(f"SVG icon registry built with {len(index)} icons")
+        return len(index)
+
+    def refresh(self) -> List[Tuple[IconKey, Optional[IconEntry], Optional[IconEntry]]]:
+        """
+        Rescan the icon files and swap in the new index.
+
+        Sends :data:`icon_changed` for every added, edited or removed icon.
+
+        Returns:
+            list: ``(key, old, new)`` for each changed icon
+        """
+        return self._refresh(rescan=True)
+
+    def poll(self) -> List[Tuple[IconKey, Optional[IconEntry], Optional[IconEntry]]]:
+        """
+        Like :meth:`refresh`, but rescan the finders only when needed.
+
+        The full scan runs only when a directory holding icons changed
+        (an icon was added, removed or replaced by a rename); otherwise
+        only the indexed files are re-stat'ed to catch in-place edits.
+        """
+        return self._refresh(rescan=False)
+
+    def poll_if_due(self, interval: float) -> List[Tuple[IconKey, Optional[IconEntry], Optional[IconEntry]]]:
+        """Call :meth:`poll` unless the index was built or polled less than ``interval`` seconds ago."""
+        if self._built and time.monotonic() - self._last_poll < interval:
+            return []
+        return self.poll()
+
+    def _refresh(self, rescan: bool) -> List[Tuple[IconKey, Optional[IconEntry], Optional[IconEntry]]]:
+        with self._build_lock:
+            if not self._built:
+                self._build()
+                return []
+            self._last_poll = time.monotonic()
+            old_index = self._index
+            if rescan or self._directories_changed():
+                self._build()
+                index = self._index
+            else:
+                index = {}
+                for key, entry in old_index.items():
+                    try:
+                        index[key] = entry._replace(mtime=os.stat(entry.path).st_mtime)
+                    except OSError:
+                        pass
+                with self._lock:
+                    self._index = index
+
+        changes = [
+            (key, old_index.get(key), index.get(key))
+            for key in old_index.keys() | index.keys()
+            if old_index.get(key) != index.get(key)
+        ]
+        if changes:
+            self.generation += 1
+        for key, old, new in changes:
+            icon_changed.send(sender=self.__class__, key=key, old=old, new=new)
+        return changes
+
+    def clear(self) -> None:
+        """Drop the index; it is rebuilt on the next lookup."""
+        with self._lock:
+            self._index = {}
+            self._built = False
+            self.generation += 1
+
+    def _ensure_built(self) -> None:
+        if not self._built:
+            with self._build_lock:
+                if not self._built:
+                    self._build()
+
+    def get(self, name: str, library: Optional[str] = None) -> Optional[IconEntry]:
+        """Return the indexed entry for an icon, or None if unknown."""
+        if not self._built:
+            self._ensure_built()
+        return self._index.get((library, name))
+
+    def add(self, name: str, library: Optional[str], filepath: str) -> Optional[IconEntry]:
+        """
+        Index a single icon file discovered outside of :meth:`build`.
+
+        Sends :data:`icon_changed` when the entry is new or differs from
+        the indexed one.
+        """
+        try:
+            entry = IconEntry(filepath, os.stat(filepath).st_mtime)
+        except OSError:
+            return None
+        key = (library, name)
+        with self._lock:
+            old = self._index.get(key)
+            self._index[key] = entry
+            if old != entry:
+                self.generation += 1
+        if old != entry:
+            icon_changed.send(sender=self.__class__, key=key, old=old, new=entry)
+        return entry
+
+    def items(self) -> Iterator[Tuple[IconKey, IconEntry]]:
+        """Iterate over ``((library, name), entry)`` pairs."""
+        self._ensure_built()
+        return iter(list(self._index.items()))
+
+
+icon_registry = IconRegistry()
+
+
+@receiver(setting_changed)
+def _reset_invalidation_mode(*, setting, **kwargs):
+    global _invalidation_mode
+    if setting == 'SVG_ICON_INVALIDATION':
+        _invalidation_mode = None
+
+
+@receiver(setting_changed)
+def _reset_registry(*, setting, **kwargs):
+    """Invalidate the index when the settings it was built from change."""
+    if setting in {
+        'STATICFILES_DIRS',
+        'STATICFILES_FINDERS',
+        'STATICFILES_STORAGE',
+        'STORAGES',
+        'INSTALLED_APPS',
+        'SVG_ICON_REGISTRY',
+    }:
+        icon_registry.clear()
\ No newline at end of file
@@ -0,0 +1,298 @@
+"""
+SVG Sanitizer
+=============
+
+Single-pass, allowlist-based SVG sanitizer.
+
+The markup is walked once by a small tokenizer: every tag is parsed with
+anchored, non-backtracking patterns and either re-emitted with its
+allowed attributes or dropped. Running time is linear in the input size
+regardless of how malformed it is.
+
+Removed:
+    - XML declarations, processing instructions, doctypes, comments, CDATA
+    - Elements outside the SVG allowlist (``script``, ``foreignObject`` and
+      other active content are dropped together with their children)
+    - Attributes outside the allowlist, including every ``on*`` handler
+    - ``href`` values that are not local ``#fragment`` references
+    - Values referencing ``javascript:``/``vbscript:`` URLs or CSS
+      ``expression()``, and animations that target ``href`` or handlers
+    - ``<style>`` elements whose text fails the same CSS value check
+"""
+import html
+import re
+from typing import List, Optional
+
+_ALLOWED_ELEMENTS = frozenset({
+    'svg', 'g', 'defs', 'symbol', 'use', 'title', 'desc', 'metadata', 'switch', 'view',
+    'path', 'circle', 'ellipse', 'line', 'polyline', 'polygon', 'rect',
+    'text', 'tspan', 'textPath',
+    'clipPath', 'mask', 'marker', 'pattern', 'image', 'style',
+    'linearGradient', 'radialGradient', 'stop',
+    'filter', 'feBlend', 'feColorMatrix', 'feComponentTransfer', 'feComposite',
+    'feConvolveMatrix', 'feDiffuseLighting', 'feDisplacementMap', 'feDistantLight',
+    'feDropShadow', 'feFlood', 'feFuncA', 'feFuncB', 'feFuncG', 'feFuncR',
+    'feGaussianBlur', 'feMerge', 'feMergeNode', 'feMorphology', 'feOffset',
+    'fePointLight', 'feSpecularLighting', 'feSpotLight', 'feTile', 'feTurbulence',
+    'animate', 'animateMotion', 'animateTransform', 'mpath', 'set',
+})
+
+# Case-insensitive lookup so ``<SVG>`` or ``<lineargradient>`` map to the
+# canonical camelCase names browsers use.
+_CANONICAL_ELEMENTS = {name.lower(): name for name in _ALLOWED_ELEMENTS}
+
+# Dropped together with everything they contain.
+_DROP_WITH_CONTENT = frozenset({
+    'script', 'foreignobject', 'iframe', 'object', 'embed', 'noscript',
+    'template', 'audio', 'video', 'canvas', 'handler', 'listener',
+})
+
+_ANIMATION_ELEMENTS = frozenset({'animate', 'animateMotion', 'animateTransform', 'set'})
+# Elements whose text is checked like a ``style`` attribute value.
+_CSS_ELEMENTS = frozenset({'style'})
+
+_ALLOWED_ATTRIBUTES = frozenset({
+    # Core and accessibility
+    'id', 'class', 'style', 'lang', 'tabindex', 'role', 'focusable',
+    'xmlns', 'xmlns:xlink', 'xml:space', 'xml:lang', 'version',
+    # Geometry
+    'viewBox', 'preserveAspectRatio', 'width', 'height', 'x', 'y',
+    'x1', 'y1', 'x2', 'y2', 'cx', 'cy', 'r', 'rx', 'ry', 'fx', 'fy', 'fr',
+    'd', 'points', 'pathLength', 'transform', 'dx', 'dy', 'rotate',
+    # Painting
+    'fill', 'fill-opacity', 'fill-rule', 'stroke', 'stroke-width', 'stroke-linecap',
+    'stroke-linejoin', 'stroke-miterlimit', 'stroke-dasharray', 'stroke-dashoffset',
+    'stroke-opacity', 'opacity', 'color', 'display', 'visibility', 'overflow',
+    'clip-path', 'clip-rule', 'mask', 'filter', 'paint-order', 'vector-effect',
+    'shape-rendering', 'color-interpolation', 'color-interpolation-filters',
+    'mix-blend-mode', 'isolation', 'transform-origin',
+    # References
+    'href', 'xlink:href',
+    # Gradients, patterns, clipping, markers
+    'offset', 'stop-color', 'stop-opacity', 'gradientUnits', 'gradientTransform',
+    'spreadMethod', 'patternUnits', 'patternContentUnits', 'patternTransform',
+    'clipPathUnits', 'maskUnits', 'maskContentUnits', 'marker-start', 'marker-mid',
+    'marker-end', 'markerWidth', 'markerHeight', 'markerUnits', 'refX', 'refY', 'orient',
+    # Text
+    'font-family', 'font-size', 'font-weight', 'font-style', 'text-anchor',
+    'dominant-baseline', 'alignment-baseline', 'letter-spacing', 'word-spacing',
+    'text-decoration', 'textLength', 'lengthAdjust', 'startOffset',
+    # Filters
+    'filterUnits', 'primitiveUnits', 'in', 'in2', 'result', 'stdDeviation', 'mode',
+    'operator', 'k1', 'k2', 'k3', 'k4', 'type', 'values', 'tableValues', 'slope',
+    'intercept', 'amplitude', 'exponent', 'flood-color', 'flood-opacity',
+    'lighting-color', 'baseFrequency', 'numOctaves', 'seed', 'stitchTiles', 'scale',
+    'xChannelSelector', 'yChannelSelector', 'radius', 'order', 'kernelMatrix',
+    'divisor', 'bias', 'targetX', 'targetY', 'edgeMode', 'preserveAlpha',
+    'surfaceScale', 'diffuseConstant', 'specularConstant', 'specularExponent',
+    'azimuth', 'elevation', 'z', 'pointsAtX', 'pointsAtY', 'pointsAtZ',
+    'limitingConeAngle',
+    # Animation
+    'attributeName', 'attributeType', 'begin', 'dur', 'end', 'repeatCount',
+    'repeatDur', 'from', 'to', 'by', 'calcMode', 'keyTimes', 'keySplines',
+    'keyPoints', 'additive', 'accumulate', 'restart', 'path', 'fill-mode',
+})
+
+_ALLOWED_ATTRIBUTE_PREFIXES = ('aria-', 'data-')
+_HREF_ATTRIBUTES = frozenset({'href', 'xlink:href'})
+
+# Unquoted values end at whitespace or at the ``/`` of a closing ``/>``.
+_BARE_VALUE = r'(?:[^\s"\'<>=`/]|/(?!>))+'
+
+# One alternation per token kind; each branch is anchored on ``<`` and built
+# from disjoint character classes, so a failed attempt backtracks at most
+# linearly and never past the next ``<``.
+_TOKEN_PATTERN = re.compile(
+    r'<(?:'
+    r'(?P<comment>!--)'
+    r'|(?P<pi>\?)'
+    r'|(?P<cdata>!\[CDATA\[)'
+    r'|(?P<decl>!)'
+    r'|/\s*(?P<close>[A-Za-z][\w:.\-]*)\s*>'
+    r'|(?P<tag>[A-Za-z][\w:.\-]*)'
+    r'(?P<attrs>(?:\s+[^\s"\'<>/=]+(?:\s*=\s*(?:"[^"]*"|\'[^\']*\'|%s))?)*)'
+    r'\s*(?P<selfclose>/?)>'
+    r')' % _BARE_VALUE
+)
+_ATTR_PATTERN = re.compile(
+    r'([^\s"\'<>/=]+)(?:\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|(%s)))?' % _BARE_VALUE
+)
+_DANGEROUS_VALUE_PATTERN = re.compile(
+    r'(?:java|vb)script:|data:text/html|expression\(|@import',
+    re.IGNORECASE,
+)
+_URL_PATTERN = re.compile(r'url\([\'"]?([^\'")]*)', re.IGNORECASE)
+_WHITESPACE_PATTERN = re.compile(r'[\s\x00]+')
+_SUSPICIOUS_PATTERN = re.compile(r'[:(@&\\]')
+
+# Fast path: a tag whose attributes are all allowlisted, double-quoted and
+# free of any character a dangerous value needs can be copied verbatim.
+_PLAIN_ATTRS = (
+    r'(?:\s+(?:%s|aria-[\w\-]+|data-[\w\-]+)="[^"<:(@&\\]*"'
+    r'|\s+xmlns(?::xlink)?="http://www\.w3\.org/[\w/.]*")*\s*'
+    % '|'.join(sorted(
+        (re.escape(name) for name in _ALLOWED_ATTRIBUTES - _HREF_ATTRIBUTES),
+        key=len, reverse=True,
+    ))
+)
+_PLAIN_ATTRS_PATTERN = re.compile(_PLAIN_ATTRS)
+
+# A whole document made only of such tags and text needs no rewriting at
+# all. Every repetition starts at a ``<``, so the match stays linear.
+_PLAIN_ELEMENTS = '|'.join(sorted(_ALLOWED_ELEMENTS - _ANIMATION_ELEMENTS - _CSS_ELEMENTS, key=len, reverse=True))
+_PLAIN_DOCUMENT_PATTERN = re.compile(
+    r'[^<]*(?:(?:<(?:%s)%s/?>|</(?:%s)\s*>)[^<]*)*'
+    % (_PLAIN_ELEMENTS, _PLAIN_ATTRS, _PLAIN_ELEMENTS)
+)
+
+
+def _is_safe_value(name: str, value: str) -> bool:
+    """Check an attribute value for script URLs and external references."""
+    if name in _HREF_ATTRIBUTES:
+        return _WHITESPACE_PATTERN.sub('', html.unescape(value)).startswith('#')
+    if not _SUSPICIOUS_PATTERN.search(value):
+        return True
+    decoded = _WHITESPACE_PATTERN.sub('', html.unescape(value))
+    if '\\' in decoded or _DANGEROUS_VALUE_PATTERN.search(decoded):
+        return False
+    return all(url.startswith('#') for url in _URL_PATTERN.findall(decoded) if url)
+
+
+def _filter_attributes(
+    element: str,
+    attrs: str,
+    removed: Optional[List[str]],
+) -> Optional[str]:
+    """Return the allowed attributes re-serialized, or None to drop the element."""
+    seen = set()
+    parts = []
+    for match in _ATTR_PATTERN.finditer(attrs):
+        name, double, single, bare = match.groups()
+        if name in seen:
+            continue
+        if name not in _ALLOWED_ATTRIBUTES and not name.startswith(_ALLOWED_ATTRIBUTE_PREFIXES):
+            if removed is not None:
+                removed.append(f"attribute:{name}")
+            continue
+        if double is not None:
+            value = double
+        elif single is not None:
+            value = single.replace('"', '&quot;')
+        else:
+            value = bare or ''
+        if not _is_safe_value(name, value):
+            if removed is not None:
+                removed.append(f"value:{name}")
+            continue
+        if element in _ANIMATION_ELEMENTS and name == 'attributeName':
+            target = value.strip().lower()
+            if target in _HREF_ATTRIBUTES or target.startswith('on'):
+                return None
+        seen.add(name)
+        parts.append(f' {name}="{value}"')
+    return ''.join(parts)
+
+
+def looks_like_svg(content: str) -> bool:
+    """Cheap structure check applied to icon files before sanitizing them."""
+    return content.startswith('<svg') or 'xmlns="http://www.w3.org/2000/svg"' in content
+
+
+def sanitize_svg(content: str, removed: Optional[List[str]] = None) -> str:
+    """
+    Sanitize SVG markup in a single linear pass.
+
+    Text between tags is kept, with any stray ``<`` escaped, so the only
+    markup in the output is markup this function emitted.
+
+    Args:
+        content: Raw SVG markup
+        removed: Optional list that receives a description of every
+            dropped construct (e.g. ``"element:script"``, ``"attribute:onclick"``)
+
+    Returns:
+        str: Sanitized markup, stripped of surrounding whitespace
+    """
+    if _PLAIN_DOCUMENT_PATTERN.fullmatch(content):
+        return content.strip()
+
+    out: List[str] = []
+    pos = 0
+    length = len(content)
+    search = _TOKEN_PATTERN.search
+
+    while pos < length:
+        token = search(content, pos)
+        if token is None:
+            out.append(content[pos:].replace('<', '&lt;'))
+            break
+        start = token.start()
+        if start > pos:
+            out.append(content[pos:start].replace('<', '&lt;'))
+        pos = token.end()
+
+        name = token.group('tag')
+        if name is not None:
+            lowered = name.lower()
+            self_closing = bool(token.group('selfclose'))
+
+            element = _CANONICAL_ELEMENTS.get(lowered)
+            attrs = token.group('attrs')
+            if (element == name and element not in _ANIMATION_ELEMENTS and element not in _CSS_ELEMENTS
+                    and _PLAIN_ATTRS_PATTERN.fullmatch(attrs)):
+                out.append(token.group())
+                continue
+            if element is not None:
+                attrs = _filter_attributes(element, attrs, removed)
+            else:
+                attrs = None
+            if attrs is not None and element in _CSS_ELEMENTS and not self_closing:
+                close = re.compile(rf'</\s*{re.escape(name)}\s*>', re.IGNORECASE).search(content, pos)
+                text = content[pos:] if close is None else content[pos:close.start()]
+                pos = length if close is None else close.end()
+                if _is_safe_value(element, text):
+                    out.append(f'<{element}{attrs}>{text.replace("<", "&lt;")}</{element}>')
+                elif removed is not None:
+                    removed.append(f"value:{element}")
+                continue
+            if attrs is not None:
+                out.append(f'<{element}{attrs}/>' if self_closing else f'<{element}{attrs}>')
+                continue
+
+            if removed is not None:
+                removed.append(f"element:{name}")
+            if lowered in _DROP_WITH_CONTENT and not self_closing:
+                close = re.compile(rf'</\s*{re.escape(name)}\s*>', re.IGNORECASE).search(content, pos)
+                pos = length if close is None else close.end()
+            continue
+
+        closing = token.group('close')
+        if closing is not None:
+            element = _CANONICAL_ELEMENTS.get(closing.lower())
+            if element is not None:
+                out.append(f'</{element}>')
+            continue
+
+        # Comments, processing instructions, CDATA and doctypes are dropped.
+        kind = token.lastgroup
+        if kind == 'comment':
+            end = content.find('-->', pos)
+            pos = length if end == -1 else end + 3
+        elif kind == 'pi':
+            end = content.find('?>', pos)
+            pos = length if end == -1 else end + 2
+        elif kind == 'cdata':
+            end = content.find(']]>', pos)
+            pos = length if end == -1 else end + 3
+        else:
+            # A doctype may carry an internal subset declaring entities.
+            end = content.find('>', pos)
+            subset = content.find('[', pos)
+            if subset != -1 and (end == -1 or subset < end):
+                subset_end = content.find(']', subset)
+                end = -1 if subset_end == -1 else content.find('>', subset_end)
+            pos = length if end == -1 else end + 1
+        if removed is not None:
+            removed.append(kind)
+
+    return ''.join(out).strip()
\ No newline at end of file
@@ -0,0 +1,332 @@
+"""
+Icon Search
+===========
+
+Name index over every icon in the registry, for icon pickers and
+autocomplete.
+
+Each query term matches an icon by, best first:
+
+- the whole name (``house``)
+- a prefix of the name (``hou``) or of one of its words (``fill`` in
+  ``house-fill``)
+- a prefix of one of the icon's tags or categories
+- a substring of the name (three or more characters, via a trigram index)
+
+All terms must match. Results are ranked by how well the terms matched,
+then by shorter name. A term of the form ``library:term`` (or the
+``library`` argument) restricts the search to one library::
+
+    from django_svg_icon_tags.search import search_icons
+
+    page = search_icons("arrow down", limit=20)
+    page.total, [result.spec for result in page.results]
+
+The index is built once, from the registry, and rebuilt when icons are
+added or removed. Ranked results of recent queries are kept so paging
+through them only slices a list.
+
+Settings:
+    SVG_ICON_SEARCH_INDEX: ``"lazy"`` (default) builds the index on the
+        first search, ``"eager"`` at startup
+    SVG_ICON_SEARCH_TAGS: Tags and categories per icon, as a dict or the
+        path of a JSON file of the form ``{"<library>/<name>": ["tag", ...]}``
+    SVG_ICON_SEARCH_LIMIT: Default and maximum page size (default 50)
+"""
+import json
+import logging
+import re
+import threading
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+from django_svg_icon_tags.cache import LRUCache
+from django_svg_icon_tags.registry import IconKey, icon_changed, icon_registry
+
+logger = logging.getLogger(__name__)
+
+_WORD_SPLIT = re.compile(r'[-_.\s]+')
+
+# Score of a term matching, best first
+EXACT, PREFIX, WORD, TAG, SUBSTRING = 100, 50, 30, 20, 10
+
+_search_index = None
+_search_lock = threading.Lock()
+
+
+class IconSearchResult(NamedTuple):
+    """An icon found by a search."""
+    library: Optional[str]
+    name: str
+
+    @property
+    def spec(self) -> str:
+        """The icon as written in templates (``"library:name"``)."""
+        return f"{self.library}:{self.name}" if self.library else self.name
+
+
+class IconSearchPage(NamedTuple):
+    """One page of search results.
+
+    Attributes:
+        results: Icons on this page
+        total: Icons matching the query overall
+        offset: Position of the first result
+        limit: Page size
+    """
+    results: List[IconSearchResult]
+    total: int
+    offset: int
+    limit: int
+
+    @property
+    def has_more(self) -> bool:
+        return self.offset + len(self.results) < self.total
+
+
+def _words(text: str) -> List[str]:
+    return [word for word in _WORD_SPLIT.split(text.lower()) if word]
+
+
+def _trigrams(text: str) -> set:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _prefix_range(keys: Sequence[str], prefix: str) -> range:
+    """Return the positions of the sorted ``keys`` that start with ``prefix``."""
+    return range(bisect_left(keys, prefix), bisect_left(keys, prefix + '\uffff'))
+
+
+class _TermIndex:
+    """Sorted terms mapped to the icons they belong to, for prefix lookups."""
+
+    def __init__(self, postings: Mapping[str, Iterable[int]]):
+        self.terms = sorted(postings)
+        self.icons = [tuple(postings[term]) for term in self.terms]
+
+    def match(self, prefix: str) -> Iterable[Tuple[str, Tuple[int, ...]]]:
+        for position in _prefix_range(self.terms, prefix):
+            yield self.terms[position], self.icons[position]
+
+
+class IconSearchIndex:
+    """Immutable search index over a set of icons.
+
+    Args:
+        keys: ``(library, name)`` pairs to index
+        tags: Extra search terms per icon
+        cache_size: Ranked queries to keep for paging
+    """
+
+    def __init__(
+        self,
+        keys: Iterable[IconKey],
+        tags: Optional[Mapping[IconKey, Iterable[str]]] = None,
+        cache_size: int = 256,
+    ):
+        # Ids follow the tie-break order, so equal scores sort by id.
+        self._keys: List[IconKey] = sorted(set(keys), key=lambda key: (len(key[1]), key[1], key[0] or ''))
+        self._lower = [name.lower() for _, name in self._keys]
+
+        by_library = defaultdict(set)
+        names = defaultdict(list)
+        words = defaultdict(list)
+        tag_terms = defaultdict(list)
+        trigrams = defaultdict(set)
+        tags = tags or {}
+        for icon_id, ((library, name), lower) in enumerate(zip(self._keys, self._lower)):
+            by_library[library].add(icon_id)
+            names[lower].append(icon_id)
+            for word in set(_words(name)):
+                words[word].append(icon_id)
+            for tag in {word for tag in tags.get((library, name), ()) for word in _words(tag)}:
+                tag_terms[tag].append(icon_id)
+            for trigram in _trigrams(lower):
+                trigrams[trigram].add(icon_id)
+
+        self._libraries: Dict[Optional[str], frozenset] = {
+            library: frozenset(ids) for library, ids in by_library.items()
+        }
+        self._names = _TermIndex(names)
+        self._words = _TermIndex(words)
+        self._tags = _TermIndex(tag_terms)
+        self._trigrams = {trigram: frozenset(ids) for trigram, ids in trigrams.items()}
+        self._ranked = LRUCache(cache_size, sizeof=lambda ids: 0)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def libraries(self) -> List[Optional[str]]:
+        """Return the indexed libraries."""
+        return sorted(self._libraries, key=lambda library: library or '')
+
+    def _match_term(self, term: str) -> Dict[int, int]:
+        """Return the score of every icon matching a single term."""
+        scores: Dict[int, int] = {}
+
+        def add(icon_ids: Iterable[int], score: int) -> None:
+            for icon_id in icon_ids:
+                if scores.get(icon_id, 0) < score:
+                    scores[icon_id] = score
+
+        for name, icon_ids in self._names.match(term):
+            add(icon_ids, EXACT if name == term else PREFIX)
+        for _, icon_ids in self._words.match(term):
+            add(icon_ids, WORD)
+        for _, icon_ids in self._tags.match(term):
+            add(icon_ids, TAG)
+
+        if len(term) >= 3:
+            grams = sorted((self._trigrams.get(trigram, frozenset()) for trigram in _trigrams(term)), key=len)
+            candidates = grams[0].intersection(*grams[1:])
+            add((icon_id for icon_id in candidates if term in self._lower[icon_id]), SUBSTRING)
+        return scores
+
+    def _rank(self, terms: Tuple[str, ...], library: Optional[str]) -> Tuple[int, ...]:
+        """Return the ids of the icons matching all terms, best first."""
+        key = (terms, library)
+        ranked = self._ranked.get(key)
+        if ranked is not None:
+            return ranked
+
+        if library is not None and library not in self._libraries:
+            ranked = ()
+        elif not terms:
+            ranked = tuple(
+                icon_id for icon_id in range(len(self._keys))
+                if library is None or self._keys[icon_id][0] == library
+            )
+        else:
+            scores: Optional[Dict[int, int]] = None
+            for term in terms:
+                matches = self._match_term(term)
+                if scores is None:
+                    scores = matches
+                else:
+                    scores = {
+                        icon_id: score + matches[icon_id]
+                        for icon_id, score in scores.items()
+                        if icon_id in matches
+                    }
+                if not scores:
+                    break
+            if library is not None:
+                in_library = self._libraries[library]
+                scores = {icon_id: score for icon_id, score in scores.items() if icon_id in in_library}
+            ranked = tuple(sorted(scores, key=lambda icon_id: (-scores[icon_id], icon_id)))
+
+        self._ranked.set(key, ranked)
+        return ranked
+
+    def search(
+        self,
+        query: str = '',
+        library: Optional[str] = None,
+        offset: int = 0,
+        limit: int = 50,
+    ) -> IconSearchPage:
+        """
+        Find icons matching every term of ``query``.
+
+        Args:
+            query: Space-separated terms; ``library:term`` restricts the library
+            library: Only search this library
+            offset: Results to skip
+            limit: Maximum results to return
+
+        Returns:
+            IconSearchPage: The requested page and the total match count
+        """
+        terms = []
+        for term in query.lower().split():
+            term_library, separator, term = term.rpartition(':')
+            if separator:
+                library = term_library or None
+            if term:
+                terms.append(term)
+
+        offset, limit = max(int(offset), 0), max(int(limit), 0)
+        ranked = self._rank(tuple(terms), library)
+        results = [IconSearchResult(*self._keys[icon_id]) for icon_id in ranked[offset:offset + limit]]
+        return IconSearchPage(results, len(ranked), offset, limit)
+
+
+def _load_tags() -> Dict[IconKey, List[str]]:
+    """Read SVG_ICON_SEARCH_TAGS, keyed like the registry."""
+    tags = getattr(settings, 'SVG_ICON_SEARCH_TAGS', None)
+    if not tags:
+        return {}
+    if isinstance(tags, str):
+        try:
+            with open(tags, encoding='utf-8') as tags_file:
+                tags = json.load(tags_file)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read SVG_ICON_SEARCH_TAGS file {tags}: {e}")
+            return {}
+
+    icon_tags = {}
+    for key, terms in tags.items():
+        library, _, name = key.rpartition('/')
+        icon_tags[(library or None, name)] = [terms] if isinstance(terms, str) else list(terms)
+    return icon_tags
+
+
+def get_search_index() -> IconSearchIndex:
+    """Return the search index, building it from the registry on first use."""
+    global _search_index
+    index = _search_index
+    if index is None:
+        with _search_lock:
+            index = _search_index
+            if index is None:
+                keys = [key for key, _ in icon_registry.items()]
+                index = _search_index = IconSearchIndex(keys, _load_tags())
+                logger.debug(f"SVG icon search index built with {len(index)} icons")
+    return index
+
+
+def search_icons(
+    query: str = '',
+    library: Optional[str] = None,
+    offset: int = 0,
+    limit: Optional[int] = None,
+) -> IconSearchPage:
+    """
+    Search the icon names of all libraries.
+
+    Args:
+        query: Space-separated terms, see the module documentation
+        library: Only search this library
+        offset: Results to skip
+        limit: Page size, at most SVG_ICON_SEARCH_LIMIT
+
+    Returns:
+        IconSearchPage: The requested page and the total match count
+    """
+    max_limit = getattr(settings, 'SVG_ICON_SEARCH_LIMIT', 50)
+    limit = max_limit if limit is None else min(limit, max_limit)
+    return get_search_index().search(query, library=library, offset=offset, limit=limit)
+
+
+def _reset_search_index() -> None:
+    global _search_index
+    with _search_lock:
+        _search_index = None
+
+
+@receiver(setting_changed)
+def _reset_search_settings(*, setting, **kwargs):
+    if setting.startswith(('SVG_ICON_', 'STATIC')) or setting in ('STORAGES', 'INSTALLED_APPS'):
+        _reset_search_index()
+
+
+@receiver(icon_changed)
+def _reset_on_icon_change(*, old, new, **kwargs):
+    """Rebuild after icons are added or removed; edits keep their names."""
+    if old is None or new is None:
+        _reset_search_index()
\ No newline at end of file
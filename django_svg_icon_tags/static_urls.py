@@ -0,0 +1,146 @@
+"""
+Content-Hashed Icon URLs
+========================
+
+Static URLs for ``<img>`` icons that change whenever the icon changes,
+so they can be served with long-lived ``immutable`` cache headers.
+
+With a ``ManifestStaticFilesStorage`` the storage already returns hashed
+file names and its URL is used as-is. Otherwise a ``?v=<hash>`` of the
+file content is appended to the plain static URL. Hashes come from a
+precomputed URL manifest when one is configured (see
+``manage.py build_svg_icons --url-manifest``) and are computed from the
+file otherwise.
+
+This module never writes files to ``STATIC_ROOT``, so it never prunes
+any. ``?v=`` URLs point at the one unhashed copy. The hashed copies
+written by ``collectstatic`` with a manifest storage are managed by
+Django, which keeps superseded ones so that pages cached with old URLs
+still load. Run ``collectstatic --clear`` on deploy to drop them.
+
+Settings:
+    SVG_ICON_HASHED_URLS: Add content hashes to ``<img>`` URLs (default True)
+    SVG_ICON_URL_MANIFEST: JSON manifest of precomputed icon hashes (optional)
+"""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from typing import Dict, Iterable, Optional, Tuple
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import ManifestFilesMixin, staticfiles_storage
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.templatetags.static import static
+
+from django_svg_icon_tags.registry import ICON_ROOT
+
+logger = logging.getLogger(__name__)
+
+HASH_LENGTH = 12
+
+_UNSET = object()
+_url_manifest = _UNSET
+
+
+def icon_static_path(name: str, library: Optional[str] = None) -> str:
+    """Return the static path of an icon (``icons/<library>/<name>.svg``)."""
+    if library:
+        return f"{ICON_ROOT}/{library}/{name}.svg"
+    return f"{ICON_ROOT}/{name}.svg"
+
+
+def content_hash(content: bytes) -> str:
+    """Return the short hash used to version icon URLs."""
+    return hashlib.sha256(content).hexdigest()[:HASH_LENGTH]
+
+
+def file_hash(path: str) -> Optional[str]:
+    """Hash a file's content, or return None if it cannot be read."""
+    try:
+        with open(path, 'rb') as icon_file:
+            return content_hash(icon_file.read())
+    except OSError as e:
+        logger.warning(f"Cannot hash SVG icon {path}: {e}")
+        return None
+
+
+def write_url_manifest(path: str, hashes: Iterable[Tuple[Optional[str], str, str]]) -> int:
+    """
+    Write ``(library, name, hash)`` triples to a URL manifest atomically.
+
+    Returns:
+        int: Number of icons written
+    """
+    icons = {icon_static_path(name, library): digest for library, name, digest in hashes}
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as manifest_file:
+            json.dump({'icons': icons}, manifest_file, separators=(',', ':'), sort_keys=True)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return len(icons)
+
+
+def get_url_manifest() -> Dict[str, str]:
+    """Return the SVG_ICON_URL_MANIFEST hashes, loaded once per process."""
+    global _url_manifest
+    if _url_manifest is _UNSET:
+        path = getattr(settings, 'SVG_ICON_URL_MANIFEST', None)
+        manifest = {}
+        if path:
+            try:
+                with open(path, encoding='utf-8') as manifest_file:
+                    manifest = json.load(manifest_file)['icons']
+            except (OSError, ValueError, KeyError) as e:
+                logger.error(f"Failed to load SVG icon URL manifest {path}: {e}")
+        _url_manifest = manifest
+    return _url_manifest
+
+
+def hashed_icon_url(
+    name: str,
+    library: Optional[str] = None,
+    path: Optional[str] = None,
+    content: Optional[str] = None,
+) -> str:
+    """
+    Build the ``<img>`` URL of an icon.
+
+    Args:
+        name: Icon name
+        library: Library name
+        path: Icon file to hash when the manifest has no entry for it
+        content: Icon markup to hash when there is no file (bundled icons)
+
+    Returns:
+        str: Static URL, versioned by content when enabled
+    """
+    static_path = icon_static_path(name, library)
+    url = static(static_path)
+    if not getattr(settings, 'SVG_ICON_HASHED_URLS', True) or isinstance(staticfiles_storage, ManifestFilesMixin):
+        return url
+
+    digest = get_url_manifest().get(static_path)
+    if digest is None:
+        if path is not None:
+            digest = file_hash(path)
+        elif content is not None:
+            digest = content_hash(content.encode('utf-8'))
+    if not digest:
+        return url
+    return f"{url}{'&' if '?' in url else '?'}v={digest}"
+
+
+@receiver(setting_changed)
+def _reset_url_manifest(*, setting, **kwargs):
+    global _url_manifest
+    if setting == 'SVG_ICON_URL_MANIFEST':
+        _url_manifest = _UNSET
\ No newline at end of file
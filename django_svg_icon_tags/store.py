@@ -0,0 +1,237 @@
+"""
+Content-Addressed Icon Store
+============================
+
+Process-local store for compiled icons, keyed by content.
+
+Icon keys (file path and mtime) map to the hash of the icon's markup,
+and each distinct icon is held once however many names, libraries or
+file versions share it. Records use ``__slots__`` so the per-icon
+overhead stays small and predictable.
+
+With compression enabled only the most recently used icons are kept
+expanded; colder ones are held as zlib-compressed markup and expanded
+again on their next use.
+
+The store has the same interface and bounds as
+:class:`~django_svg_icon_tags.cache.LRUCache`: ``maxsize`` bounds the
+number of keys, ``max_bytes`` the characters (or compressed bytes)
+actually held, and pinned keys are never evicted.
+"""
+import hashlib
+import sys
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Dict, Hashable, NamedTuple, Optional
+
+from django_svg_icon_tags.cache import CacheInfo
+from django_svg_icon_tags.compiled import CompiledSvg, compile_svg
+
+
+class StoreMemory(NamedTuple):
+    """Memory used by an :class:`IconStore`.
+
+    Attributes:
+        keys: Icon keys (names and versions) stored
+        records: Distinct icons held
+        compressed: Records held compressed
+        logical_bytes: Characters a per-key copy of every icon would take
+        unique_bytes: Characters of the distinct icons, uncompressed
+        stored_bytes: Characters and compressed bytes actually held
+        overhead_bytes: Approximate size of the index and record objects
+    """
+    keys: int
+    records: int
+    compressed: int
+    logical_bytes: int
+    unique_bytes: int
+    stored_bytes: int
+    overhead_bytes: int
+
+    @property
+    def saved_bytes(self) -> int:
+        """Bytes saved by deduplication and compression together."""
+        return self.logical_bytes - self.stored_bytes
+
+
+class _Record:
+    """One distinct icon, either expanded or compressed."""
+
+    __slots__ = ('compiled', 'packed', 'size', 'stored', 'refs')
+
+    def __init__(self, compiled: CompiledSvg):
+        self.compiled: Optional[CompiledSvg] = compiled
+        self.packed: Optional[bytes] = None
+        self.size = compiled.size
+        self.stored = self.size
+        self.refs = 0
+
+    def freeze(self) -> None:
+        packed = zlib.compress(self.compiled.render().encode('utf-8'))
+        if len(packed) < self.size:
+            self.packed = packed
+            self.compiled = None
+            self.stored = len(packed)
+
+    def thaw(self) -> CompiledSvg:
+        self.compiled = compile_svg(zlib.decompress(self.packed).decode('utf-8'))
+        self.packed = None
+        self.stored = self.size
+        return self.compiled
+
+
+def content_key(compiled: CompiledSvg) -> bytes:
+    """Return the content address of a compiled icon."""
+    return hashlib.blake2b(compiled.render().encode('utf-8'), digest_size=16).digest()
+
+
+class IconStore:
+    """Thread-safe, deduplicating LRU of compiled icons.
+
+    Args:
+        maxsize: Maximum number of unpinned keys; 0 disables their storage
+        max_bytes: Optional bound on the characters and bytes held
+        hot_entries: With compression, how many records stay expanded;
+            None disables compression
+    """
+
+    def __init__(self, maxsize: int = 4096, max_bytes: Optional[int] = None, hot_entries: Optional[int] = None):
+        self.maxsize = max(int(maxsize), 0)
+        self.max_bytes = max_bytes
+        self.hot_entries = hot_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes = 0
+        self._keys: 'OrderedDict[Hashable, bytes]' = OrderedDict()
+        self._pinned: Dict[Hashable, bytes] = {}
+        self._records: Dict[bytes, _Record] = {}
+        self._hot: 'OrderedDict[bytes, None]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._keys) + len(self._pinned)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._keys or key in self._pinned
+
+    def get(self, key: Hashable, default: Optional[CompiledSvg] = None) -> Optional[CompiledSvg]:
+        """Return the icon stored under ``key`` and mark it recently used."""
+        with self._lock:
+            digest = self._pinned.get(key)
+            if digest is None:
+                digest = self._keys.get(key)
+                if digest is None:
+                    self.misses += 1
+                    return default
+                self._keys.move_to_end(key)
+            self.hits += 1
+            record = self._records[digest]
+            compiled = record.compiled
+            if self.hot_entries is not None:
+                if compiled is None:
+                    self.bytes -= record.stored
+                    compiled = record.thaw()
+                    self.bytes += record.stored
+                self._touch(digest)
+                self._evict()
+            return compiled
+
+    def set(self, key: Hashable, value: CompiledSvg, pin: bool = False) -> None:
+        """Store ``value``, sharing the record of identical icons."""
+        if not self.maxsize and not pin:
+            return
+        digest = content_key(value)
+        with self._lock:
+            self._discard(key)
+            record = self._records.get(digest)
+            if record is None:
+                record = self._records[digest] = _Record(value)
+                self.bytes += record.stored
+            record.refs += 1
+            if pin:
+                self._pinned[key] = digest
+            else:
+                self._keys[key] = digest
+            if self.hot_entries is not None:
+                self._touch(digest)
+            self._evict()
+
+    def _touch(self, digest: bytes) -> None:
+        """Mark a record recently used, compressing the coldest expanded ones."""
+        self._hot[digest] = None
+        self._hot.move_to_end(digest)
+        while len(self._hot) > self.hot_entries:
+            cold, _ = self._hot.popitem(last=False)
+            record = self._records.get(cold)
+            if record is not None and record.compiled is not None:
+                self.bytes -= record.stored
+                record.freeze()
+                self.bytes += record.stored
+
+    def _release(self, digest: bytes) -> None:
+        record = self._records[digest]
+        record.refs -= 1
+        if not record.refs:
+            del self._records[digest]
+            self._hot.pop(digest, None)
+            self.bytes -= record.stored
+
+    def _discard(self, key: Hashable) -> None:
+        digest = self._keys.pop(key, None) or self._pinned.pop(key, None)
+        if digest is not None:
+            self._release(digest)
+
+    def _evict(self) -> None:
+        while self._keys and (
+            len(self._keys) > self.maxsize
+            or (self.max_bytes is not None and self.bytes > self.max_bytes)
+        ):
+            _, digest = self._keys.popitem(last=False)
+            self._release(digest)
+            self.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        """Remove ``key`` if present, pinned or not."""
+        with self._lock:
+            self._discard(key)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._keys.clear()
+            self._pinned.clear()
+            self._records.clear()
+            self._hot.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.bytes = 0
+
+    def info(self) -> CacheInfo:
+        """Return hit/miss/eviction counters and current size."""
+        return CacheInfo(
+            self.hits, self.misses, self.maxsize, len(self),
+            self.evictions, self.bytes, self.max_bytes, len(self._pinned),
+        )
+
+    def memory(self) -> StoreMemory:
+        """Return how much memory the stored icons take and what sharing saves."""
+        with self._lock:
+            records = list(self._records.values())
+            logical = sum(record.size * record.refs for record in records)
+            overhead = (
+                sys.getsizeof(self._keys) + sys.getsizeof(self._pinned) + sys.getsizeof(self._records)
+                + sys.getsizeof(self._hot) + sum(sys.getsizeof(record) for record in records)
+                + len(self) * (16 + sys.getsizeof(b''))
+            )
+            return StoreMemory(
+                keys=len(self),
+                records=len(records),
+                compressed=sum(record.compiled is None for record in records),
+                logical_bytes=logical,
+                unique_bytes=sum(record.size for record in records),
+                stored_bytes=self.bytes,
+                overhead_bytes=overhead,
+            )
\ No newline at end of file
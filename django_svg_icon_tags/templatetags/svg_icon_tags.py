@@ -10,17 +10,46 @@ Version: 1.0.0
 License: MIT
 """
 import re
+import asyncio
 import logging
+import threading
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatchcase
 from functools import lru_cache
+from inspect import getfullargspec
+from contextvars import ContextVar
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, List, Tuple, Union
 
+from asgiref.sync import sync_to_async
 from django import template
 from django.conf import settings
 from django.contrib.staticfiles import finders
 from django.core.cache import cache as django_cache
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.template import Context, TemplateDoesNotExist, engines
+from django.template.backends.django import DjangoTemplates
+from django.template.library import parse_bits
 from django.utils.safestring import mark_safe
-from django.utils.html import escape
+from django.utils.html import conditional_escape, escape
+
+from django_svg_icon_tags.bundle import get_icon_bundle
+from django_svg_icon_tags.cache import CacheInfo, LRUCache
+from django_svg_icon_tags.compiled import CompiledSvg, compile_svg
+from django_svg_icon_tags.instrumentation import IconStats, current_icon_stats
+from django_svg_icon_tags.optimizer import (
+    OptimizationStats, get_precision, is_optimization_enabled, optimize_svg,
+)
+from django_svg_icon_tags.registry import (
+    IconEntry, get_invalidation_mode, get_registry_mode, icon_changed, icon_registry,
+)
+from django_svg_icon_tags.sanitizer import looks_like_svg, sanitize_svg
+from django_svg_icon_tags.static_urls import hashed_icon_url
+from django_svg_icon_tags.store import IconStore, StoreMemory
+from django_svg_icon_tags.usage import get_usage_recorder, load_usage_manifest
 
 register = template.Library()
 logger = logging.getLogger(__name__)
@@ -31,12 +60,6 @@ logger = logging.getLogger(__name__)
 
 _ICON_NAME_PATTERN = re.compile(r'^[\w\-\.]+$')
 _LIBRARY_PATTERN = re.compile(r'^[a-z0-9\-_]+$')
-_XML_DECLARATION_PATTERN = re.compile(r'^<\?xml[^>]*\?>\s*')
-_SCRIPT_TAG_PATTERN = re.compile(
-    r'<script\b[^<]*(?:(?!<\/script>)<[^<]*)*<\/script>',
-    re.IGNORECASE | re.DOTALL
-)
-_EVENT_HANDLER_PATTERN = re.compile(r'on\w+\s*=', re.IGNORECASE)
 
 _FALLBACK_SVG = '''<svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
 <circle cx="12" cy="12" r="10"></circle>
@@ -44,21 +67,308 @@ _FALLBACK_SVG = '''<svg xmlns="http://www.w3.org/2000/svg" width="24" height="24
 <line x1="12" y1="16" x2="12.01" y2="16"></line>
 </svg>'''
 
+_SAFE_SVG_ATTRS = frozenset({
+    'viewBox', 'preserveAspectRatio', 'style',
+    'fill-rule', 'clip-rule', 'stroke-width',
+    'stroke-linecap', 'stroke-linejoin'
+})
+
 _USE_DJANGO_CACHE = not settings.DEBUG
 _CACHE_TIMEOUT = getattr(settings, 'SVG_ICON_CACHE_TIMEOUT', 60 * 60 * 24 * 30)
+# Bump whenever the shape or sanitization of shared-cache values changes, so
+# entries written by older releases are never read back.
+_SHARED_CACHE_VERSION = 3
+
+_svg_cache: Optional[IconStore] = None
+_pinned_libraries: frozenset = frozenset()
+_render_cache: Optional[LRUCache] = None
+_render_generation = 0
+_url_cache: Optional[LRUCache] = None
+_miss_cache: Optional[LRUCache] = None
+_miss_timeout = 0.0
+_fallback_log: Optional[LRUCache] = None
+_load_pool: Optional[ThreadPoolExecutor] = None
+_load_pool_lock = threading.Lock()
+
+_SPRITE_CONTEXT_KEY = '_svg_icon_sprite'
+_sprite_symbols: ContextVar[Optional[Dict[str, Tuple[str, Optional[str]]]]] = ContextVar(
+    'svg_icon_sprite_symbols', default=None
+)
+
+
+# ============================================================================
+# Process-Local Icon Cache
+# ============================================================================
+
+def _get_svg_cache() -> IconStore:
+    """
+    Return the compiled-icon store configured from settings.
+    
+    Settings:
+        SVG_ICON_CACHE_MAX_ENTRIES: Maximum number of unpinned icons (default 4096)
+        SVG_ICON_CACHE_MAX_BYTES: Optional bound on the cached markup size
+        SVG_ICON_CACHE_PIN_LIBRARIES: Libraries whose icons are never evicted
+        SVG_ICON_CACHE_COMPRESS: Keep cold icons zlib-compressed (default False)
+        SVG_ICON_CACHE_HOT_ENTRIES: Icons kept expanded when compressing (default 256)
+    """
+    global _svg_cache, _pinned_libraries
+    if _svg_cache is None:
+        _pinned_libraries = frozenset(getattr(settings, 'SVG_ICON_CACHE_PIN_LIBRARIES', ()))
+        compress = getattr(settings, 'SVG_ICON_CACHE_COMPRESS', False)
+        _svg_cache = IconStore(
+            getattr(settings, 'SVG_ICON_CACHE_MAX_ENTRIES', 4096),
+            max_bytes=getattr(settings, 'SVG_ICON_CACHE_MAX_BYTES', None),
+            hot_entries=getattr(settings, 'SVG_ICON_CACHE_HOT_ENTRIES', 256) if compress else None,
+        )
+    return _svg_cache
+
+
+def _cache_icon(local_key: Tuple[str, float], library: Optional[str], svg_content: CompiledSvg) -> None:
+    """Store a compiled icon locally, pinning it if its library is pinned."""
+    _get_svg_cache().set(local_key, svg_content, pin=library in _pinned_libraries)
+
+
+def icon_cache_info() -> CacheInfo:
+    """Return hits, misses, evictions and size of the compiled-icon cache."""
+    return _get_svg_cache().info()
+
+
+def icon_memory_report() -> StoreMemory:
+    """Return the memory held by compiled icons and what sharing and compression save."""
+    return _get_svg_cache().memory()
+
+
+def clear_icon_cache() -> None:
+    """Drop all compiled icons held by this process."""
+    _get_svg_cache().clear()
+
+
+def warm_icon_cache(libraries: Optional[Iterable[str]] = None) -> int:
+    """
+    Load every registered icon of the given libraries into the local cache.
+    
+    Args:
+        libraries: Library names to load; None loads every registered icon
+        
+    Returns:
+        int: Number of icons cached
+    """
+    wanted = None if libraries is None else set(libraries)
+    return prefetch_icons(
+        (name, library) for (library, name), _ in icon_registry.items()
+        if wanted is None or library in wanted
+    )
+
+
+def _matches_preload_pattern(pattern: str, library: Optional[str], name: str) -> bool:
+    """Match ``"library-glob"`` or ``"library-glob:name-glob"`` against an icon."""
+    library_pattern, _, name_pattern = pattern.partition(':')
+    return fnmatchcase(library or '', library_pattern) and fnmatchcase(name, name_pattern or '*')
+
+
+def preload_icons(patterns: Iterable[str]) -> int:
+    """
+    Load, sanitize and cache every registered icon matching the patterns.
+    
+    Args:
+        patterns: Library names or globs (``"bootstrap"``, ``"heroicons-*"``),
+            optionally with a name glob (``"bootstrap:arrow-*"``)
+        
+    Returns:
+        int: Number of icons cached
+    """
+    patterns = list(patterns)
+    started = time.perf_counter()
+    matched = [
+        (name, library) for (library, name), _ in icon_registry.items()
+        if any(_matches_preload_pattern(pattern, library, name) for pattern in patterns)
+    ]
+    count = prefetch_icons(matched)
+    logger.info(
+        f"Preloaded {count} SVG icons matching {patterns} "
+        f"in {(time.perf_counter() - started) * 1000:.1f} ms"
+    )
+    return count
+
+
+def preload_used_icons(path: Optional[str] = None) -> int:
+    """
+    Load, sanitize and cache the icons listed in a used-icon manifest.
+    
+    Args:
+        path: Manifest written by ``scan_svg_icons``, defaults to
+            SVG_ICON_USAGE_MANIFEST
+        
+    Returns:
+        int: Number of icons cached
+    """
+    started = time.perf_counter()
+    try:
+        used = load_usage_manifest(path)
+    except (OSError, ValueError, KeyError) as e:
+        logger.error(f"Failed to load SVG icon usage manifest: {e}")
+        return 0
+    count = prefetch_icons((name, library) for library, name in used)
+    logger.info(
+        f"Preloaded {count} used SVG icons "
+        f"in {(time.perf_counter() - started) * 1000:.1f} ms"
+    )
+    return count
+
+
+def optimization_report(libraries: Optional[Iterable[str]] = None) -> Dict[Optional[str], OptimizationStats]:
+    """
+    Measure what the optimization pass saves on every registered icon.
+    
+    Icons are read and sanitized from disk regardless of SVG_ICON_OPTIMIZE,
+    so the report can be produced before enabling it.
+    
+    Args:
+        libraries: Library names to measure; None measures every library
+        
+    Returns:
+        dict: Library name to sanitized vs. optimized byte counts
+    """
+    wanted = None if libraries is None else set(libraries)
+    precision = get_precision()
+    report: Dict[Optional[str], OptimizationStats] = {}
+    for (library, name), entry in icon_registry.items():
+        if wanted is not None and library not in wanted:
+            continue
+        content = _read_svg_file(entry.path)
+        if content is None:
+            continue
+        stats = report.get(library, OptimizationStats())
+        report[library] = stats.add(content, optimize_svg(content, precision))
+    return report
+
+
+@receiver(setting_changed)
+def _reset_svg_cache(*, setting, **kwargs):
+    global _svg_cache
+    if setting.startswith(('SVG_ICON_CACHE_', 'SVG_ICON_OPTIMIZE')):
+        _svg_cache = None
+
+
+# ============================================================================
+# Rendered Output Memoization
+# ============================================================================
+
+def _get_render_cache() -> LRUCache:
+    """Return the rendered-output LRU, sized by SVG_ICON_RENDER_CACHE_SIZE."""
+    global _render_cache
+    if _render_cache is None:
+        _render_cache = LRUCache(getattr(settings, 'SVG_ICON_RENDER_CACHE_SIZE', 1024))
+    return _render_cache
+
+
+def render_cache_info() -> CacheInfo:
+    """Return hit/miss statistics for the rendered-output cache."""
+    return _get_render_cache().info()
+
+
+def clear_render_cache() -> None:
+    """Drop all memoized icon markup, including markup folded into templates."""
+    global _render_generation
+    _get_render_cache().clear()
+    _render_generation += 1
+
+
+def render_generation() -> int:
+    """Return a counter that changes whenever memoized icon markup may be stale."""
+    return _render_generation
+
+
+@receiver(setting_changed)
+def _reset_render_cache(*, setting, **kwargs):
+    """Rendered markup depends on static and icon settings."""
+    global _render_cache, _render_generation
+    if setting.startswith(('SVG_ICON_', 'STATIC')) or setting == 'DEBUG':
+        _render_cache = None
+        _render_generation += 1
+
+
+def _get_url_cache() -> LRUCache:
+    """Return the <img> URL memo, sized like the compiled-icon cache."""
+    global _url_cache
+    if _url_cache is None:
+        _url_cache = LRUCache(getattr(settings, 'SVG_ICON_CACHE_MAX_ENTRIES', 4096))
+    return _url_cache
+
+
+@receiver(setting_changed)
+def _reset_url_cache(*, setting, **kwargs):
+    """URLs depend on the static storage and icon URL settings."""
+    global _url_cache
+    if setting.startswith(('SVG_ICON_', 'STATIC')) or setting == 'STORAGES':
+        _url_cache = None
+
+
+def _get_miss_cache() -> LRUCache:
+    """
+    Return the negative lookup cache for icons that were not found.
+    
+    Settings:
+        SVG_ICON_MISS_CACHE_SIZE: Maximum number of remembered misses (default 1024)
+        SVG_ICON_MISS_CACHE_TIMEOUT: Seconds a miss is remembered (default 60, 0 disables)
+    """
+    global _miss_cache, _miss_timeout
+    if _miss_cache is None:
+        _miss_timeout = float(getattr(settings, 'SVG_ICON_MISS_CACHE_TIMEOUT', 60))
+        _miss_cache = LRUCache(
+            getattr(settings, 'SVG_ICON_MISS_CACHE_SIZE', 1024) if _miss_timeout > 0 else 0,
+            sizeof=lambda expires: 0,
+        )
+    return _miss_cache
+
+
+def miss_cache_info() -> CacheInfo:
+    """Return hit/miss statistics for the negative lookup cache."""
+    return _get_miss_cache().info()
+
+
+@receiver(setting_changed)
+def _reset_miss_cache(*, setting, **kwargs):
+    """Misses depend on where icons are looked up."""
+    global _miss_cache, _fallback_log
+    if setting.startswith(('SVG_ICON_', 'STATIC')) or setting == 'INSTALLED_APPS':
+        _miss_cache = None
+        _fallback_log = None
+
+
+@receiver(icon_changed)
+def _invalidate_changed_icon(*, key, old, **kwargs):
+    """
+    Drop a changed icon from the local caches.
+
+    Rendered and folded markup is keyed on the icon's entry, so only
+    output of the changed icon goes stale.
+    """
+    if old is not None:
+        _get_svg_cache().delete(tuple(old))
+    _get_miss_cache().delete(key)
+
+
+def _render_cache_key(entry: IconEntry, *args: Any) -> Optional[tuple]:
+    """Build a hashable memoization key, or None if an argument is unhashable."""
+    *args, extra_attrs = args
+    if extra_attrs:
+        extra_attrs = tuple(sorted(extra_attrs.items()))
+    key = (entry.path, entry.mtime, *args, extra_attrs)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
 
 
 def _sanitize_svg_content(content: str) -> str:
-    """Basic SVG sanitization for defense-in-depth."""
-    content = _XML_DECLARATION_PATTERN.sub('', content)
-    content = _SCRIPT_TAG_PATTERN.sub('', content)
-    content = _EVENT_HANDLER_PATTERN.sub('', content)
-    return content.strip()
+    """Allowlist-based SVG sanitization for defense-in-depth."""
+    return sanitize_svg(content)
 
 
-@lru_cache(maxsize=256)
-def _get_cached_svg_content(filepath: str, mtime: float) -> Optional[str]:
-    """Read and sanitize SVG content with LRU caching."""
+def _read_svg_file(filepath: str) -> Optional[str]:
+    """Read, validate and sanitize an SVG file."""
     try:
         path = Path(filepath)
         if not path.exists() or not path.is_file():
@@ -67,7 +377,7 @@ def _get_cached_svg_content(filepath: str, mtime: float) -> Optional[str]:
         
         content = path.read_text(encoding='utf-8').strip()
         
-        if not content.startswith('<svg') and 'xmlns="http://www.w3.org/2000/svg"' not in content:
+        if not looks_like_svg(content):
             logger.warning(f"Invalid SVG structure: {filepath}")
             return None
         
@@ -78,20 +388,125 @@ def _get_cached_svg_content(filepath: str, mtime: float) -> Optional[str]:
         return None
 
 
+def _compile_svg_file(filepath: str) -> Optional[CompiledSvg]:
+    """Read, sanitize, optionally optimize and compile an SVG file without caching."""
+    content = _read_svg_file(filepath)
+    if content is None:
+        return None
+    
+    if is_optimization_enabled():
+        content = optimize_svg(content, get_precision())
+    
+    compiled = compile_svg(content)
+    if compiled is None:
+        logger.warning(f"Invalid SVG structure: {filepath}")
+    return compiled
+
+
+def _shared_cache_key(name: str, library: Optional[str], mtime: float) -> str:
+    """Django cache key for a compiled icon."""
+    variant = f":opt{get_precision()}" if is_optimization_enabled() else ""
+    return f"svg_icon:v{_SHARED_CACHE_VERSION}:{library or 'default'}:{name}:{mtime}{variant}"
+
+
+def _from_shared_cache(value: Any) -> Optional[CompiledSvg]:
+    """Return a value read from the Django cache, or ``None`` if it is not a compiled icon."""
+    return value if isinstance(value, CompiledSvg) else None
+
+
+def _get_cached_svg_content(
+    filepath: str,
+    mtime: float,
+    cache_key: Optional[str] = None,
+    library: Optional[str] = None,
+    stats: Optional[IconStats] = None,
+) -> Optional[CompiledSvg]:
+    """
+    Load a compiled icon through the cache tiers.
+    
+    The process-local LRU is checked first, then the Django cache (only
+    when ``cache_key`` is given), then the file itself. Lower tiers are
+    back-filled on the way out. The tier that answered is counted in
+    ``stats`` when given.
+    """
+    local_key = (filepath, mtime)
+    svg_content = _get_svg_cache().get(local_key)
+    if svg_content is not None:
+        if stats is not None:
+            stats.local_hits += 1
+        return svg_content
+    
+    if cache_key is not None:
+        svg_content = _from_shared_cache(django_cache.get(cache_key))
+    if svg_content is None:
+        svg_content = _compile_svg_file(filepath)
+        if svg_content is None:
+            return None
+        if stats is not None:
+            stats.disk_loads += 1
+        if cache_key is not None:
+            django_cache.set(cache_key, svg_content, _CACHE_TIMEOUT)
+    elif stats is not None:
+        stats.shared_hits += 1
+    
+    _cache_icon(local_key, library, svg_content)
+    return svg_content
+
+
+def _is_valid_icon(name: str, library: Optional[str] = None) -> bool:
+    """Validate icon and library names against the security patterns."""
+    if library and not _LIBRARY_PATTERN.match(library):
+        logger.warning(f"Invalid library name: {library}")
+        return False
+    if not _ICON_NAME_PATTERN.match(name):
+        logger.warning(f"Invalid icon name: {name}")
+        return False
+    return True
+
+
+def _split_library(name: str, library: Optional[str] = None) -> Tuple[str, Optional[str]]:
+    """Split ``"library:name"`` shorthand when no explicit library is given."""
+    if ":" in name and library is None:
+        parts = name.split(":", 1)
+        if len(parts) == 2:
+            lib_part, name_part = parts
+            if _LIBRARY_PATTERN.match(lib_part) and _ICON_NAME_PATTERN.match(name_part):
+                library, name = lib_part, name_part
+    return name, library
+
+
+def is_valid_library(library: str) -> bool:
+    """Return whether ``library`` is a safe library name."""
+    return bool(_LIBRARY_PATTERN.match(library))
+
+
+def parse_icon_spec(icon_spec: Union[str, Tuple[str, Optional[str]]]) -> Tuple[str, Optional[str]]:
+    """Normalize ``"name"``, ``"library:name"`` or ``(name, library)`` to a ``(name, library)`` pair."""
+    if isinstance(icon_spec, str):
+        return _split_library(icon_spec)
+    name, library = icon_spec
+    return _split_library(name, library)
+
+
 def _find_icon_path(name: str, library: Optional[str] = None) -> Optional[str]:
     """Locate icon file with library support."""
-    if library:
-        if not _LIBRARY_PATTERN.match(library):
-            logger.warning(f"Invalid library name: {library}")
+    if not _is_valid_icon(name, library):
+        return None
+
+    # Remember misses so a typo in a hot template does not rescan every finder.
+    miss_cache = _get_miss_cache()
+    miss_key = (library, name)
+    expires = miss_cache.get(miss_key)
+    if expires is not None:
+        if expires > time.monotonic():
             return None
+        miss_cache.delete(miss_key)
+
+    if library:
         search_path = f"icons/{library}/{name}.svg"
     else:
         search_path = f"icons/{name}.svg"
     
-    if not _ICON_NAME_PATTERN.match(name):
-        logger.warning(f"Invalid icon name: {name}")
-        return None
-    
     found = finders.find(search_path)
     if found:
         return found
@@ -102,9 +517,172 @@ def _find_icon_path(name: str, library: Optional[str] = None) -> Optional[str]:
             if full_path.exists() and full_path.is_file():
                 return str(full_path)
     
+    miss_cache.set(miss_key, time.monotonic() + _miss_timeout)
     return None
 
 
+def _resolve_icon(name: str, library: Optional[str] = None) -> Optional[IconEntry]:
+    """Resolve an icon to its file path and mtime, using the bundle and registry when enabled."""
+    if not _is_valid_icon(name, library):
+        return None
+    return _resolve_valid_icon(name, library)
+
+
+def _resolve_valid_icon(name: str, library: Optional[str] = None) -> Optional[IconEntry]:
+    """Resolve an icon whose name and library were already validated."""
+    bundle = get_icon_bundle()
+    if bundle is not None and (library, name) in bundle:
+        return IconEntry(bundle.path, bundle.mtime)
+
+    if not get_registry_mode():
+        icon_path = _find_icon_path(name, library)
+        if not icon_path:
+            return None
+        return IconEntry(icon_path, Path(icon_path).stat().st_mtime)
+
+    entry = icon_registry.get(name, library)
+    if get_invalidation_mode() != 'stat':
+        return entry
+
+    # Pick up icons added or edited after the index was built.
+    if entry is None:
+        icon_path = _find_icon_path(name, library)
+        return icon_registry.add(name, library, icon_path) if icon_path else None
+    try:
+        return entry._replace(mtime=Path(entry.path).stat().st_mtime)
+    except OSError:
+        return None
+
+
+def _load_icon(
+    name: str,
+    library: Optional[str],
+    entry: IconEntry,
+    stats: Optional[IconStats] = None,
+) -> Optional[CompiledSvg]:
+    """Load the compiled icon for a resolved entry through the caches."""
+    bundle = get_icon_bundle()
+    if bundle is not None and entry.path == bundle.path:
+        if stats is not None:
+            stats.bundle_hits += 1
+        return bundle.get(name, library)
+    
+    icon_path, file_mtime = entry
+    cache_key = _shared_cache_key(name, library, file_mtime) if _USE_DJANGO_CACHE else None
+    return _get_cached_svg_content(icon_path, file_mtime, cache_key, library, stats)
+
+
+def resolve_icon(name: str, library: Optional[str] = None) -> Optional[IconEntry]:
+    """
+    Resolve an icon to the file that currently backs it.
+    
+    In ``'stat'`` invalidation mode the returned mtime is read from disk,
+    so it changes as soon as the file is edited; it can be used to tell
+    whether anything derived from the icon is still current.
+    
+    Args:
+        name: Icon name, optionally as ``"library:name"``
+        library: Library name
+        
+    Returns:
+        IconEntry: ``(path, mtime)``, or None if the icon does not exist
+    """
+    return _resolve_icon(*_split_library(name, library))
+
+
+def get_icon(name: str, library: Optional[str] = None) -> Optional[CompiledSvg]:
+    """
+    Load a compiled icon through the caches.
+    
+    Args:
+        name: Icon name, optionally as ``"library:name"``
+        library: Library name
+        
+    Returns:
+        CompiledSvg: The icon, or None if it cannot be found or loaded
+    """
+    name, library = _split_library(name, library)
+    entry = _resolve_icon(name, library)
+    return _load_icon(name, library, entry) if entry is not None else None
+
+
+def prefetch_icons(icons: Iterable[Union[str, Tuple[str, Optional[str]]]]) -> int:
+    """
+    Warm the process-local cache for many icons at once.
+    
+    Icons missing locally are fetched from the Django cache with a single
+    ``get_many`` call; the rest are read from disk and written back with
+    a single ``set_many``.
+    
+    Args:
+        icons: Icon names (``"name"`` or ``"library:name"``) or
+            ``(name, library)`` pairs
+        
+    Returns:
+        int: Number of requested icons that are now cached
+    """
+    resolved = {}
+    for icon_spec in icons:
+        name, library = parse_icon_spec(icon_spec)
+        if (name, library) not in resolved:
+            resolved[name, library] = _resolve_icon(name, library)
+    return _prefetch_entries(resolved)
+
+
+def _pending_entries(
+    resolved: Dict[Tuple[str, Optional[str]], Optional[IconEntry]],
+) -> Tuple[int, Dict[Tuple[str, float], Tuple[str, Optional[str]]]]:
+    """Split resolved entries into the number already warm and those still to load."""
+    bundle = get_icon_bundle()
+    svg_cache = _get_svg_cache()
+    pending: Dict[Tuple[str, float], Tuple[str, Optional[str]]] = {}
+    warm = 0
+    for (name, library), entry in resolved.items():
+        if entry is None:
+            continue
+        if (bundle is not None and entry.path == bundle.path) or entry in svg_cache:
+            warm += 1
+        else:
+            pending.setdefault(tuple(entry), (name, library))
+    return warm, pending
+
+
+def _prefetch_entries(resolved: Dict[Tuple[str, Optional[str]], Optional[IconEntry]]) -> int:
+    """Batch-load resolved ``(name, library) -> entry`` pairs into the local cache."""
+    warm, pending = _pending_entries(resolved)
+    if not pending:
+        return warm
+    
+    found = {}
+    if _USE_DJANGO_CACHE:
+        keys = {
+            _shared_cache_key(name, library, local_key[1]): local_key
+            for local_key, (name, library) in pending.items()
+        }
+        for cache_key, svg_content in django_cache.get_many(list(keys)).items():
+            svg_content = _from_shared_cache(svg_content)
+            if svg_content is not None:
+                found[keys[cache_key]] = svg_content
+        
+        missing = {}
+        for cache_key, local_key in keys.items():
+            if local_key not in found:
+                svg_content = _compile_svg_file(local_key[0])
+                if svg_content is not None:
+                    found[local_key] = missing[cache_key] = svg_content
+        if missing:
+            django_cache.set_many(missing, _CACHE_TIMEOUT)
+    else:
+        for local_key in pending:
+            svg_content = _compile_svg_file(local_key[0])
+            if svg_content is not None:
+                found[local_key] = svg_content
+    
+    for local_key, svg_content in found.items():
+        _cache_icon(local_key, pending[local_key][1], svg_content)
+    return warm + len(found)
+
+
 def _render_as_img(
     name: str,
     library: Optional[str],
@@ -113,16 +691,12 @@ def _render_as_img(
     title: Optional[str],
     width: Optional[str],
     height: Optional[str],
-    extra_attrs: Optional[Dict[str, Any]]
+    extra_attrs: Optional[Dict[str, Any]],
+    static_url: Optional[str] = None,
 ) -> str:
     """Render icon as <img> tag."""
-    from django.templatetags.static import static
-    
-    path_parts = ["icons"]
-    if library:
-        path_parts.append(library)
-    path_parts.append(f"{name}.svg")
-    static_url = static("/".join(path_parts))
+    if static_url is None:
+        static_url = hashed_icon_url(name, library)
     
     attrs = {
         'src': static_url,
@@ -149,66 +723,101 @@ def _render_as_img(
     return mark_safe(f'<img {attr_str}>')
 
 
-def _process_inline_svg(
-    svg_content: str,
+def _icon_url(name: str, library: Optional[str], entry: IconEntry, svg_content: CompiledSvg) -> str:
+    """Return the memoized, content-hashed <img> URL for a resolved icon."""
+    url_cache = _get_url_cache()
+    key = (name, library, entry.path, entry.mtime)
+    url = url_cache.get(key)
+    if url is None:
+        bundle = get_icon_bundle()
+        if bundle is not None and entry.path == bundle.path:
+            url = hashed_icon_url(name, library, content=svg_content.render())
+        else:
+            url = hashed_icon_url(name, library, path=entry.path)
+        url_cache.set(key, url)
+    return url
+
+
+def _build_svg_attrs(
     class_name: str,
     aria_label: Optional[str],
-    title: Optional[str],
     width: Optional[str],
     height: Optional[str],
     fill: Optional[str],
     stroke: Optional[str],
     extra_attrs: Optional[Dict[str, Any]]
-) -> str:
-    """Inject attributes into SVG with escaping."""
+) -> Dict[str, str]:
+    """Build the escaped root attributes to inject into an SVG."""
     inject_attrs = {}
     
     if class_name:
-        inject_attrs['class'] = class_name.strip()
+        inject_attrs['class'] = escape(class_name.strip())
     if width:
-        inject_attrs['width'] = str(width)
+        inject_attrs['width'] = escape(str(width))
     if height:
-        inject_attrs['height'] = str(height)
+        inject_attrs['height'] = escape(str(height))
     if fill:
-        inject_attrs['fill'] = fill
+        inject_attrs['fill'] = escape(fill)
     if stroke:
-        inject_attrs['stroke'] = stroke
+        inject_attrs['stroke'] = escape(stroke)
     
     if aria_label:
-        inject_attrs['aria-label'] = aria_label
+        inject_attrs['aria-label'] = escape(aria_label)
         inject_attrs['role'] = 'img'
         inject_attrs['focusable'] = 'false'
     
-    SAFE_SVG_ATTRS = {
-        'viewBox', 'preserveAspectRatio', 'style', 
-        'fill-rule', 'clip-rule', 'stroke-width',
-        'stroke-linecap', 'stroke-linejoin'
-    }
     if extra_attrs:
         for key, val in extra_attrs.items():
-            if key in SAFE_SVG_ATTRS and val is not None:
-                inject_attrs[key] = str(val)
+            if key in _SAFE_SVG_ATTRS and val is not None:
+                inject_attrs[key] = escape(str(val))
     
+    return inject_attrs
+
+
+def _build_title(title: Optional[str], aria_label: Optional[str]) -> str:
+    """Return the escaped <title> element, unless aria_label takes precedence."""
     if title and not aria_label:
-        safe_title = escape(title)
-        svg_start = svg_content.find('<svg')
-        if svg_start != -1:
-            first_close = svg_content.find('>', svg_start)
-            if first_close != -1:
-                svg_content = (
-                    svg_content[:first_close + 1] +
-                    f'<title>{safe_title}</title>' +
-                    svg_content[first_close + 1:]
-                )
-    
-    if inject_attrs:
-        attr_str = ' '.join(
-            f'{escape(k)}="{escape(str(v))}"' 
-            for k, v in inject_attrs.items()
-        )
-        svg_content = svg_content.replace('<svg', f'<svg {attr_str}', 1)
-    
-    return mark_safe(svg_content)
+        return f'<title>{escape(title)}</title>'
+    return ''
+
+
+def _process_inline_svg(
+    svg_content: CompiledSvg,
+    class_name: str,
+    aria_label: Optional[str],
+    title: Optional[str],
+    width: Optional[str],
+    height: Optional[str],
+    fill: Optional[str],
+    stroke: Optional[str],
+    extra_attrs: Optional[Dict[str, Any]]
+) -> str:
+    """Inject escaped attributes and title into a compiled SVG."""
+    inject_attrs = _build_svg_attrs(
+        class_name, aria_label, width, height, fill, stroke, extra_attrs
+    )
+    return mark_safe(svg_content.render(inject_attrs, _build_title(title, aria_label)))
+
+
+def _render_as_sprite_use(
+    svg_content: CompiledSvg,
+    symbol_id: str,
+    class_name: str,
+    aria_label: Optional[str],
+    title: Optional[str],
+    width: Optional[str],
+    height: Optional[str],
+    fill: Optional[str],
+    stroke: Optional[str],
+    extra_attrs: Optional[Dict[str, Any]]
+) -> str:
+    """Render icon as <svg><use href="#symbol"/></svg>."""
+    inject_attrs = _build_svg_attrs(
+        class_name, aria_label, width, height, fill, stroke, extra_attrs
+    )
+    return mark_safe(svg_content.render_use(
+        symbol_id, inject_attrs, _build_title(title, aria_label)
+    ))
 
 
 def _get_fallback(use_fallback: bool, message: str = "") -> str:
@@ -220,11 +829,32 @@ def _get_fallback(use_fallback: bool, message: str = "") -> str:
     if not use_fallback:
         return ''
     
-    logger.warning(f"Using fallback icon: {message}")
+    _log_fallback(message)
     return mark_safe(_FALLBACK_SVG)
 
 
-@register.simple_tag
+def _log_fallback(message: str) -> None:
+    """
+    Log a fallback at most once per message and interval.
+    
+    Settings:
+        SVG_ICON_FALLBACK_LOG_INTERVAL: Seconds between repeated warnings (default 60)
+    """
+    global _fallback_log
+    if _fallback_log is None:
+        _fallback_log = LRUCache(256)
+    
+    now = time.monotonic()
+    state = _fallback_log.get(message)
+    if state is not None and state[0] > now:
+        state[1] += 1
+        return
+    
+    suppressed = f" (repeated {state[1]} more times)" if state is not None and state[1] else ""
+    logger.warning(f"Using fallback icon: {message}{suppressed}")
+    _fallback_log.set(message, [now + getattr(settings, 'SVG_ICON_FALLBACK_LOG_INTERVAL', 60), 0])
+
+
 def svg_icon(
     name: str,
     library: Optional[str] = None,
@@ -238,6 +868,7 @@ def svg_icon(
     extra_attrs: Optional[Dict[str, Any]] = None,
     inline: bool = True,
     fallback: bool = True,
+    sprite: bool = False,
 ) -> str:
     """
     Render SVG icon with multi-library support.
@@ -255,6 +886,7 @@ def svg_icon(
         extra_attrs: Additional attributes (whitelist validated)
         inline: Render as inline SVG (True) or <img> tag (False)
         fallback: Show fallback on error
+        sprite: Render a <use> reference to a symbol emitted by {% svg_sprite %}
         
     Returns:
         Safe HTML string containing the icon
@@ -262,55 +894,780 @@ def svg_icon(
     if not name or not isinstance(name, str):
         return _get_fallback(fallback, "Invalid icon name")
     
-    if ":" in name and library is None:
-        parts = name.split(":", 1)
-        if len(parts) == 2:
-            lib_part, name_part = parts
-            if _LIBRARY_PATTERN.match(lib_part) and _ICON_NAME_PATTERN.match(name_part):
-                library, name = lib_part, name_part
+    name, library = _split_library(name, library)
+    
+    entry = _resolve_icon(name, library)
+    return _render_icon(
+        name, library, entry, class_name, aria_label, title, width, height,
+        fill, stroke, extra_attrs, inline, fallback, sprite
+    )
+
+
+def _render_icon(
+    name: str,
+    library: Optional[str],
+    entry: Optional[IconEntry],
+    class_name: str = "",
+    aria_label: Optional[str] = None,
+    title: Optional[str] = None,
+    width: Optional[str] = None,
+    height: Optional[str] = None,
+    fill: Optional[str] = None,
+    stroke: Optional[str] = None,
+    extra_attrs: Optional[Dict[str, Any]] = None,
+    inline: bool = True,
+    fallback: bool = True,
+    sprite: bool = False,
+) -> str:
+    """Render an already resolved icon; see svg_icon() for the arguments."""
+    stats = current_icon_stats()
+    if stats is None:
+        return _render_icon_markup(
+            name, library, entry, class_name, aria_label, title, width, height,
+            fill, stroke, extra_attrs, inline, fallback, sprite
+        )
     
-    icon_path = _find_icon_path(name, library)
-    if not icon_path:
+    started = time.perf_counter()
+    rendered = _render_icon_markup(
+        name, library, entry, class_name, aria_label, title, width, height,
+        fill, stroke, extra_attrs, inline, fallback, sprite, stats
+    )
+    stats.duration += time.perf_counter() - started
+    stats.icons += 1
+    stats.bytes += len(rendered.encode('utf-8'))
+    return rendered
+
+
+def _render_icon_markup(
+    name: str,
+    library: Optional[str],
+    entry: Optional[IconEntry],
+    class_name: str = "",
+    aria_label: Optional[str] = None,
+    title: Optional[str] = None,
+    width: Optional[str] = None,
+    height: Optional[str] = None,
+    fill: Optional[str] = None,
+    stroke: Optional[str] = None,
+    extra_attrs: Optional[Dict[str, Any]] = None,
+    inline: bool = True,
+    fallback: bool = True,
+    sprite: bool = False,
+    stats: Optional[IconStats] = None,
+) -> str:
+    """Render an already resolved icon, counting cache tiers in ``stats`` when given."""
+    if not entry:
+        if stats is not None:
+            stats.fallbacks += 1
         msg = f"Icon '{name}'"
         if library:
             msg += f" in library '{library}'"
         msg += " not found"
         return _get_fallback(fallback, msg)
     
-    file_mtime = Path(icon_path).stat().st_mtime
+    if sprite and inline:
+        _record_sprite_symbol(name, library)
+    recorder = get_usage_recorder()
+    if recorder is not None:
+        recorder.record(name, library)
+    if stats is not None:
+        if not inline:
+            stats.img += 1
+        elif sprite:
+            stats.sprite += 1
+        else:
+            stats.inline += 1
     
-    if _USE_DJANGO_CACHE:
-        cache_key = f"svg_icon:{library or 'default'}:{name}:{file_mtime}"
-        svg_content = django_cache.get(cache_key)
-        if svg_content is None:
-            svg_content = _get_cached_svg_content(icon_path, file_mtime)
-            if svg_content:
-                django_cache.set(cache_key, svg_content, _CACHE_TIMEOUT)
-    else:
-        svg_content = _get_cached_svg_content(icon_path, file_mtime)
+    render_cache = _get_render_cache()
+    memo_key = None
+    if render_cache.maxsize:
+        memo_key = _render_cache_key(
+            entry, name, library, class_name, aria_label, title,
+            width, height, fill, stroke, inline, sprite, fallback, extra_attrs
+        )
+        if memo_key is not None:
+            rendered = render_cache.get(memo_key)
+            if rendered is not None:
+                if stats is not None:
+                    stats.render_hits += 1
+                return rendered
     
+    svg_content = _load_icon(name, library, entry, stats)
     if not svg_content:
+        if stats is not None:
+            stats.fallbacks += 1
         return _get_fallback(fallback, f"Error processing icon '{name}'")
     
     if not inline:
-        return _render_as_img(
+        rendered = _render_as_img(
             name, library, class_name, aria_label, title,
-            width, height, extra_attrs
+            width, height, extra_attrs, _icon_url(name, library, entry, svg_content)
+        )
+    elif sprite:
+        rendered = _render_as_sprite_use(
+            svg_content, _sprite_symbol_id(name, library), class_name,
+            aria_label, title, width, height, fill, stroke, extra_attrs
+        )
+    else:
+        rendered = _process_inline_svg(
+            svg_content, class_name, aria_label, title,
+            width, height, fill, stroke, extra_attrs
         )
     
-    return _process_inline_svg(
-        svg_content, class_name, aria_label, title,
-        width, height, fill, stroke, extra_attrs
+    if memo_key is not None:
+        render_cache.set(memo_key, rendered)
+    return rendered
+
+
+class SvgIconNode(template.Node):
+    """
+    Compiled ``{% svg_icon %}`` tag.
+    
+    Literal arguments are resolved once when the template is compiled. A
+    literal icon name is split and validated up front, and when every
+    argument is literal the rendered markup itself is kept on the node
+    and reused until icon settings or caches change, or the icon's own
+    registry entry does.
+    """
+    
+    def __init__(
+        self,
+        constants: Dict[str, Any],
+        variables: Dict[str, template.base.FilterExpression],
+        target_var: Optional[str] = None,
+    ):
+        self.constants = constants
+        self.variables = variables
+        self.target_var = target_var
+        self.icon: Optional[Tuple[str, Optional[str]]] = None
+        self._folded: Optional[Tuple[int, Optional[IconEntry], str]] = None
+        
+        name = constants.get('name')
+        if 'library' not in variables and name and isinstance(name, str):
+            name, library = _split_library(name, constants.get('library'))
+            if _is_valid_icon(name, library):
+                self.icon = (name, library)
+    
+    def render(self, context: template.Context) -> str:
+        options = dict(self.constants)
+        for key, expression in self.variables.items():
+            options[key] = expression.resolve(context)
+        
+        if self.icon is None:
+            output = _call_with_sprite_context(context, svg_icon, **options)
+        elif self.variables:
+            output = self._render_icon(context, options)
+        else:
+            output = self._render_folded(context, options)
+        
+        if context.autoescape:
+            output = conditional_escape(output)
+        if self.target_var:
+            context[self.target_var] = output
+            return ''
+        return output
+    
+    def _render_icon(self, context: template.Context, options: Dict[str, Any]) -> str:
+        name, library = self.icon
+        options.pop('name')
+        options.pop('library', None)
+        entry = _resolve_valid_icon(name, library)
+        return self._render_entry(context, options, entry)
+    
+    def _render_entry(self, context: template.Context, options: Dict[str, Any], entry: Optional[IconEntry]) -> str:
+        name, library = self.icon
+        return _call_with_sprite_context(context, _render_icon, name, library, entry, **options)
+    
+    def _render_folded(self, context: template.Context, options: Dict[str, Any]) -> str:
+        # Per-render stat() and per-call lookups must notice edited icons.
+        if not get_registry_mode() or get_invalidation_mode() == 'stat':
+            return self._render_icon(context, options)
+        
+        name, library = self.icon
+        # Without 'stat' this is an index lookup, and it changes only when
+        # this icon does.
+        entry = _resolve_valid_icon(name, library)
+        folded = self._folded
+        if folded is not None and folded[0] == _render_generation and folded[1] == entry:
+            if options.get('sprite') and options.get('inline', True):
+                _get_context_sprite(context).setdefault(_sprite_symbol_id(name, library), (name, library))
+            stats = current_icon_stats()
+            if stats is not None:
+                stats.icons += 1
+                stats.folded += 1
+                stats.bytes += len(folded[2].encode('utf-8'))
+            return folded[2]
+        
+        generation = _render_generation
+        options.pop('name')
+        options.pop('library', None)
+        output = self._render_entry(context, options, entry)
+        self._folded = (generation, entry, output)
+        return output
+
+
+@register.tag(name='svg_icon')
+def do_svg_icon(parser: template.base.Parser, token: template.base.Token) -> SvgIconNode:
+    """
+    Compile ``{% svg_icon name [arg ...] [key=value ...] [as var] %}``.
+    
+    Accepts the same arguments as svg_icon(); see SvgIconNode.
+    """
+    bits = token.split_contents()
+    tag_name = bits.pop(0)
+    target_var = None
+    if len(bits) >= 2 and bits[-2] == 'as':
+        target_var = bits[-1]
+        bits = bits[:-2]
+    
+    params, varargs, varkw, defaults, kwonly, kwonly_defaults, _ = _SVG_ICON_ARGSPEC
+    args, kwargs = parse_bits(
+        parser, bits, params, varargs, varkw, defaults,
+        kwonly, kwonly_defaults, False, tag_name,
+    )
+    bound = dict(zip(params, args))
+    bound.update(kwargs)
+    
+    constants = {}
+    variables = {}
+    for key, expression in bound.items():
+        constant, value = _constant_value(expression)
+        if constant:
+            constants[key] = value
+        else:
+            variables[key] = expression
+    return SvgIconNode(constants, variables, target_var)
+
+
+_SVG_ICON_ARGSPEC = getfullargspec(svg_icon)
+_TEMPLATE_BUILTINS = {'True': True, 'False': False, 'None': None}
+
+
+def _constant_value(expression: template.base.FilterExpression) -> Tuple[bool, Any]:
+    """Return ``(True, value)`` for literal arguments without filters."""
+    if expression.filters:
+        return False, None
+    var = expression.var
+    if not isinstance(var, template.base.Variable):
+        return True, var
+    if var.literal is not None and not var.translate:
+        return True, var.literal
+    if var.lookups and len(var.lookups) == 1 and var.lookups[0] in _TEMPLATE_BUILTINS:
+        return True, _TEMPLATE_BUILTINS[var.lookups[0]]
+    return False, None
+
+
+def _call_with_sprite_context(context: template.Context, func, *args: Any, **kwargs: Any) -> Any:
+    """Call a renderer, recording sprite symbols on the context when ``sprite`` is set."""
+    if not kwargs.get('sprite'):
+        return func(*args, **kwargs)
+    
+    token = _sprite_symbols.set(_get_context_sprite(context))
+    try:
+        return func(*args, **kwargs)
+    finally:
+        _sprite_symbols.reset(token)
+
+
+# ============================================================================
+# Async Loading
+# ============================================================================
+
+def _get_load_pool() -> ThreadPoolExecutor:
+    """Return the thread pool async loads read files on, sized by SVG_ICON_ASYNC_WORKERS."""
+    global _load_pool
+    with _load_pool_lock:
+        if _load_pool is None:
+            _load_pool = ThreadPoolExecutor(
+                max_workers=getattr(settings, 'SVG_ICON_ASYNC_WORKERS', 4),
+                thread_name_prefix='svg-icon-load',
+            )
+        return _load_pool
+
+
+@receiver(setting_changed)
+def _reset_load_pool(*, setting, **kwargs):
+    global _load_pool
+    if setting == 'SVG_ICON_ASYNC_WORKERS':
+        with _load_pool_lock:
+            if _load_pool is not None:
+                _load_pool.shutdown(wait=False)
+            _load_pool = None
+
+
+async def _in_load_pool(func, *args: Any) -> Any:
+    """Run blocking icon I/O on the load pool without blocking the event loop."""
+    return await asyncio.get_running_loop().run_in_executor(_get_load_pool(), func, *args)
+
+
+async def _acache_call(method: str, *args: Any) -> Any:
+    """Call the async Django cache API, wrapping the sync one on Django < 4.0."""
+    async_method = getattr(django_cache, f'a{method}', None)
+    if async_method is not None:
+        return await async_method(*args)
+    return await sync_to_async(getattr(django_cache, method), thread_sensitive=False)(*args)
+
+
+async def _aresolve_icons(
+    specs: Iterable[Union[str, Tuple[str, Optional[str]]]],
+) -> Dict[Tuple[str, Optional[str]], Optional[IconEntry]]:
+    """Resolve icon specs, off the event loop when resolution may touch the disk."""
+    icons = list(dict.fromkeys(parse_icon_spec(icon_spec) for icon_spec in specs))
+    
+    def resolve() -> Dict[Tuple[str, Optional[str]], Optional[IconEntry]]:
+        return {(name, library): _resolve_icon(name, library) for name, library in icons}
+    
+    # A registry that is not built yet (lazy mode, or cleared by a settings
+    # change) would run a full finder scan on the first lookup.
+    if get_registry_mode() and icon_registry.is_built and get_invalidation_mode() != 'stat':
+        return resolve()
+    return await _in_load_pool(resolve)
+
+
+async def aget_icon(name: str, library: Optional[str] = None) -> Optional[CompiledSvg]:
+    """
+    Load a compiled icon without blocking the event loop.
+    
+    The async counterpart of the loading done by ``svg_icon``: the shared
+    cache is queried through Django's async cache API and cold files are
+    read on a bounded thread pool. The result is kept in the
+    process-local cache, so later renders are served from memory.
+    
+    Args:
+        name: Icon name, optionally as ``"library:name"``
+        library: Library name
+        
+    Returns:
+        CompiledSvg: The icon, or None if it cannot be found or loaded
+    """
+    key = _split_library(name, library)
+    entry = (await _aresolve_icons([key]))[key]
+    if entry is None:
+        return None
+    
+    name, library = key
+    bundle = get_icon_bundle()
+    if bundle is not None and entry.path == bundle.path:
+        return bundle.get(name, library)
+    
+    local_key = tuple(entry)
+    svg_content = _get_svg_cache().get(local_key)
+    if svg_content is not None:
+        return svg_content
+    
+    cache_key = _shared_cache_key(name, library, entry.mtime) if _USE_DJANGO_CACHE else None
+    if cache_key is not None:
+        svg_content = _from_shared_cache(await _acache_call('get', cache_key))
+    if svg_content is None:
+        svg_content = await _in_load_pool(_compile_svg_file, entry.path)
+        if svg_content is None:
+            return None
+        if cache_key is not None:
+            await _acache_call('set', cache_key, svg_content, _CACHE_TIMEOUT)
+    
+    _cache_icon(local_key, library, svg_content)
+    return svg_content
+
+
+async def aprefetch_icons(icons: Iterable[Union[str, Tuple[str, Optional[str]]]]) -> int:
+    """
+    Warm the process-local cache for many icons from async code.
+    
+    Like :func:`prefetch_icons`, the shared cache is queried with a single
+    ``get_many`` and written back with a single ``set_many``, but through
+    the async cache API, and the remaining files are read concurrently on
+    the load pool. Await it in an async view before rendering templates
+    so no icon load blocks the event loop.
+    
+    Args:
+        icons: Icon names (``"name"`` or ``"library:name"``) or
+            ``(name, library)`` pairs
+        
+    Returns:
+        int: Number of requested icons that are now cached
+    """
+    warm, pending = _pending_entries(await _aresolve_icons(icons))
+    if not pending:
+        return warm
+    
+    found = {}
+    cache_keys = {}
+    if _USE_DJANGO_CACHE:
+        cache_keys = {
+            local_key: _shared_cache_key(name, library, local_key[1])
+            for local_key, (name, library) in pending.items()
+        }
+        cached = await _acache_call('get_many', list(cache_keys.values()))
+        for local_key, cache_key in cache_keys.items():
+            svg_content = _from_shared_cache(cached.get(cache_key))
+            if svg_content is not None:
+                found[local_key] = svg_content
+    
+    cold = [local_key for local_key in pending if local_key not in found]
+    compiled = await asyncio.gather(*(_in_load_pool(_compile_svg_file, local_key[0]) for local_key in cold))
+    missing = {}
+    for local_key, svg_content in zip(cold, compiled):
+        if svg_content is not None:
+            found[local_key] = svg_content
+            if cache_keys:
+                missing[cache_keys[local_key]] = svg_content
+    if missing:
+        await _acache_call('set_many', missing, _CACHE_TIMEOUT)
+    
+    for local_key, svg_content in found.items():
+        _cache_icon(local_key, pending[local_key][1], svg_content)
+    return warm + len(found)
+
+
+# ============================================================================
+# Batch Rendering
+# ============================================================================
+
+IconSpec = Union[str, Tuple[str, Optional[str]], Dict[str, Any]]
+
+_SVG_ICON_ARGS = frozenset(_SVG_ICON_ARGSPEC.args)
+
+
+def _icon_spec_options(icon_spec: Any, defaults: Dict[str, Any]) -> Tuple[Dict[str, Any], Optional[str]]:
+    """Merge a render_icons() spec with the defaults, returning ``(options, error)``."""
+    if isinstance(icon_spec, dict):
+        options = {**defaults, **icon_spec}
+    elif isinstance(icon_spec, str):
+        options = {**defaults, 'name': icon_spec}
+    elif isinstance(icon_spec, (tuple, list)) and len(icon_spec) == 2:
+        options = {**defaults, 'name': icon_spec[0], 'library': icon_spec[1]}
+    else:
+        return dict(defaults), f"Invalid icon spec: {icon_spec!r}"
+    
+    unknown = [str(key) for key in options if key not in _SVG_ICON_ARGS]
+    if unknown:
+        return options, f"Unknown svg_icon() arguments: {', '.join(sorted(unknown))}"
+    library = options.get('library')
+    if library is not None and not isinstance(library, str):
+        return options, f"Invalid icon library: {library!r}"
+    return options, None
+
+
+def render_icons(specs: Iterable[IconSpec], **defaults: Any) -> List[str]:
+    """
+    Render many icons in one pass.
+    
+    Each distinct icon is parsed, validated and resolved once, and all
+    icons missing from the local cache are fetched with a single
+    ``get_many`` before rendering.
+    
+    Args:
+        specs: Icon names (``"name"`` or ``"library:name"``),
+            ``(name, library)`` pairs, or dicts of svg_icon() arguments
+            including ``name``
+        **defaults: svg_icon() arguments applied to every spec
+        
+    Returns:
+        list: Safe HTML strings, in the order of ``specs``. Malformed
+        specs and unknown arguments are logged and rendered as the
+        fallback, like invalid names in svg_icon().
+        
+    Example:
+        render_icons(["bootstrap:house", {"name": "gear", "library": "bootstrap"}],
+                     class_name="w-4 h-4")
+    """
+    unknown = sorted(key for key in defaults if key not in _SVG_ICON_ARGS)
+    if unknown:
+        message = f"Unknown render_icons() arguments: {', '.join(unknown)}"
+        logger.warning(message)
+        fallback = _get_fallback(defaults.get('fallback', True), message)
+        return [fallback for _ in specs]
+    
+    calls = []
+    resolved: Dict[Tuple[str, Optional[str]], Optional[IconEntry]] = {}
+    for icon_spec in specs:
+        options, error = _icon_spec_options(icon_spec, defaults)
+        if error is not None:
+            logger.warning(error)
+            calls.append((None, options, error))
+            continue
+        
+        name = options.pop('name', None)
+        if not name or not isinstance(name, str):
+            calls.append((None, options, "Invalid icon name"))
+            continue
+        
+        key = _split_library(name, options.pop('library', None))
+        if key not in resolved:
+            resolved[key] = _resolve_icon(*key)
+        calls.append((key, options, None))
+    
+    _prefetch_entries(resolved)
+    
+    results = []
+    for key, options, error in calls:
+        if key is None:
+            results.append(_get_fallback(options.get('fallback', True), error))
+        else:
+            results.append(_render_icon(key[0], key[1], resolved[key], **options))
+    return results
+
+
+@register.simple_tag(takes_context=True)
+def svg_icons(context: template.Context, specs: Iterable[IconSpec], **kwargs: Any) -> str:
+    """
+    Render every icon of an iterable with shared svg_icon() arguments.
+    
+    Example:
+        {% svg_icons toolbar_icons library="heroicons-outline" class_name="w-5 h-5" %}
+    """
+    rendered = _call_with_sprite_context(context, render_icons, specs or (), **kwargs)
+    return mark_safe(''.join(rendered))
+
+
+# ============================================================================
+# Sprite Sheets
+# ============================================================================
+
+def _sprite_symbol_id(name: str, library: Optional[str]) -> str:
+    """
+    Return the <symbol> id for an icon (``<library>:<name>``).
+    
+    Neither library nor icon names may contain ``:``, so ids of different
+    icons never collide.
+    """
+    return f"{library}:{name}" if library else name
+
+
+def _get_context_sprite(context: template.Context) -> Dict[str, Tuple[str, Optional[str]]]:
+    """
+    Return the symbols used so far in this render.
+    
+    They are kept on the root of the render context, which is shared with
+    ``{% include ... only %}`` and inclusion tags, unlike the variables.
+    """
+    return context.render_context.dicts[0].setdefault(_SPRITE_CONTEXT_KEY, {})
+
+
+def _record_sprite_symbol(name: str, library: Optional[str]) -> None:
+    """Remember that the current render references an icon's symbol."""
+    symbols = _sprite_symbols.get()
+    if symbols is not None:
+        symbols.setdefault(_sprite_symbol_id(name, library), (name, library))
+
+
+def render_symbols(icons: Iterable[Union[str, Tuple[str, Optional[str]]]]) -> List[str]:
+    """
+    Render one <symbol> per distinct icon, skipping icons that cannot be loaded.
+    
+    Symbols are named like sprite icons in templates (``<library>:<name>``).
+    """
+    symbols = []
+    seen = set()
+    for icon_spec in icons:
+        name, library = parse_icon_spec(icon_spec)
+        symbol_id = _sprite_symbol_id(name, library)
+        if symbol_id in seen:
+            continue
+        seen.add(symbol_id)
+        
+        entry = _resolve_icon(name, library)
+        svg_content = _load_icon(name, library, entry) if entry else None
+        if svg_content is None:
+            logger.warning(f"Skipping sprite symbol for missing icon: {symbol_id}")
+            continue
+        symbols.append(svg_content.render_symbol(escape(symbol_id)))
+    return symbols
+
+
+def render_sprite(icons: Iterable[Union[str, Tuple[str, Optional[str]]]]) -> str:
+    """
+    Render a hidden SVG sprite containing one <symbol> per icon.
+    
+    Args:
+        icons: Icon names (``"name"`` or ``"library:name"``) or
+            ``(name, library)`` pairs
+        
+    Returns:
+        Safe HTML string, empty when no icon could be loaded
+    """
+    symbols = render_symbols(icons)
+    if not symbols:
+        return mark_safe('')
+    
+    return mark_safe(
+        '<svg xmlns="http://www.w3.org/2000/svg" style="display:none" aria-hidden="true">'
+        + ''.join(symbols)
+        + '</svg>'
     )
 
 
+@register.simple_tag(takes_context=True)
+def svg_sprite(context: template.Context) -> str:
+    """
+    Emit the <symbol> definitions for icons rendered with ``sprite=True``.
+    
+    Place it after the last sprite icon of the page (e.g. before
+    ``</body>``); symbols already emitted are not repeated by later calls.
+    """
+    symbols = _get_context_sprite(context)
+    used = list(symbols.values())
+    symbols.clear()
+    return render_sprite(used)
+
+
+@register.simple_tag
+def svg_sprite_url(library: Optional[str] = None) -> str:
+    """
+    Return the versioned URL of an external sprite served by the app's views.
+
+    Requires ``django_svg_icon_tags.urls`` in the URLconf. Without a
+    library the sprite holds the icons of SVG_ICON_USAGE_MANIFEST.
+
+    Example:
+        <svg><use href="{% svg_sprite_url "bootstrap" %}#bootstrap:house"/></svg>
+    """
+    from django_svg_icon_tags.views import sprite_url
+    return sprite_url(library)
+
+
+@register.simple_tag
+def svg_icon_prefetch(*icons: Any) -> str:
+    """
+    Warm the icon caches for icons a template is about to render.
+    
+    Accepts icon names and iterables of names; renders nothing.
+    
+    Example:
+        {% svg_icon_prefetch "bootstrap:house" "bootstrap:gear" menu_icons %}
+    """
+    specs = []
+    for icon_spec in icons:
+        if isinstance(icon_spec, str):
+            specs.append(icon_spec)
+        elif icon_spec:
+            specs.extend(icon_spec)
+    prefetch_icons(specs)
+    return ''
+
+
 @register.filter
 def svg_icon_simple(name: str) -> str:
     """Simplified filter for common use cases."""
     return svg_icon(name, class_name="icon")
 
 
-@register.inclusion_tag('svg_icon_tags/icon.html')
+_SIZE_PRESETS = {
+    'xs': 'w-3 h-3',
+    'sm': 'w-4 h-4',
+    'md': 'w-5 h-5',
+    'lg': 'w-6 h-6',
+    'xl': 'w-8 h-8',
+    '2xl': 'w-10 h-10',
+    '3xl': 'w-12 h-12',
+    '4xl': 'w-16 h-16',
+}
+
+_COLOR_PRESETS = {
+    'current': 'text-current',
+    'primary': 'text-primary-600',
+    'secondary': 'text-secondary-600',
+    'success': 'text-success-600',
+    'danger': 'text-danger-600',
+    'warning': 'text-warning-600',
+    'info': 'text-info-600',
+    'gray': 'text-gray-500',
+    'light': 'text-gray-400',
+    'dark': 'text-gray-800',
+    'brand-blue': 'text-blue-600',
+    'brand-green': 'text-green-600',
+}
+
+_FLIP_CLASSES = {
+    'horizontal': 'scale-x-[-1]',
+    'vertical': 'scale-y-[-1]',
+}
+
+
+@lru_cache(maxsize=256)
+def _icon_classes(
+    size: str,
+    color: str,
+    rotate: Optional[str],
+    flip: Optional[str],
+    spin: bool,
+    pulse: bool,
+) -> str:
+    """
+    Build the class string for an {% icon %} preset combination.
+    
+    Settings:
+        SVG_ICON_SIZE_PRESETS: Extra or overridden size presets
+        SVG_ICON_COLOR_PRESETS: Extra or overridden color presets
+    """
+    sizes = {**_SIZE_PRESETS, **getattr(settings, 'SVG_ICON_SIZE_PRESETS', {})}
+    colors = {**_COLOR_PRESETS, **getattr(settings, 'SVG_ICON_COLOR_PRESETS', {})}
+    
+    classes = [
+        sizes.get(size, _SIZE_PRESETS['md']),
+        colors.get(color, _COLOR_PRESETS['current']),
+    ]
+    if rotate:
+        classes.append(f'rotate-{rotate}')
+    if flip in _FLIP_CLASSES:
+        classes.append(_FLIP_CLASSES[flip])
+    if spin:
+        classes.append('animate-spin')
+    if pulse:
+        classes.append('animate-pulse')
+    return ' '.join(classes)
+
+
+@receiver(setting_changed)
+def _reset_icon_classes(*, setting, **kwargs):
+    if setting in ('SVG_ICON_SIZE_PRESETS', 'SVG_ICON_COLOR_PRESETS'):
+        _icon_classes.cache_clear()
+
+
+_ICON_TEMPLATE = 'svg_icon_tags/icon.html'
+_PACKAGE_ICON_TEMPLATE = Path(__file__).resolve().parent.parent / 'templates' / _ICON_TEMPLATE
+_UNSET = object()
+_icon_template_override: Any = _UNSET
+
+
+def _get_icon_template_override() -> Optional[template.Template]:
+    """
+    Return a project override of the deprecated ``svg_icon_tags/icon.html``.
+    
+    ``{% icon %}`` used to render that template; projects overriding it
+    keep their markup for a deprecation cycle. The lookup runs once per
+    process, not per call.
+    """
+    global _icon_template_override
+    if _icon_template_override is _UNSET:
+        override = None
+        for engine in engines.all():
+            if not isinstance(engine, DjangoTemplates):
+                continue
+            try:
+                found, origin = engine.engine.find_template(_ICON_TEMPLATE)
+            except TemplateDoesNotExist:
+                continue
+            if Path(origin.name).resolve() != _PACKAGE_ICON_TEMPLATE:
+                override = found
+                warnings.warn(
+                    f"Overriding {_ICON_TEMPLATE} ({origin.name}) is deprecated; {{% icon %}} will stop "
+                    f"rendering it. Use SVG_ICON_SIZE_PRESETS and SVG_ICON_COLOR_PRESETS instead.",
+                    DeprecationWarning,
+                )
+            break
+        _icon_template_override = override
+    return _icon_template_override
+
+
+@receiver(setting_changed)
+def _reset_icon_template_override(*, setting, **kwargs):
+    global _icon_template_override
+    if setting in ('TEMPLATES', 'INSTALLED_APPS'):
+        _icon_template_override = _UNSET
+
+
+@register.simple_tag
 def icon(
     name: str,
     size: str = "md",
@@ -320,9 +1677,9 @@ def icon(
     flip: Optional[str] = None,
     spin: bool = False,
     pulse: bool = False,
-) -> Dict[str, str]:
+) -> str:
     """
-    Inclusion tag with Tailwind-friendly presets and animations.
+    Render an icon with Tailwind-friendly presets and animations.
     
     Args:
         name: Icon name
@@ -335,57 +1692,16 @@ def icon(
         pulse: Enable pulsing animation
         
     Returns:
-        dict: Context for icon.html template
-    """
-    size_map = {
-        'xs': 'w-3 h-3',
-        'sm': 'w-4 h-4',
-        'md': 'w-5 h-5',
-        'lg': 'w-6 h-6',
-        'xl': 'w-8 h-8',
-        '2xl': 'w-10 h-10',
-        '3xl': 'w-12 h-12',
-        '4xl': 'w-16 h-16',
-    }
-    
-    color_map = {
-        'current': 'text-current',
-        'primary': 'text-primary-600',
-        'secondary': 'text-secondary-600',
-        'success': 'text-success-600',
-        'danger': 'text-danger-600',
-        'warning': 'text-warning-600',
-        'info': 'text-info-600',
-        'gray': 'text-gray-500',
-        'light': 'text-gray-400',
-        'dark': 'text-gray-800',
-        'brand-blue': 'text-blue-600',
-        'brand-green': 'text-green-600',
-    }
-    
-    classes = [
-        size_map.get(size, 'w-5 h-5'),
-        color_map.get(color, 'text-current'),
-    ]
-    
-    # Add rotation classes
-    if rotate:
-        classes.append(f'rotate-{rotate}')
-    
-    # Add flip classes
-    if flip == 'horizontal':
-        classes.append('scale-x-[-1]')
-    elif flip == 'vertical':
-        classes.append('scale-y-[-1]')
-    
-    # Add animation classes
-    if spin:
-        classes.append('animate-spin')
-    if pulse:
-        classes.append('animate-pulse')
-    
-    return {
-        'icon_name': name,
-        'library': library,
-        'class_name': ' '.join(classes),
-    }
\ No newline at end of file
+        Safe HTML string containing the icon
+    """
+    try:
+        class_name = _icon_classes(size, color, rotate, flip, bool(spin), bool(pulse))
+    except TypeError:
+        # Unhashable preset arguments; build the classes without caching.
+        class_name = _icon_classes.__wrapped__(size, color, rotate, flip, spin, pulse)
+    override = _get_icon_template_override()
+    if override is not None:
+        return mark_safe(override.render(Context({
+            'icon_name': name, 'library': library, 'class_name': class_name,
+        })))
+    return svg_icon(name, library=library, class_name=class_name)
\ No newline at end of file
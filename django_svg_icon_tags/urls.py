@@ -0,0 +1,20 @@
+"""
+URLconf for the icon HTTP endpoints and search
+
+Include it under any prefix::
+
+    path('icons/', include('django_svg_icon_tags.urls')),
+"""
+from django.urls import path
+
+from django_svg_icon_tags import views
+
+app_name = 'svg_icon_tags'
+
+urlpatterns = [
+    path('sprite.svg', views.sprite, name='sprite'),
+    path('sprite/<slug:library>.svg', views.sprite, name='library_sprite'),
+    path('icon/<slug:library>/<str:name>.svg', views.icon, name='icon'),
+    path('icon/<str:name>.svg', views.icon, name='default_icon'),
+    path('search.json', views.search, name='search'),
+]
\ No newline at end of file
@@ -0,0 +1,232 @@
+"""
+Icon Usage
+==========
+
+Which icons a project actually uses, so bundles and preloading can skip
+the thousands it does not.
+
+Usages are found by scanning templates for ``{% svg_icon %}``,
+``{% icon %}`` and ``|svg_icon_simple`` with literal names (see
+``manage.py scan_svg_icons``). ``{% svg_icons %}`` always takes its
+icons from a variable, so its usages are reported as dynamic. Icons
+whose names are only known at runtime can be recorded as they render by
+pointing ``SVG_ICON_USAGE_LOG`` at a file; each process appends an icon
+the first time it renders it.
+
+The resulting manifest is JSON::
+
+    {"icons": ["<library>/<name>", ...], "dynamic": <usages with variable names>}
+
+Settings:
+    SVG_ICON_USAGE_MANIFEST: Used-icon manifest read by ``build_svg_icons``
+        and written by ``scan_svg_icons`` (optional)
+    SVG_ICON_USAGE_LOG: File rendered icons are appended to (optional)
+    SVG_ICON_PRELOAD_USED: Preload the manifest icons at startup (default False)
+"""
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.template.base import Lexer, TokenType
+
+from django_svg_icon_tags.registry import IconKey
+
+logger = logging.getLogger(__name__)
+
+# Tag name -> position of the ``library`` argument
+ICON_TAGS = {'svg_icon': 1, 'icon': 3}
+# Tags rendering an iterable of icons; templates have no list literals.
+ICON_LIST_TAGS = frozenset({'svg_icons'})
+_FILTER_PATTERN = re.compile(r'''(["'])([^"'|]+)\1\s*\|\s*svg_icon_simple\b''')
+
+_UNSET = object()
+_recorder = _UNSET
+
+
+def usage_key(name: str, library: Optional[str]) -> str:
+    """Manifest key of an icon, ``"<library>/<name>"``."""
+    return f"{library or ''}/{name}"
+
+
+def _literal(bit: str) -> Optional[str]:
+    """Return the string a quoted template literal stands for, if it is one."""
+    if len(bit) >= 2 and bit[0] in '"\'' and bit[-1] == bit[0] and bit[0] not in bit[1:-1]:
+        return bit[1:-1]
+    return None
+
+
+class IconUsage:
+    """Icons found in templates and usage logs, with where they were used."""
+
+    def __init__(self):
+        self.icons: Dict[IconKey, List[str]] = {}
+        self.dynamic: List[str] = []
+
+    def add_icon(self, name: str, library: Optional[str] = None, origin: str = '') -> None:
+        from django_svg_icon_tags.templatetags.svg_icon_tags import _is_valid_icon, _split_library
+
+        name, library = _split_library(name, library)
+        if _is_valid_icon(name, library):
+            self.icons.setdefault((library, name), []).append(origin)
+
+    def add_template(self, source: str, origin: str = '') -> None:
+        """Record the icon usages of a Django template source."""
+        for token in Lexer(source).tokenize():
+            location = f"{origin}:{token.lineno}"
+            if token.token_type == TokenType.BLOCK:
+                bits = token.split_contents()
+                if bits and bits[0] in ICON_TAGS:
+                    self._add_tag(bits, location)
+                elif bits and bits[0] in ICON_LIST_TAGS:
+                    self.dynamic.append(location)
+            if token.token_type in (TokenType.BLOCK, TokenType.VAR) and 'svg_icon_simple' in token.contents:
+                for match in _FILTER_PATTERN.finditer(token.contents):
+                    self.add_icon(match.group(2), origin=location)
+
+    def _add_tag(self, bits: List[str], location: str) -> None:
+        if len(bits) > 3 and bits[-2] == 'as':
+            bits = bits[:-2]
+        positional = [bit for bit in bits[1:] if '=' not in bit]
+        kwargs = dict(bit.split('=', 1) for bit in bits[1:] if '=' in bit)
+
+        name = kwargs.get('name', positional[0] if positional else None)
+        library = kwargs.get('library')
+        library_position = ICON_TAGS[bits[0]]
+        if library is None and len(positional) > library_position:
+            library = positional[library_position]
+
+        name = name and _literal(name)
+        if library is not None:
+            library = _literal(library)
+            if library is None:
+                name = None
+        if name:
+            self.add_icon(name, library, location)
+        else:
+            self.dynamic.append(location)
+
+    def add_log(self, path: str) -> int:
+        """Record the icons of a ``SVG_ICON_USAGE_LOG`` file; returns the number read."""
+        count = 0
+        with open(path, encoding='utf-8') as log_file:
+            for line in log_file:
+                library, _, name = line.strip().rpartition('/')
+                if name:
+                    self.add_icon(name, library or None, path)
+                    count += 1
+        return count
+
+
+def find_template_files(extra_dirs: Iterable[str] = ()) -> List[str]:
+    """List the template files of every Django template engine plus ``extra_dirs``."""
+    from django.template import engines
+    from django.template.backends.django import DjangoTemplates
+    from django.template.utils import get_app_template_dirs
+
+    dirs = [str(path) for path in extra_dirs]
+    for engine in engines.all():
+        if isinstance(engine, DjangoTemplates):
+            dirs.extend(str(path) for path in engine.engine.dirs)
+            if engine.engine.app_dirs:
+                dirs.extend(str(path) for path in get_app_template_dirs('templates'))
+
+    files = []
+    seen = set()
+    for directory in dirs:
+        for root, _, filenames in os.walk(directory):
+            for filename in filenames:
+                path = os.path.realpath(os.path.join(root, filename))
+                if path not in seen and filename.endswith(('.html', '.txt', '.xml', '.svg')):
+                    seen.add(path)
+                    files.append(path)
+    return sorted(files)
+
+
+def write_usage_manifest(path: str, icons: Iterable[IconKey], dynamic: int = 0) -> int:
+    """
+    Write ``(library, name)`` pairs to a used-icon manifest atomically.
+
+    Returns:
+        int: Number of icons written
+    """
+    keys = sorted({usage_key(name, library) for library, name in icons})
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as manifest_file:
+            json.dump({'icons': keys, 'dynamic': dynamic}, manifest_file, indent=1)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return len(keys)
+
+
+def load_usage_manifest(path: Optional[str] = None) -> Set[IconKey]:
+    """
+    Read the ``(library, name)`` pairs of a used-icon manifest.
+
+    Args:
+        path: Manifest file, defaults to SVG_ICON_USAGE_MANIFEST
+
+    Raises:
+        OSError, ValueError: If the manifest cannot be read
+    """
+    path = path or getattr(settings, 'SVG_ICON_USAGE_MANIFEST', None)
+    if not path:
+        raise ValueError("No usage manifest given and SVG_ICON_USAGE_MANIFEST is not set.")
+    with open(path, encoding='utf-8') as manifest_file:
+        keys = json.load(manifest_file)['icons']
+    icons = set()
+    for key in keys:
+        library, _, name = key.rpartition('/')
+        icons.add((library or None, name))
+    return icons
+
+
+class UsageRecorder:
+    """Appends each icon to the usage log the first time this process renders it."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._seen: Set[Tuple[Optional[str], str]] = set()
+        self._lock = threading.Lock()
+
+    def record(self, name: str, library: Optional[str]) -> None:
+        key = (library, name)
+        if key in self._seen:
+            return
+        with self._lock:
+            if key in self._seen:
+                return
+            self._seen.add(key)
+            try:
+                with open(self.path, 'a', encoding='utf-8') as log_file:
+                    log_file.write(usage_key(name, library) + '\n')
+            except OSError as e:
+                logger.warning(f"Cannot record SVG icon usage to {self.path}: {e}")
+
+
+def get_usage_recorder() -> Optional[UsageRecorder]:
+    """Return the SVG_ICON_USAGE_LOG recorder, or None when recording is off."""
+    global _recorder
+    if _recorder is _UNSET:
+        path = getattr(settings, 'SVG_ICON_USAGE_LOG', None)
+        _recorder = UsageRecorder(path) if path else None
+    return _recorder
+
+
+@receiver(setting_changed)
+def _reset_usage_recorder(*, setting, **kwargs):
+    global _recorder
+    if setting == 'SVG_ICON_USAGE_LOG':
+        _recorder = _UNSET
\ No newline at end of file
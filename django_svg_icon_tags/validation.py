@@ -0,0 +1,131 @@
+"""
+Icon Validation
+===============
+
+Checks icon files the way the render path loads them: the structure
+check, the sanitizer and compilation of the root ``<svg>`` tag. Each
+file is reported with what the sanitizer stripped, its size before and
+after sanitizing and how long parsing and sanitizing took, so invalid
+icons and heavy outliers can be fixed before they reach a page.
+
+Files are checked across a process pool (see ``manage.py
+check_svg_icons``); :func:`check_icon_file` only uses the sanitizer and
+compiler, so workers do not need Django settings. Workers are spawned
+rather than forked, so they do not inherit the parent's threads (such
+as the icon watcher) or its open database connections.
+"""
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+from django.db import connections
+
+from django_svg_icon_tags.compiled import compile_svg
+from django_svg_icon_tags.sanitizer import looks_like_svg, sanitize_svg
+
+
+class IconCheck(NamedTuple):
+    """Result of checking one icon file.
+
+    Attributes:
+        library: Icon library, or None for top-level icons
+        name: Icon name
+        path: File checked
+        error: Why the icon cannot be rendered, None when valid
+        removed: Constructs the sanitizer dropped
+        raw_bytes: File size
+        sanitized_bytes: Size of the sanitized markup
+        parse_ms: Time spent reading, checking and compiling
+        sanitize_ms: Time spent sanitizing
+    """
+    library: Optional[str]
+    name: str
+    path: str
+    error: Optional[str]
+    removed: Tuple[str, ...]
+    raw_bytes: int
+    sanitized_bytes: int
+    parse_ms: float
+    sanitize_ms: float
+
+    @property
+    def valid(self) -> bool:
+        return self.error is None
+
+    @property
+    def spec(self) -> str:
+        return f"{self.library}:{self.name}" if self.library else self.name
+
+
+def check_icon_file(library: Optional[str], name: str, path: str) -> IconCheck:
+    """Read, sanitize and compile one icon file, timing each step."""
+    removed: List[str] = []
+    raw_bytes = sanitized_bytes = 0
+    parse_time = sanitize_time = 0.0
+    error = None
+
+    start = time.perf_counter()
+    try:
+        with open(path, 'rb') as icon_file:
+            raw = icon_file.read()
+        raw_bytes = len(raw)
+        content = raw.decode('utf-8').strip()
+    except (OSError, UnicodeDecodeError) as e:
+        error = f"unreadable: {e}"
+    else:
+        if not looks_like_svg(content):
+            error = "not an SVG document"
+    parse_time = time.perf_counter() - start
+
+    if error is None:
+        start = time.perf_counter()
+        sanitized = sanitize_svg(content, removed)
+        sanitize_time = time.perf_counter() - start
+        sanitized_bytes = len(sanitized.encode('utf-8'))
+
+        start = time.perf_counter()
+        if compile_svg(sanitized) is None:
+            error = "no <svg> root element after sanitizing"
+        parse_time += time.perf_counter() - start
+
+    return IconCheck(
+        library, name, path, error, tuple(removed),
+        raw_bytes, sanitized_bytes, parse_time * 1000, sanitize_time * 1000,
+    )
+
+
+def _check_icon_files(icons: List[Tuple[Optional[str], str, str]]) -> List[IconCheck]:
+    return [check_icon_file(*icon) for icon in icons]
+
+
+def check_icons(
+    icons: Iterable[Tuple[Optional[str], str, str]],
+    workers: Optional[int] = None,
+) -> List[IconCheck]:
+    """
+    Check many icon files, in parallel when more than one worker is used.
+
+    Args:
+        icons: ``(library, name, path)`` triples
+        workers: Worker processes, defaults to the CPU count; 1 checks in
+            this process
+
+    Returns:
+        list: One :class:`IconCheck` per icon, in input order
+    """
+    icons = list(icons)
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(icons) < 2:
+        return _check_icon_files(icons)
+
+    # Batches amortize the pickling round trip; several per worker keep
+    # the pool balanced when a few icons are much larger than the rest.
+    batch_size = max(1, min(256, len(icons) // (workers * 4)))
+    batches = [icons[i:i + batch_size] for i in range(0, len(icons), batch_size)]
+    # Database connections must never be shared with worker processes.
+    connections.close_all()
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=min(workers, len(batches)), mp_context=context) as pool:
+        return [check for batch in pool.map(_check_icon_files, batches) for check in batch]
\ No newline at end of file
@@ -0,0 +1,294 @@
+"""
+Icon HTTP Endpoints
+===================
+
+Serves SVG sprites and single icons as cacheable files, so pages can
+reference icons externally (``<use href="/icons/sprite/bootstrap.svg#bootstrap:house">``)
+instead of inlining them::
+
+    urlpatterns = [
+        ...,
+        path('icons/', include('django_svg_icon_tags.urls')),
+    ]
+
+Responses are built once per process and kept in memory together with
+their gzip-compressed form, and rebuilt when an icon changes. In
+``'stat'`` invalidation mode a single icon is rebuilt as soon as its file
+is edited, while sprites poll the registry at most every
+``SVG_ICON_WATCH_INTERVAL`` seconds instead of stat()ing every member on
+each request. Responses carry a strong ``ETag`` and answer
+``If-None-Match`` with 304; gzip is sent only to clients accepting it
+with a non-zero q-value. URLs
+from :func:`sprite_url` and :func:`icon_url` include a ``?v=<hash>``
+of the content and are served with ``immutable`` cache headers;
+unversioned URLs are cached for ``SVG_ICON_HTTP_MAX_AGE`` seconds and
+revalidated.
+
+``search.json`` answers icon name searches, see
+:mod:`django_svg_icon_tags.search`.
+
+Settings:
+    SVG_ICON_HTTP_MAX_AGE: Cache lifetime of unversioned URLs (default 3600)
+    SVG_ICON_HTTP_CACHE_SIZE: Responses kept in memory (default 512)
+"""
+import gzip
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.http import Http404, HttpResponse, HttpResponseBadRequest, HttpResponseNotModified, JsonResponse
+from django.urls import get_script_prefix, reverse
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags
+from django.views.decorators.http import require_safe
+
+from django_svg_icon_tags.cache import LRUCache
+from django_svg_icon_tags.registry import get_invalidation_mode, icon_registry
+from django_svg_icon_tags.search import search_icons
+from django_svg_icon_tags.static_urls import content_hash
+from django_svg_icon_tags.templatetags import svg_icon_tags
+from django_svg_icon_tags.usage import load_usage_manifest
+from django_svg_icon_tags.watcher import DEFAULT_WATCH_INTERVAL
+
+IMMUTABLE = 'public, max-age=31536000, immutable'
+# SVG opened directly is a document; never let it run anything.
+CONTENT_SECURITY_POLICY = "default-src 'none'; style-src 'unsafe-inline'"
+
+_responses: Optional[LRUCache] = None
+_sprite_urls: Dict[Tuple[Optional[str], str], Tuple[Tuple[int, int], str]] = {}
+
+
+class IconPayload(NamedTuple):
+    """A prebuilt response body, plain and gzip-compressed."""
+    body: bytes
+    gzipped: bytes
+    version: str
+
+    @classmethod
+    def build(cls, markup: str) -> 'IconPayload':
+        body = markup.encode('utf-8')
+        return cls(body, gzip.compress(body, compresslevel=9, mtime=0), content_hash(body))
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + len(self.gzipped)
+
+
+def _get_responses() -> LRUCache:
+    global _responses
+    if _responses is None:
+        _responses = LRUCache(getattr(settings, 'SVG_ICON_HTTP_CACHE_SIZE', 512), sizeof=lambda item: item[1].size)
+    return _responses
+
+
+@receiver(setting_changed)
+def _reset_responses(*, setting, **kwargs):
+    global _responses
+    if setting.startswith(('SVG_ICON_', 'STATIC')):
+        _responses = None
+    if setting.startswith(('SVG_ICON_', 'STATIC')) or setting == 'ROOT_URLCONF':
+        _sprite_urls.clear()
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Return whether an ``Accept-Encoding`` header allows gzip, treating ``q=0`` as a refusal."""
+    gzip_q = wildcard_q = None
+    for item in accept_encoding.split(','):
+        coding, *params = item.split(';')
+        coding = coding.strip().lower()
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding in ('gzip', 'x-gzip'):
+            gzip_q = q
+        elif coding == '*':
+            wildcard_q = q
+    if gzip_q is None:
+        gzip_q = wildcard_q
+    return gzip_q is not None and gzip_q > 0
+
+
+def _cached_payload(key: Tuple, sources: Any, build) -> Optional[IconPayload]:
+    """
+    Return the payload for ``key``, rebuilding it after icons or settings change.
+
+    ``sources`` identifies the files the payload is built from (e.g. their
+    resolved entries); a payload built from different sources is stale.
+    """
+    responses = _get_responses()
+    stamp = (svg_icon_tags.render_generation(), sources)
+    cached = responses.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    markup = build()
+    if markup is None:
+        return None
+    payload = IconPayload.build(markup)
+    responses.set(key, (stamp, payload))
+    return payload
+
+
+def _sprite_markup(icons: Iterable[Tuple[str, Optional[str]]]) -> Optional[str]:
+    symbols = svg_icon_tags.render_symbols(icons)
+    if not symbols:
+        return None
+    return '<svg xmlns="http://www.w3.org/2000/svg">' + ''.join(symbols) + '</svg>'
+
+
+def _sprite_icons(library: Optional[str]) -> List[Tuple[str, Optional[str]]]:
+    """Return the icons of a library, or those in the used-icon manifest."""
+    if library is not None:
+        keys = [key for key, _ in icon_registry.items() if key[0] == library]
+    else:
+        try:
+            keys = load_usage_manifest()
+        except (OSError, ValueError, KeyError):
+            return []
+    return [(name, lib) for lib, name in sorted(keys, key=lambda key: (key[0] or '', key[1]))]
+
+
+def sprite_payload(library: Optional[str] = None) -> Optional[IconPayload]:
+    """
+    Return the sprite of a library, or of the used-icon manifest when None.
+
+    Symbols are named like sprite icons in templates (``<library>:<name>``).
+    """
+    if library is not None and not svg_icon_tags.is_valid_library(library):
+        return None
+    return _cached_payload(
+        ('sprite', library), _sprite_generation(), lambda: _sprite_markup(_sprite_icons(library))
+    )
+
+
+def _sprite_generation() -> int:
+    """
+    Return the registry generation sprites are built from.
+
+    Other modes update the registry when an icon changes; 'stat' only
+    notices edits by looking at the files, so the registry is polled,
+    but at most once per SVG_ICON_WATCH_INTERVAL.
+    """
+    if get_invalidation_mode() == 'stat':
+        icon_registry.poll_if_due(float(getattr(settings, 'SVG_ICON_WATCH_INTERVAL', DEFAULT_WATCH_INTERVAL)))
+    return icon_registry.generation
+
+
+def icon_payload(name: str, library: Optional[str] = None) -> Optional[IconPayload]:
+    """Return a single sanitized icon as a standalone SVG file."""
+    entry = svg_icon_tags.resolve_icon(name, library)
+    if entry is None:
+        return None
+
+    def build() -> Optional[str]:
+        svg_content = svg_icon_tags.get_icon(name, library)
+        return svg_content.render() if svg_content is not None else None
+
+    return _cached_payload(('icon', library, name), entry, build)
+
+
+def _serve(request, payload: Optional[IconPayload]) -> HttpResponse:
+    if payload is None:
+        raise Http404("Icon not found")
+
+    gzipped = _accepts_gzip(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+    etag = f'"{payload.version}-gz"' if gzipped else f'"{payload.version}"'
+    if etag in parse_etags(request.META.get('HTTP_IF_NONE_MATCH', '')):
+        response = HttpResponseNotModified()
+    else:
+        body = payload.gzipped if gzipped else payload.body
+        response = HttpResponse(body, content_type='image/svg+xml')
+        response['Content-Length'] = str(len(body))
+        if gzipped:
+            response['Content-Encoding'] = 'gzip'
+        response['Content-Security-Policy'] = CONTENT_SECURITY_POLICY
+        response['X-Content-Type-Options'] = 'nosniff'
+
+    response['ETag'] = etag
+    if request.GET.get('v') == payload.version:
+        response['Cache-Control'] = IMMUTABLE
+    else:
+        response['Cache-Control'] = f"public, max-age={getattr(settings, 'SVG_ICON_HTTP_MAX_AGE', 3600)}"
+    patch_vary_headers(response, ('Accept-Encoding',))
+    return response
+
+
+@require_safe
+def sprite(request, library: Optional[str] = None):
+    """Serve the sprite of a library, or of the used-icon manifest."""
+    return _serve(request, sprite_payload(library))
+
+
+@require_safe
+def icon(request, name: str, library: Optional[str] = None):
+    """Serve a single icon."""
+    return _serve(request, icon_payload(name, library))
+
+
+@require_safe
+def search(request):
+    """
+    Search icon names for pickers and autocomplete.
+
+    Query parameters: ``q`` (terms), ``library``, ``offset`` and ``limit``.
+    Answers ``{"results": [{"icon", "library", "name"}], "total", "offset",
+    "limit", "next"}`` where ``next`` is the offset of the following page.
+    """
+    try:
+        offset = int(request.GET.get('offset', 0))
+        limit = int(request.GET['limit']) if 'limit' in request.GET else None
+    except ValueError:
+        return HttpResponseBadRequest("offset and limit must be integers")
+
+    page = search_icons(request.GET.get('q', ''), request.GET.get('library') or None, offset, limit)
+    return JsonResponse({
+        'results': [
+            {'icon': result.spec, 'library': result.library, 'name': result.name}
+            for result in page.results
+        ],
+        'total': page.total,
+        'offset': page.offset,
+        'limit': page.limit,
+        'next': page.offset + len(page.results) if page.has_more else None,
+    })
+
+
+def sprite_url(library: Optional[str] = None) -> str:
+    """
+    Return the versioned URL of a sprite; requires the app's URLconf.
+
+    URLs are memoized until icons or settings change, so templates can
+    call this on every render.
+    """
+    key = (library, get_script_prefix())
+    stamp = (svg_icon_tags.render_generation(), _sprite_generation())
+    cached = _sprite_urls.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    payload = sprite_payload(library)
+    if library is None:
+        url = reverse('svg_icon_tags:sprite')
+    else:
+        url = reverse('svg_icon_tags:library_sprite', kwargs={'library': library})
+    if payload is None:
+        return url
+    url = f"{url}?v={payload.version}"
+    _sprite_urls[key] = (stamp, url)
+    return url
+
+
+def icon_url(name: str, library: Optional[str] = None) -> str:
+    """Return the versioned URL of a single icon; requires the app's URLconf."""
+    name, library = svg_icon_tags.parse_icon_spec((name, library))
+    payload = icon_payload(name, library)
+    if library is None:
+        url = reverse('svg_icon_tags:default_icon', kwargs={'name': name})
+    else:
+        url = reverse('svg_icon_tags:icon', kwargs={'library': library, 'name': name})
+    return f"{url}?v={payload.version}" if payload is not None else url
\ No newline at end of file
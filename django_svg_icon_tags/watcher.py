@@ -0,0 +1,112 @@
+"""
+Icon Watcher
+============
+
+Background thread that keeps the icon registry in sync with the files on
+disk when ``SVG_ICON_INVALIDATION = "watch"``.
+
+Each poll re-stats the indexed icon files and rescans the staticfiles
+finders only when a directory holding icons changed (see
+:meth:`IconRegistry.poll`), so only icons that actually changed are
+invalidated and renders never pay for a ``stat()`` call.
+
+The thread is started from ``AppConfig.ready()`` only in processes that
+serve requests: management commands such as ``migrate``,
+``collectstatic``, ``check_svg_icons`` or ``test`` do not start it, and
+neither does the file-watching parent of ``runserver``'s autoreloader.
+Set ``SVG_ICON_WATCH_AUTOSTART = False`` to start it yourself with
+:func:`start_icon_watcher` (for example from ``wsgi.py``), which is also
+what test suites run outside ``manage.py test`` (such as pytest) should
+do.
+
+Settings:
+    SVG_ICON_WATCH_INTERVAL: Seconds between polls (default 5.0)
+    SVG_ICON_WATCH_AUTOSTART: ``"auto"`` (default) starts the thread in
+        server processes as described above, ``True`` in every process
+        and ``False`` never
+"""
+import logging
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import List, Optional
+
+from django.conf import settings
+
+from django_svg_icon_tags.registry import IconRegistry, icon_registry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WATCH_INTERVAL = 5.0
+
+_MANAGEMENT_SCRIPTS = ('manage.py', 'django-admin', 'django-admin.py')
+
+_watcher: Optional['IconWatcher'] = None
+_watcher_lock = threading.Lock()
+
+
+class IconWatcher(threading.Thread):
+    """Daemon thread polling a registry for added, edited and removed icons."""
+
+    def __init__(self, registry: IconRegistry = icon_registry, interval: float = DEFAULT_WATCH_INTERVAL):
+        super().__init__(name='svg-icon-watcher', daemon=True)
+        self.registry = registry
+        self.interval = interval
+        self._stopped = threading.Event()
+
+    def poll(self) -> int:
+        """Poll the registry once and return the number of changed icons."""
+        changes = self.registry.poll()
+        for (library, name), old, new in changes:
+            state = 'added' if old is None else 'removed' if new is None else 'changed'
+            logger.debug(f"SVG icon {state}: {library or 'default'}:{name}")
+        return len(changes)
+
+    def run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            try:
+                self.poll()
+            except Exception:
+                logger.exception("SVG icon watcher poll failed")
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+
+def should_autostart(argv: Optional[List[str]] = None) -> bool:
+    """Return whether ``AppConfig.ready()`` should start the watcher in this process."""
+    autostart = getattr(settings, 'SVG_ICON_WATCH_AUTOSTART', 'auto')
+    if autostart != 'auto':
+        return bool(autostart)
+
+    argv = sys.argv if argv is None else argv
+    script = Path(argv[0]).name if argv else ''
+    is_django_main = script == '__main__.py' and Path(argv[0]).parent.name == 'django'
+    if script not in _MANAGEMENT_SCRIPTS and not is_django_main:
+        # WSGI/ASGI servers and other embedding processes.
+        return True
+    if argv[1:2] != ['runserver']:
+        return False
+    # With the autoreloader only the child process (RUN_MAIN) serves requests.
+    return '--noreload' in argv or os.environ.get('RUN_MAIN') == 'true'
+
+
+def start_icon_watcher() -> IconWatcher:
+    """Start the process-wide watcher, if it is not already running."""
+    global _watcher
+    with _watcher_lock:
+        if _watcher is None or not _watcher.is_alive():
+            interval = float(getattr(settings, 'SVG_ICON_WATCH_INTERVAL', DEFAULT_WATCH_INTERVAL))
+            _watcher = IconWatcher(icon_registry, interval)
+            _watcher.start()
+        return _watcher
+
+
+def stop_icon_watcher() -> None:
+    """Stop the process-wide watcher."""
+    global _watcher
+    with _watcher_lock:
+        if _watcher is not None:
+            _watcher.stop()
+            _watcher = None
\ No newline at end of file
@@ -64,6 +64,9 @@ setup(
             'black>=22.0.0',
             'flake8>=4.0.0',
         ],
+        'jinja2': [
+            'Jinja2>=3.0',
+        ],
     },
     keywords="django svg icons template tags bootstrap heroicons",
     project_urls={
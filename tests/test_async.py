@@ -0,0 +1,111 @@
+"""
+Tests for async icon loading
+"""
+import asyncio
+import threading
+from unittest import mock
+
+import pytest
+from django.core.cache import cache as django_cache
+from django.test import override_settings
+
+from django_svg_icon_tags.registry import icon_registry
+from django_svg_icon_tags.templatetags import svg_icon_tags
+
+
+@pytest.fixture
+def mock_icon_dir(tmp_path):
+    """Create several mock icons"""
+    icon_dir = tmp_path / "icons" / "test"
+    icon_dir.mkdir(parents=True)
+    for name in ("a", "b", "c"):
+        (icon_dir / f"{name}.svg").write_text(f'<svg viewBox="0 0 1 1"><path id="{name}"/></svg>')
+    return str(tmp_path)
+
+
+class TestAgetIcon:
+    """Test the aget_icon() API"""
+
+    def test_loads_and_caches(self, mock_icon_dir):
+        """Test that a cold icon is loaded and then served from memory"""
+        with override_settings(STATICFILES_DIRS=[mock_icon_dir]):
+            svg_content = asyncio.run(svg_icon_tags.aget_icon("test:a"))
+
+            assert 'id="a"' in svg_content.render()
+            with mock.patch.object(svg_icon_tags, "_compile_svg_file") as compile_file:
+                assert asyncio.run(svg_icon_tags.aget_icon("a", "test")) == svg_content
+            compile_file.assert_not_called()
+
+    def test_file_read_off_event_loop(self, mock_icon_dir):
+        """Test that files are read on the load pool, not the loop thread"""
+        threads = []
+        compile_file = svg_icon_tags._compile_svg_file
+
+        def record(path):
+            threads.append(threading.current_thread().name)
+            return compile_file(path)
+
+        with override_settings(STATICFILES_DIRS=[mock_icon_dir]):
+            with mock.patch.object(svg_icon_tags, "_compile_svg_file", side_effect=record):
+                asyncio.run(svg_icon_tags.aget_icon("test:b"))
+
+        assert threads and threads[0].startswith('svg-icon-load')
+
+    @override_settings(SVG_ICON_REGISTRY='lazy', SVG_ICON_INVALIDATION='none')
+    def test_lazy_registry_built_off_event_loop(self, mock_icon_dir):
+        """Test that the first lookup does not scan the finders on the loop thread"""
+        threads = []
+        scan = icon_registry._scan
+
+        def record():
+            threads.append(threading.current_thread().name)
+            return scan()
+
+        with override_settings(STATICFILES_DIRS=[mock_icon_dir]):
+            assert not icon_registry.is_built
+            with mock.patch.object(icon_registry, "_scan", side_effect=record):
+                assert asyncio.run(svg_icon_tags.aget_icon("test:c")) is not None
+
+        assert threads and threads[0].startswith('svg-icon-load')
+
+    def test_missing_and_invalid(self, mock_icon_dir):
+        """Test that unknown and unsafe names return None"""
+        with override_settings(STATICFILES_DIRS=[mock_icon_dir]):
+            assert asyncio.run(svg_icon_tags.aget_icon("test:missing")) is None
+            assert asyncio.run(svg_icon_tags.aget_icon("../etc/passwd")) is None
+
+    def test_uses_async_cache_api(self, mock_icon_dir):
+        """Test that the shared cache is reached through its async methods"""
+        with override_settings(STATICFILES_DIRS=[mock_icon_dir]):
+            with mock.patch.object(svg_icon_tags, "_USE_DJANGO_CACHE", True), \
+                    mock.patch.object(svg_icon_tags, "django_cache", wraps=django_cache) as shared:
+                asyncio.run(svg_icon_tags.aget_icon("test:c"))
+
+            shared.aget.assert_called_once()
+            shared.aset.assert_called_once()
+            shared.get.assert_not_called()
+
+
+class TestAprefetchIcons:
+    """Test the aprefetch_icons() API"""
+
+    def test_warms_local_cache(self, mock_icon_dir):
+        """Test that prefetched icons render without touching the disk"""
+        with override_settings(STATICFILES_DIRS=[mock_icon_dir]):
+            count = asyncio.run(svg_icon_tags.aprefetch_icons(["test:a", ("b", "test"), "test:a", "test:missing"]))
+
+            assert count == 2
+            with mock.patch.object(svg_icon_tags, "_compile_svg_file") as compile_file:
+                assert 'id="b"' in svg_icon_tags.svg_icon("test:b")
+            compile_file.assert_not_called()
+
+    def test_single_async_batch(self, mock_icon_dir):
+        """Test one get_many and one set_many for the whole batch"""
+        with override_settings(STATICFILES_DIRS=[mock_icon_dir]):
+            with mock.patch.object(svg_icon_tags, "_USE_DJANGO_CACHE", True), \
+                    mock.patch.object(svg_icon_tags, "django_cache", wraps=django_cache) as shared:
+                assert asyncio.run(svg_icon_tags.aprefetch_icons(["test:a", "test:b", "test:c"])) == 3
+
+            shared.aget_many.assert_called_once()
+            shared.aset_many.assert_called_once()
+            assert len(shared.aset_many.call_args[0][0]) == 3
\ No newline at end of file
@@ -0,0 +1,111 @@
+"""
+Tests for batch icon rendering
+"""
+from unittest import mock
+
+import pytest
+from django.template import Template, Context
+from django.test import override_settings
+
+from django_svg_icon_tags.templatetags import svg_icon_tags
+
+
+@pytest.fixture
+def mock_icon_dir(tmp_path):
+    """Create several mock icons"""
+    icon_dir = tmp_path / "icons" / "test"
+    icon_dir.mkdir(parents=True)
+    for name in ("a", "b", "c"):
+        (icon_dir / f"{name}.svg").write_text(f'<svg viewBox="0 0 1 1"><path id="{name}"/></svg>')
+    return str(tmp_path)
+
+
+class TestRenderIcons:
+    """Test the render_icons() API"""
+
+    def test_results_follow_spec_order(self, mock_icon_dir):
+        """Test that mixed spec forms are rendered in order"""
+        with override_settings(STATICFILES_DIRS=[mock_icon_dir]):
+            results = svg_icon_tags.render_icons([
+                "test:c",
+                ("a", "test"),
+                {"name": "b", "library": "test", "width": "8"},
+            ], class_name="w-4")
+
+            assert 'id="c"' in results[0]
+            assert 'id="a"' in results[1]
+            assert 'id="b"' in results[2]
+            assert all('class="w-4"' in result for result in results)
+            assert 'width="8"' in results[2]
+
+    def test_duplicates_resolved_once(self, mock_icon_dir):
+        """Test that repeated icons are resolved and loaded only once"""
+        with override_settings(STATICFILES_DIRS=[mock_icon_dir]):
+            with mock.patch.object(svg_icon_tags, "_resolve_icon", wraps=svg_icon_tags._resolve_icon) as resolve:
+                results = svg_icon_tags.render_icons(["test:a"] * 5 + ["test:b"])
+
+            assert len(results) == 6
+            assert resolve.call_count == 2
+
+    def test_single_get_many_for_batch(self, mock_icon_dir):
+        """Test that the shared cache is queried once for the whole batch"""
+        with override_settings(STATICFILES_DIRS=[mock_icon_dir]):
+            with mock.patch.object(svg_icon_tags, "_USE_DJANGO_CACHE", True), \
+                    mock.patch.object(svg_icon_tags, "django_cache") as shared:
+                shared.get_many.return_value = {}
+                svg_icon_tags.render_icons(["test:a", "test:b", "test:c"])
+
+            shared.get_many.assert_called_once()
+            shared.get.assert_not_called()
+
+    def test_missing_and_invalid_icons_fall_back(self, mock_icon_dir):
+        """Test that missing icons keep their slot with the fallback"""
+        with override_settings(STATICFILES_DIRS=[mock_icon_dir]):
+            results = svg_icon_tags.render_icons(["test:missing", "", "test:a"], fallback=False)
+
+            assert results[:2] == ['', '']
+            assert 'id="a"' in results[2]
+
+    @pytest.mark.parametrize('spec', [("a",), ("a", "test", "x"), 42, None, {"name": "a", "colour": "red"}, ("a", 1)])
+    def test_malformed_specs_fall_back(self, mock_icon_dir, spec):
+        """Test that malformed specs keep their slot and are logged instead of raising"""
+        with override_settings(STATICFILES_DIRS=[mock_icon_dir]):
+            with mock.patch.object(svg_icon_tags, "logger") as logger:
+                results = svg_icon_tags.render_icons([spec, "test:a"], fallback=False)
+
+            assert results[0] == ''
+            assert 'id="a"' in results[1]
+            logger.warning.assert_called_once()
+
+    def test_unknown_default_argument_falls_back(self, mock_icon_dir):
+        """Test that an unknown shared argument is reported once for the whole batch"""
+        with override_settings(STATICFILES_DIRS=[mock_icon_dir]):
+            with mock.patch.object(svg_icon_tags, "logger") as logger:
+                results = svg_icon_tags.render_icons(["test:a", "test:b"], colour="red", fallback=False)
+
+            assert results == ['', '']
+            logger.warning.assert_called_once()
+
+
+class TestSvgIconsTag:
+    """Test the svg_icons template tag"""
+
+    def test_renders_iterable(self, mock_icon_dir):
+        """Test rendering an iterable with shared arguments"""
+        with override_settings(STATICFILES_DIRS=[mock_icon_dir]):
+            template = Template('{% load svg_icon_tags %}{% svg_icons names library="test" class_name="w-5" %}')
+            result = template.render(Context({'names': ['a', 'b']}))
+
+            assert result.index('id="a"') < result.index('id="b"')
+            assert result.count('class="w-5"') == 2
+
+    def test_unknown_argument_falls_back(self, mock_icon_dir):
+        """Test that a misspelled argument renders fallbacks instead of raising"""
+        with override_settings(STATICFILES_DIRS=[mock_icon_dir]):
+            template = Template('{% load svg_icon_tags %}{% svg_icons names library="test" colour="red" %}')
+            with mock.patch.object(svg_icon_tags, "logger") as logger:
+                result = template.render(Context({'names': ['a', 'b']}))
+
+            assert 'id="a"' not in result
+            assert result.count('<svg') == 2
+            logger.warning.assert_called()
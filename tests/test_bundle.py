@@ -0,0 +1,56 @@
+"""
+Tests for packed icon bundles
+"""
+import pytest
+from django.core.management import call_command
+from django.template import Template, Context
+from django.test import override_settings
+
+from django_svg_icon_tags.bundle import IconBundle
+
+
+@pytest.fixture
+def mock_icon_dir(tmp_path):
+    """Create mock icons to pack"""
+    icon_dir = tmp_path / "static" / "icons" / "test"
+    icon_dir.mkdir(parents=True)
+    (icon_dir / "star.svg").write_text(
+        '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 16 16"><path d="M1 1"/></svg>'
+    )
+    (icon_dir / "broken.svg").write_text('not an svg')
+    return tmp_path
+
+
+class TestBuildSvgIcons:
+    """Test the build_svg_icons command and bundle serving"""
+
+    def test_builds_sanitized_bundle(self, mock_icon_dir):
+        """Test that valid icons are packed and invalid ones skipped"""
+        output = mock_icon_dir / "icons.bundle"
+        with override_settings(STATICFILES_DIRS=[str(mock_icon_dir / "static")]):
+            call_command('build_svg_icons', output=str(output), stdout=None, stderr=None)
+
+        bundle = IconBundle(str(output))
+        try:
+            assert list(bundle.keys()) == [('test', 'star')]
+            compiled = bundle.get('star', 'test')
+            assert compiled.attrs['viewBox'] == '0 0 16 16'
+            assert compiled.render() == (
+                '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 16 16"><path d="M1 1"/></svg>'
+            )
+        finally:
+            bundle.close()
+
+    def test_renders_from_bundle(self, mock_icon_dir):
+        """Test that icons are served from the bundle once configured"""
+        output = mock_icon_dir / "icons.bundle"
+        with override_settings(STATICFILES_DIRS=[str(mock_icon_dir / "static")]):
+            call_command('build_svg_icons', output=str(output), stdout=None, stderr=None)
+        (mock_icon_dir / "static" / "icons" / "test" / "star.svg").unlink()
+
+        with override_settings(SVG_ICON_BUNDLE=str(output)):
+            template = Template('{% load svg_icon_tags %}{% svg_icon "star" library="test" class_name="w-4" %}')
+            result = template.render(Context({}))
+
+            assert 'class="w-4"' in result
+            assert '<path d="M1 1"/>' in result
\ No newline at end of file
@@ -0,0 +1,267 @@
+"""
+Tests for process-local icon caches
+"""
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from django.template import Template, Context
+from django.test import override_settings
+
+from django_svg_icon_tags.cache import LRUCache
+from django_svg_icon_tags.templatetags import svg_icon_tags
+
+
+@pytest.fixture
+def mock_icon_file(tmp_path):
+    """Create a mock SVG icon file for testing"""
+    icon_dir = tmp_path / "icons" / "test"
+    icon_dir.mkdir(parents=True)
+    (icon_dir / "test-icon.svg").write_text('<svg xmlns="http://www.w3.org/2000/svg"><path d="M0 0"/></svg>')
+    return str(tmp_path)
+
+
+class TestLRUCache:
+    """Test the bounded LRU cache"""
+
+    def test_evicts_least_recently_used(self):
+        """Test that the oldest untouched entry is evicted first"""
+        cache = LRUCache(maxsize=2)
+        cache.set('a', 'x')
+        cache.set('b', 'y')
+        cache.get('a')
+        cache.set('c', 'z')
+
+        assert 'a' in cache
+        assert 'b' not in cache
+        assert 'c' in cache
+
+    def test_counts_hits_and_misses(self):
+        """Test hit/miss statistics"""
+        cache = LRUCache(maxsize=4)
+        cache.set('a', 'x')
+        cache.get('a')
+        cache.get('missing')
+
+        info = cache.info()
+        assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+    def test_zero_size_disables_storage(self):
+        """Test that maxsize=0 never stores values"""
+        cache = LRUCache(maxsize=0)
+        cache.set('a', 'x')
+
+        assert cache.get('a') is None
+
+    def test_byte_bound_and_eviction_count(self):
+        """Test eviction by total value size"""
+        cache = LRUCache(maxsize=10, max_bytes=5)
+        cache.set('a', 'xxx')
+        cache.set('b', 'yyy')
+
+        info = cache.info()
+        assert 'a' not in cache
+        assert (info.currsize, info.bytes, info.evictions) == (1, 3, 1)
+
+    def test_text_counted_in_utf8_bytes(self):
+        """Test that string values are sized by their encoded length"""
+        cache = LRUCache(maxsize=10)
+        cache.set('a', '★')
+
+        assert cache.info().bytes == 3
+
+    def test_pinned_entries_are_never_evicted(self):
+        """Test that pinned entries survive eviction pressure"""
+        cache = LRUCache(maxsize=1)
+        cache.set('pinned', 'x', pin=True)
+        cache.set('a', 'y')
+        cache.set('b', 'z')
+
+        assert cache.get('pinned') == 'x'
+        assert 'a' not in cache
+        assert cache.info().pinned == 1
+
+
+class TestRenderCache:
+    """Test memoization of rendered svg_icon output"""
+
+    def test_identical_calls_hit_cache(self, mock_icon_file):
+        """Test that repeated identical icons are served from the cache"""
+        with override_settings(STATICFILES_DIRS=[mock_icon_file]):
+            template = Template('{% load svg_icon_tags %}{% svg_icon "test-icon" library="test" class_name=cls %}')
+            first = template.render(Context({'cls': 'w-4'}))
+            second = template.render(Context({'cls': 'w-4'}))
+
+            assert first == second
+            assert svg_icon_tags.render_cache_info().hits == 1
+
+    def test_different_arguments_are_separate_entries(self, mock_icon_file):
+        """Test that argument changes produce distinct cache entries"""
+        with override_settings(STATICFILES_DIRS=[mock_icon_file]):
+            small = svg_icon_tags.svg_icon("test-icon", library="test", width="16")
+            large = svg_icon_tags.svg_icon("test-icon", library="test", width="32")
+
+            assert 'width="16"' in small
+            assert 'width="32"' in large
+            assert svg_icon_tags.render_cache_info().currsize == 2
+
+    @override_settings(SVG_ICON_RENDER_CACHE_SIZE=0)
+    def test_cache_can_be_disabled(self, mock_icon_file):
+        """Test that SVG_ICON_RENDER_CACHE_SIZE=0 disables memoization"""
+        with override_settings(STATICFILES_DIRS=[mock_icon_file]):
+            svg_icon_tags.svg_icon("test-icon", library="test")
+            svg_icon_tags.svg_icon("test-icon", library="test")
+
+            assert svg_icon_tags.render_cache_info().currsize == 0
+
+
+class TestIconCache:
+    """Test the settings-driven compiled-icon cache"""
+
+    @override_settings(SVG_ICON_CACHE_MAX_ENTRIES=1, SVG_ICON_RENDER_CACHE_SIZE=0)
+    def test_max_entries_setting(self, tmp_path):
+        """Test that SVG_ICON_CACHE_MAX_ENTRIES bounds the cache"""
+        icon_dir = tmp_path / "icons" / "test"
+        icon_dir.mkdir(parents=True)
+        for name in ("a", "b"):
+            (icon_dir / f"{name}.svg").write_text('<svg><path/></svg>')
+
+        with override_settings(STATICFILES_DIRS=[str(tmp_path)]):
+            svg_icon_tags.svg_icon("a", library="test")
+            svg_icon_tags.svg_icon("b", library="test")
+
+            info = svg_icon_tags.icon_cache_info()
+            assert (info.maxsize, info.currsize, info.evictions) == (1, 1, 1)
+
+    @override_settings(SVG_ICON_CACHE_MAX_ENTRIES=0, SVG_ICON_CACHE_PIN_LIBRARIES=["test"])
+    def test_warm_pinned_library(self, mock_icon_file):
+        """Test warming and pinning a whole library"""
+        with override_settings(STATICFILES_DIRS=[mock_icon_file]):
+            assert svg_icon_tags.warm_icon_cache(["test"]) == 1
+
+            info = svg_icon_tags.icon_cache_info()
+            assert info.pinned == 1
+            assert info.bytes > 0
+
+            svg_icon_tags.clear_icon_cache()
+            assert svg_icon_tags.icon_cache_info().currsize == 0
+
+
+class TestTieredCache:
+    """Test local-first lookups and batch prefetching"""
+
+    def test_local_hit_skips_shared_cache(self, mock_icon_file):
+        """Test that a warm process-local entry avoids the Django cache"""
+        with override_settings(STATICFILES_DIRS=[mock_icon_file], SVG_ICON_RENDER_CACHE_SIZE=0):
+            svg_icon_tags.svg_icon("test-icon", library="test")
+            with mock.patch.object(svg_icon_tags, "django_cache") as shared:
+                svg_icon_tags.svg_icon("test-icon", library="test")
+
+            shared.get.assert_not_called()
+
+    def test_shared_cache_key_is_versioned(self):
+        """Test that shared-cache keys cannot collide with the pre-compilation format"""
+        key = svg_icon_tags._shared_cache_key("test-icon", "test", 1.0)
+
+        assert key.startswith(f"svg_icon:v{svg_icon_tags._SHARED_CACHE_VERSION}:")
+
+    def test_foreign_shared_cache_value_is_a_miss(self, mock_icon_file):
+        """Test that a plain string left in the Django cache is recompiled, not rendered"""
+        with override_settings(STATICFILES_DIRS=[mock_icon_file], SVG_ICON_RENDER_CACHE_SIZE=0):
+            with mock.patch.object(svg_icon_tags, "_USE_DJANGO_CACHE", True), \
+                    mock.patch.object(svg_icon_tags, "django_cache") as shared:
+                shared.get.return_value = '<svg><path d="stale"/></svg>'
+                result = svg_icon_tags.svg_icon("test-icon", library="test")
+
+                assert 'd="M0 0"' in result
+                shared.set.assert_called_once()
+
+    def test_foreign_shared_cache_value_is_a_miss_in_prefetch(self, mock_icon_file):
+        """Test that prefetching ignores non-compiled values returned by get_many"""
+        with override_settings(STATICFILES_DIRS=[mock_icon_file], SVG_ICON_RENDER_CACHE_SIZE=0):
+            with mock.patch.object(svg_icon_tags, "_USE_DJANGO_CACHE", True), \
+                    mock.patch.object(svg_icon_tags, "django_cache") as shared:
+                mtime = (Path(mock_icon_file) / "icons" / "test" / "test-icon.svg").stat().st_mtime
+                key = svg_icon_tags._shared_cache_key("test-icon", "test", mtime)
+                shared.get_many.return_value = {key: '<svg><path d="stale"/></svg>'}
+
+                assert svg_icon_tags.prefetch_icons(["test:test-icon"]) == 1
+                shared.set_many.assert_called_once()
+                assert 'd="M0 0"' in svg_icon_tags.svg_icon("test-icon", library="test")
+
+    def test_prefetch_uses_single_get_many(self, tmp_path):
+        """Test that prefetching many icons costs one shared-cache round trip"""
+        icon_dir = tmp_path / "icons" / "test"
+        icon_dir.mkdir(parents=True)
+        for name in ("a", "b", "c"):
+            (icon_dir / f"{name}.svg").write_text(f'<svg><path id="{name}"/></svg>')
+
+        with override_settings(STATICFILES_DIRS=[str(tmp_path)]):
+            with mock.patch.object(svg_icon_tags, "_USE_DJANGO_CACHE", True), \
+                    mock.patch.object(svg_icon_tags, "django_cache") as shared:
+                shared.get_many.return_value = {}
+                warmed = svg_icon_tags.prefetch_icons(["test:a", "test:b", ("c", "test"), "test:missing"])
+
+                assert warmed == 3
+                shared.get_many.assert_called_once()
+                shared.set_many.assert_called_once()
+                shared.get.assert_not_called()
+
+                result = svg_icon_tags.svg_icon("b", library="test")
+                assert 'id="b"' in result
+                shared.get.assert_not_called()
+
+    def test_prefetch_tag_renders_nothing(self, mock_icon_file):
+        """Test the svg_icon_prefetch template tag"""
+        with override_settings(STATICFILES_DIRS=[mock_icon_file]):
+            template = Template('{% load svg_icon_tags %}{% svg_icon_prefetch "test:test-icon" names %}')
+            result = template.render(Context({'names': ['test:test-icon']}))
+
+            assert result == ''
+
+
+class TestMissCache:
+    """Test the negative lookup cache for missing icons"""
+
+    def test_miss_skips_finders(self, mock_icon_file):
+        """Test that a repeated miss does not rescan the static finders"""
+        with override_settings(STATICFILES_DIRS=[mock_icon_file], SVG_ICON_REGISTRY=None):
+            with mock.patch.object(svg_icon_tags.finders, "find", return_value=None) as find:
+                for _ in range(3):
+                    svg_icon_tags.svg_icon("test:missing")
+
+            find.assert_called_once()
+            assert svg_icon_tags.miss_cache_info().hits == 2
+
+    def test_miss_expires(self, mock_icon_file):
+        """Test that an icon added later is found once the miss expires"""
+        with override_settings(
+            STATICFILES_DIRS=[mock_icon_file], SVG_ICON_REGISTRY=None, SVG_ICON_MISS_CACHE_TIMEOUT=5,
+        ):
+            with mock.patch.object(svg_icon_tags.time, "monotonic", return_value=100.0):
+                assert 'd="M0 0"' not in svg_icon_tags.svg_icon("test:late")
+                (Path(mock_icon_file) / "icons" / "test" / "late.svg").write_text('<svg><path d="M0 0"/></svg>')
+                assert 'd="M0 0"' not in svg_icon_tags.svg_icon("test:late")
+            with mock.patch.object(svg_icon_tags.time, "monotonic", return_value=106.0):
+                assert 'd="M0 0"' in svg_icon_tags.svg_icon("test:late")
+
+    def test_timeout_zero_disables(self, mock_icon_file):
+        """Test that SVG_ICON_MISS_CACHE_TIMEOUT=0 turns the cache off"""
+        with override_settings(
+            STATICFILES_DIRS=[mock_icon_file], SVG_ICON_REGISTRY=None, SVG_ICON_MISS_CACHE_TIMEOUT=0,
+        ):
+            with mock.patch.object(svg_icon_tags.finders, "find", return_value=None) as find:
+                svg_icon_tags.svg_icon("test:missing")
+                svg_icon_tags.svg_icon("test:missing")
+
+            assert find.call_count == 2
+
+    def test_fallback_warning_rate_limited(self, mock_icon_file):
+        """Test that repeated fallbacks log one warning per interval"""
+        with override_settings(STATICFILES_DIRS=[mock_icon_file], SVG_ICON_REGISTRY=None):
+            with mock.patch.object(svg_icon_tags, "logger") as logger:
+                for _ in range(5):
+                    svg_icon_tags.svg_icon("test:missing")
+                svg_icon_tags.svg_icon("test:other")
+
+            assert logger.warning.call_count == 2
\ No newline at end of file
@@ -0,0 +1,49 @@
+"""
+Tests for compiled SVG rendering
+"""
+from django_svg_icon_tags.compiled import compile_svg
+
+
+class TestCompileSvg:
+    """Test splitting and re-joining SVG markup"""
+
+    def test_default_render_keeps_attributes(self):
+        """Test that rendering without overrides keeps the source attributes"""
+        compiled = compile_svg('<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 16 16"><path d="M0 0"/></svg>')
+
+        assert compiled.render() == '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 16 16"><path d="M0 0"/></svg>'
+
+    def test_override_replaces_existing_attribute(self):
+        """Test that injected attributes do not duplicate source attributes"""
+        compiled = compile_svg('<svg width="16" fill="currentColor" class="bi"><path/></svg>')
+        result = compiled.render({'width': '32', 'class': 'icon'})
+
+        assert result.count('width=') == 1
+        assert result.count('class=') == 1
+        assert 'width="32"' in result
+        assert 'class="icon"' in result
+        assert 'fill="currentColor"' in result
+
+    def test_inner_markup_follows_root_tag(self):
+        """Test that inner markup is inserted right after the root start tag"""
+        compiled = compile_svg('<svg viewBox="0 0 1 1"><path/></svg>')
+
+        assert compiled.render(inner='<title>T</title>') == '<svg viewBox="0 0 1 1"><title>T</title><path/></svg>'
+
+    def test_quote_styles_and_self_closing_root(self):
+        """Test single-quoted values and self-closing root tags"""
+        compiled = compile_svg("<svg data-x='a\"b' viewBox='0 0 1 1'/>")
+
+        assert compiled.attrs == {'data-x': 'a&quot;b', 'viewBox': '0 0 1 1'}
+        assert compiled.render() == '<svg data-x="a&quot;b" viewBox="0 0 1 1"></svg>'
+
+    def test_missing_root_returns_none(self):
+        """Test that markup without a root svg tag is rejected"""
+        assert compile_svg('<div></div>') is None
+
+    def test_size_counts_utf8_bytes(self):
+        """Test that size is the encoded length of the default rendering"""
+        compiled = compile_svg('<svg aria-label="ستاره"><title>★</title></svg>')
+
+        assert compiled.size == len(compiled.render().encode('utf-8'))
+        assert compiled.size > len(compiled.render())
@@ -0,0 +1,141 @@
+"""
+Tests for icon render instrumentation
+"""
+import asyncio
+from unittest import mock
+
+import pytest
+from django.http import HttpResponse
+from django.template import Template, Context
+from django.test import RequestFactory, override_settings
+
+from django_svg_icon_tags.instrumentation import (
+    collect_icon_stats, current_icon_stats, icon_stats_collected,
+)
+from django_svg_icon_tags.middleware import icon_timing_middleware
+from django_svg_icon_tags.templatetags import svg_icon_tags
+
+
+@pytest.fixture
+def mock_icon_dir(tmp_path):
+    """Create a mock icon"""
+    icon_dir = tmp_path / "icons" / "test"
+    icon_dir.mkdir(parents=True)
+    (icon_dir / "star.svg").write_text('<svg viewBox="0 0 1 1"><path d="M0 0"/></svg>')
+    return str(tmp_path)
+
+
+class TestCollectIconStats:
+    """Test collect_icon_stats()"""
+
+    def test_counts_modes_and_tiers(self, mock_icon_dir):
+        """Test render mode, cache tier and byte counters"""
+        with override_settings(STATICFILES_DIRS=[mock_icon_dir]):
+            with collect_icon_stats() as stats:
+                first = svg_icon_tags.svg_icon("test:star")
+                svg_icon_tags.svg_icon("test:star")
+                svg_icon_tags.svg_icon("test:star", class_name="a")
+                svg_icon_tags.svg_icon("test:star", inline=False)
+                svg_icon_tags.svg_icon("test:missing")
+
+            assert stats.icons == 5
+            assert (stats.inline, stats.img, stats.fallbacks) == (3, 1, 1)
+            assert stats.disk_loads == 1
+            assert stats.render_hits == 1
+            assert stats.local_hits == 2
+            assert stats.bytes > 3 * len(first)
+            assert stats.duration > 0
+
+    def test_folded_template_icons(self, mock_icon_dir):
+        """Test that icons folded into a template are still counted"""
+        with override_settings(STATICFILES_DIRS=[mock_icon_dir], SVG_ICON_INVALIDATION='none'):
+            template = Template('{% load svg_icon_tags %}{% svg_icon "test:star" %}')
+            template.render(Context({}))
+            with collect_icon_stats() as stats:
+                template.render(Context({}))
+
+            assert (stats.icons, stats.folded) == (1, 1)
+
+    def test_idle_outside_collection(self):
+        """Test that nothing is recorded outside a collection"""
+        with collect_icon_stats():
+            pass
+        assert current_icon_stats() is None
+
+    def test_nested_collection_counts_in_both(self, mock_icon_dir):
+        """Test that icons counted by an inner collection also reach the outer one"""
+        with override_settings(STATICFILES_DIRS=[mock_icon_dir]):
+            with collect_icon_stats() as outer:
+                svg_icon_tags.svg_icon("test:star")
+                with collect_icon_stats() as inner:
+                    svg_icon_tags.svg_icon("test:star")
+                    svg_icon_tags.svg_icon("test:missing")
+
+            assert (inner.icons, inner.fallbacks) == (2, 1)
+            assert (outer.icons, outer.fallbacks) == (3, 1)
+            assert outer.duration >= inner.duration
+
+    def test_signal_sent(self):
+        """Test that icon_stats_collected carries the stats and request"""
+        received = []
+
+        def handler(sender, stats, request, **kwargs):
+            received.append((stats, request))
+
+        icon_stats_collected.connect(handler)
+        try:
+            with collect_icon_stats(request="req") as stats:
+                pass
+        finally:
+            icon_stats_collected.disconnect(handler)
+
+        assert received == [(stats, "req")]
+
+
+class TestIconTimingMiddleware:
+    """Test the Server-Timing middleware"""
+
+    def _view(self, request):
+        return HttpResponse(svg_icon_tags.svg_icon("test:star"))
+
+    def test_sync_server_timing(self, mock_icon_dir):
+        """Test the header on a sync request"""
+        with override_settings(STATICFILES_DIRS=[mock_icon_dir]):
+            response = icon_timing_middleware(self._view)(RequestFactory().get('/'))
+
+        assert response['Server-Timing'].startswith('svg-icons;dur=')
+        assert '1 icons' in response['Server-Timing']
+
+    def test_async_server_timing(self, mock_icon_dir):
+        """Test the header on an async request, appended to existing timings"""
+        async def view(request):
+            response = self._view(request)
+            response['Server-Timing'] = 'db;dur=2'
+            return response
+
+        with override_settings(STATICFILES_DIRS=[mock_icon_dir]):
+            response = asyncio.run(icon_timing_middleware(view)(RequestFactory().get('/')))
+
+        assert response['Server-Timing'].startswith('db;dur=2, svg-icons;dur=')
+
+    def test_with_debug_toolbar_panel(self, mock_icon_dir):
+        """Test that the header still counts icons when the toolbar panel collects too"""
+        panels = pytest.importorskip("django_svg_icon_tags.panels")
+
+        def panel_middleware(request):
+            panel = panels.SvgIconPanel(mock.MagicMock(), self._view)
+            response = panel.process_request(request)
+            response.panel_stats = panel._stats
+            return response
+
+        with override_settings(STATICFILES_DIRS=[mock_icon_dir]):
+            response = icon_timing_middleware(panel_middleware)(RequestFactory().get('/'))
+
+        assert response.panel_stats.icons == 1
+        assert '1 icons' in response['Server-Timing']
+
+    def test_no_header_without_icons(self):
+        """Test that pages without icons get no metric"""
+        response = icon_timing_middleware(lambda request: HttpResponse())(RequestFactory().get('/'))
+
+        assert 'Server-Timing' not in response
\ No newline at end of file
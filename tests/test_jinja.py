@@ -0,0 +1,87 @@
+"""
+Tests for the Jinja2 extension
+"""
+import os
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from django.test import override_settings
+
+jinja2 = pytest.importorskip("jinja2")
+
+from django_svg_icon_tags.jinja import SvgIconExtension  # noqa: E402
+from django_svg_icon_tags.registry import icon_registry  # noqa: E402
+from django_svg_icon_tags.templatetags import svg_icon_tags  # noqa: E402
+
+
+@pytest.fixture
+def mock_icon_dir(tmp_path):
+    """Create a mock icon"""
+    icon_dir = tmp_path / "icons" / "test"
+    icon_dir.mkdir(parents=True)
+    (icon_dir / "star.svg").write_text('<svg viewBox="0 0 1 1"><path d="M0 0"/></svg>')
+    return str(tmp_path)
+
+
+@pytest.fixture
+def env():
+    return jinja2.Environment(extensions=[SvgIconExtension], autoescape=True)
+
+
+class TestSvgIconExtension:
+    """Test the {% svg_icon %} Jinja2 tag and globals"""
+
+    def test_literal_tag_folded(self, mock_icon_dir, env):
+        """Test that an all-literal tag renders while compiling only"""
+        with override_settings(STATICFILES_DIRS=[mock_icon_dir], SVG_ICON_INVALIDATION='none'):
+            template = env.from_string('{% svg_icon "test:star", class_name="w-4" %}')
+            with mock.patch.object(svg_icon_tags, "svg_icon", wraps=svg_icon_tags.svg_icon) as render:
+                results = {template.render() for _ in range(3)}
+
+            assert len(results) == 1
+            assert 'class="w-4"' in results.pop()
+            render.assert_not_called()
+
+    def test_folded_output_dropped_on_settings_change(self, mock_icon_dir, env):
+        """Test that folded markup does not outlive the settings it used"""
+        with override_settings(STATICFILES_DIRS=[mock_icon_dir]):
+            template = env.from_string('{% svg_icon "test:star" %}')
+            with override_settings(SVG_ICON_OPTIMIZE=True):
+                with mock.patch.object(svg_icon_tags, "svg_icon", return_value="changed"):
+                    assert template.render() == "changed"
+
+    def test_folded_output_follows_icon_entry(self, mock_icon_dir, env):
+        """Test that an edited icon stops serving its folded markup"""
+        with override_settings(STATICFILES_DIRS=[mock_icon_dir], SVG_ICON_INVALIDATION='none'):
+            template = env.from_string('{% svg_icon "test:star" %}')
+            star = Path(mock_icon_dir) / "icons" / "test" / "star.svg"
+            star.write_text('<svg viewBox="0 0 1 1"><path d="M1 1"/></svg>')
+            os.utime(star, (1, 1))
+            icon_registry.refresh()
+
+            assert 'd="M1 1"' in template.render()
+
+    def test_variable_arguments(self, mock_icon_dir, env):
+        """Test that variables are resolved and escaped per render"""
+        with override_settings(STATICFILES_DIRS=[mock_icon_dir]):
+            template = env.from_string('{% svg_icon name, class_name=cls %}')
+            result = template.render(name="test:star", cls='"><x')
+
+            assert 'd="M0 0"' in result
+            assert '"><x' not in result
+
+    def test_globals_and_filter(self, mock_icon_dir, env):
+        """Test the svg_icon/icon globals and the svg_icon_simple filter"""
+        with override_settings(STATICFILES_DIRS=[mock_icon_dir]):
+            result = env.from_string(
+                '{{ svg_icon("star", library="test") }}{{ icon("test:star") }}{{ "test:star"|svg_icon_simple }}'
+            ).render()
+
+            assert result.count('d="M0 0"') == 3
+            assert '&lt;svg' not in result
+
+    def test_invalid_arguments(self, env):
+        """Test that unknown arguments fail at compile time"""
+        with pytest.raises(jinja2.TemplateSyntaxError):
+            env.from_string('{% svg_icon "star", colour="red" %}')
\ No newline at end of file
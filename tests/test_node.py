@@ -0,0 +1,124 @@
+"""
+Tests for the compiled svg_icon template node
+"""
+import os
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from django.template import Template, Context, TemplateSyntaxError
+from django.test import override_settings
+
+from django_svg_icon_tags.registry import icon_registry
+from django_svg_icon_tags.templatetags import svg_icon_tags
+
+
+@pytest.fixture
+def mock_icon_dir(tmp_path):
+    """Create a mock icon"""
+    icon_dir = tmp_path / "icons" / "test"
+    icon_dir.mkdir(parents=True)
+    (icon_dir / "star.svg").write_text('<svg viewBox="0 0 1 1"><path d="M0 0"/></svg>')
+    return str(tmp_path)
+
+
+def _node(source):
+    template = Template('{% load svg_icon_tags %}' + source)
+    return template, [node for node in template.nodelist if isinstance(node, svg_icon_tags.SvgIconNode)][0]
+
+
+class TestSvgIconNode:
+    """Test compile-time argument handling of {% svg_icon %}"""
+
+    def test_literals_resolved_at_compile_time(self):
+        """Test that literal arguments and library:name are parsed once"""
+        _, node = _node('{% svg_icon "test:star" width=16 inline=False class_name=cls %}')
+
+        assert node.constants == {'name': 'test:star', 'width': 16, 'inline': False}
+        assert list(node.variables) == ['class_name']
+        assert node.icon == ('star', 'test')
+
+    def test_literal_output_folded(self, mock_icon_dir):
+        """Test that an all-literal tag resolves and renders only once"""
+        with override_settings(STATICFILES_DIRS=[mock_icon_dir], SVG_ICON_INVALIDATION='none'):
+            template, _ = _node('{% svg_icon "test:star" class_name="w-4" %}')
+            with mock.patch.object(svg_icon_tags, "_render_icon", wraps=svg_icon_tags._render_icon) as render:
+                results = {template.render(Context({})) for _ in range(3)}
+
+            assert len(results) == 1
+            assert 'class="w-4"' in results.pop()
+            assert render.call_count == 1
+
+    def test_icon_change_drops_only_its_folded_output(self, mock_icon_dir):
+        """Test that a changed icon re-renders its own tags and leaves other folded tags alone"""
+        (Path(mock_icon_dir) / "icons" / "test" / "dot.svg").write_text('<svg><circle r="1"/></svg>')
+        with override_settings(STATICFILES_DIRS=[mock_icon_dir], SVG_ICON_INVALIDATION='none'):
+            star, _ = _node('{% svg_icon "test:star" %}')
+            dot, _ = _node('{% svg_icon "test:dot" %}')
+            star.render(Context({}))
+            dot.render(Context({}))
+            generation = svg_icon_tags.render_generation()
+
+            edited = Path(mock_icon_dir) / "icons" / "test" / "star.svg"
+            edited.write_text('<svg viewBox="0 0 1 1"><path d="M1 1"/></svg>')
+            os.utime(edited, (1, 1))
+            icon_registry.refresh()
+
+            with mock.patch.object(svg_icon_tags, "_render_icon", wraps=svg_icon_tags._render_icon) as render:
+                assert 'd="M1 1"' in star.render(Context({}))
+                assert 'r="1"' in dot.render(Context({}))
+
+            assert render.call_count == 1
+            assert svg_icon_tags.render_generation() == generation
+
+    def test_folded_output_dropped_on_settings_change(self, mock_icon_dir):
+        """Test that folded markup does not outlive the settings it used"""
+        with override_settings(STATICFILES_DIRS=[mock_icon_dir]):
+            template, _ = _node('{% svg_icon "test:star" %}')
+            assert 'd="M0 0"' in template.render(Context({}))
+            with override_settings(SVG_ICON_OPTIMIZE=True):
+                with mock.patch.object(svg_icon_tags, "_render_icon", return_value="changed") as render:
+                    assert template.render(Context({})) == "changed"
+            render.assert_called_once()
+
+    @override_settings(DEBUG=True)
+    def test_no_folding_in_debug(self, mock_icon_dir):
+        """Test that development servers re-render literal tags"""
+        with override_settings(STATICFILES_DIRS=[mock_icon_dir]):
+            template, node = _node('{% svg_icon "test:star" %}')
+            template.render(Context({}))
+
+            assert node._folded is None
+
+    def test_variables_resolved_per_render(self, mock_icon_dir):
+        """Test that variable arguments still change the output"""
+        with override_settings(STATICFILES_DIRS=[mock_icon_dir]):
+            template = Template('{% load svg_icon_tags %}{% svg_icon icon_name class_name=cls %}')
+
+            first = template.render(Context({'icon_name': 'test:star', 'cls': 'a'}))
+            second = template.render(Context({'icon_name': 'test:missing', 'cls': 'b'}))
+
+            assert 'class="a"' in first and 'd="M0 0"' in first
+            assert 'd="M0 0"' not in second
+
+    def test_as_variable(self, mock_icon_dir):
+        """Test storing the output in a context variable"""
+        with override_settings(STATICFILES_DIRS=[mock_icon_dir]):
+            template = Template('{% load svg_icon_tags %}{% svg_icon "test:star" as star %}[{{ star }}]')
+            result = template.render(Context({}))
+
+            assert result.startswith('[<svg')
+
+    def test_folded_sprite_records_symbol(self, mock_icon_dir):
+        """Test that folded sprite icons still register their symbol"""
+        with override_settings(STATICFILES_DIRS=[mock_icon_dir]):
+            template = Template('{% load svg_icon_tags %}{% svg_icon "test:star" sprite=True %}{% svg_sprite %}')
+            template.render(Context({}))
+            result = template.render(Context({}))
+
+            assert '<symbol id="test:star"' in result
+
+    def test_invalid_arguments(self):
+        """Test that unknown arguments fail at compile time"""
+        with pytest.raises(TemplateSyntaxError):
+            Template('{% load svg_icon_tags %}{% svg_icon "star" colour="red" %}')
\ No newline at end of file
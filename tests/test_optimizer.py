@@ -0,0 +1,85 @@
+"""
+Tests for the SVG optimization pass
+"""
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.template import Template, Context
+from django.test import override_settings
+
+from django_svg_icon_tags.optimizer import optimize_svg
+from django_svg_icon_tags.templatetags import svg_icon_tags
+
+
+@pytest.fixture
+def mock_icon_dir(tmp_path):
+    """Create an unoptimized mock icon"""
+    icon_dir = tmp_path / "icons" / "test"
+    icon_dir.mkdir(parents=True)
+    (icon_dir / "loose.svg").write_text(
+        '<svg xmlns="http://www.w3.org/2000/svg" version="1.1" viewBox="0 0 24 24">\n'
+        '  <!-- exported -->\n'
+        '  <path d="M 2.123456 0.50 L 10 , 12" opacity="1"/>\n'
+        '</svg>\n'
+    )
+    return str(tmp_path)
+
+
+class TestOptimizeSvg:
+    """Test optimize_svg()"""
+
+    def test_minifies_markup(self):
+        """Test whitespace, comment, precision and default-attribute passes"""
+        result = optimize_svg(
+            '<svg version="1.1">\n  <!-- x -->\n  <rect x="0" y="0" width="4.00049" class=""/>\n'
+            '  <path d="M 1.9999.5 L 0.25 , -3"/>\n</svg>'
+        )
+        assert result == '<svg><rect width="4"/><path d="M2 .5L.25,-3"/></svg>'
+
+    def test_keeps_inherited_and_text(self):
+        """Test that inherited attributes and text whitespace survive"""
+        svg = '<svg><g stroke-width="1"><text x="0"> a <tspan>b</tspan></text></g></svg>'
+        assert optimize_svg(svg) == svg
+
+    def test_precision(self):
+        """Test that the number of decimals kept is configurable"""
+        assert optimize_svg('<svg><path d="M1.23456 0"/></svg>', precision=1) == '<svg><path d="M1.2 0"/></svg>'
+
+
+class TestOptimizationSetting:
+    """Test SVG_ICON_OPTIMIZE integration"""
+
+    def test_disabled_by_default(self, mock_icon_dir):
+        """Test that icons are served unoptimized unless enabled"""
+        with override_settings(STATICFILES_DIRS=[mock_icon_dir]):
+            result = Template('{% load svg_icon_tags %}{% svg_icon "test:loose" %}').render(Context({}))
+
+            assert 'M 2.123456 0.50' in result
+
+    def test_enabled_output_is_cached(self, mock_icon_dir):
+        """Test that the optimized markup is what gets rendered and cached"""
+        with override_settings(STATICFILES_DIRS=[mock_icon_dir], SVG_ICON_OPTIMIZE=True):
+            result = Template('{% load svg_icon_tags %}{% svg_icon "test:loose" %}').render(Context({}))
+
+            assert '<path d="M2.123 .5L10,12"/></svg>' in result
+            assert svg_icon_tags._shared_cache_key('loose', 'test', 1.0).endswith(':opt3')
+            assert svg_icon_tags.icon_cache_info().currsize == 1
+
+    def test_report(self, mock_icon_dir):
+        """Test the per-library savings report"""
+        with override_settings(STATICFILES_DIRS=[mock_icon_dir]):
+            report = svg_icon_tags.optimization_report()
+
+            stats = report['test']
+            assert stats.icons == 1
+            assert 0 < stats.optimized_bytes < stats.original_bytes
+            assert stats.saved_bytes == stats.original_bytes - stats.optimized_bytes
+
+    def test_report_command_without_output(self, mock_icon_dir):
+        """Test that build_svg_icons --report runs without a bundle path"""
+        out = StringIO()
+        with override_settings(STATICFILES_DIRS=[mock_icon_dir], SVG_ICON_BUNDLE=None, SVG_ICON_URL_MANIFEST=None):
+            call_command('build_svg_icons', '--report', stdout=out)
+
+        assert out.getvalue().startswith('test: 1 icons, ')
\ No newline at end of file
@@ -0,0 +1,40 @@
+"""
+Tests for startup icon preloading
+"""
+import pytest
+from django.apps import apps
+from django.test import override_settings
+
+from django_svg_icon_tags.templatetags import svg_icon_tags
+
+
+@pytest.fixture
+def mock_icon_dir(tmp_path):
+    """Create icons in two libraries"""
+    for library, names in (("alpha", ("arrow-up", "arrow-down", "star")), ("beta", ("star",))):
+        icon_dir = tmp_path / "icons" / library
+        icon_dir.mkdir(parents=True)
+        for name in names:
+            (icon_dir / f"{name}.svg").write_text(f'<svg><path id="{library}-{name}"/></svg>')
+    return str(tmp_path)
+
+
+class TestPreload:
+    """Test SVG_ICON_PRELOAD handling"""
+
+    def test_library_and_name_globs(self, mock_icon_dir):
+        """Test library names, library globs and name globs"""
+        with override_settings(STATICFILES_DIRS=[mock_icon_dir]):
+            assert svg_icon_tags.preload_icons(["beta"]) == 1
+            assert svg_icon_tags.preload_icons(["alpha:arrow-*"]) == 2
+            assert svg_icon_tags.preload_icons(["*"]) == 4
+
+    def test_ready_preloads_configured_icons(self, mock_icon_dir, caplog):
+        """Test that AppConfig.ready() warms the cache and logs the result"""
+        with override_settings(STATICFILES_DIRS=[mock_icon_dir], SVG_ICON_PRELOAD=["alpha"]):
+            svg_icon_tags.clear_icon_cache()
+            with caplog.at_level("INFO", logger="django_svg_icon_tags"):
+                apps.get_app_config("django_svg_icon_tags").ready()
+
+            assert svg_icon_tags.icon_cache_info().currsize == 3
+            assert "Preloaded 3 SVG icons" in caplog.text
\ No newline at end of file
@@ -0,0 +1,170 @@
+"""
+Tests for the in-memory icon registry
+"""
+import os
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from django.template import Template, Context
+from django.test import override_settings
+
+from django_svg_icon_tags.registry import get_invalidation_mode, icon_changed, icon_registry
+from django_svg_icon_tags.templatetags import svg_icon_tags
+from django_svg_icon_tags.watcher import IconWatcher, should_autostart
+
+
+@pytest.fixture
+def icon_root(tmp_path):
+    """Create a static directory with a library and a root-level icon"""
+    lib_dir = tmp_path / "icons" / "test"
+    lib_dir.mkdir(parents=True)
+    (lib_dir / "test-icon.svg").write_text('<svg xmlns="http://www.w3.org/2000/svg"><path d="M0 0"/></svg>')
+    (tmp_path / "icons" / "root-icon.svg").write_text('<svg xmlns="http://www.w3.org/2000/svg"><path d="M1 1"/></svg>')
+    return str(tmp_path)
+
+
+class TestIconRegistry:
+    """Test registry indexing and lookups"""
+
+    def test_indexes_library_and_root_icons(self, icon_root):
+        """Test that icons are keyed by (library, name)"""
+        with override_settings(STATICFILES_DIRS=[icon_root]):
+            assert icon_registry.get("test-icon", "test") is not None
+            assert icon_registry.get("root-icon") is not None
+            assert icon_registry.get("missing", "test") is None
+
+    def test_settings_change_resets_index(self, icon_root, tmp_path_factory):
+        """Test that overriding STATICFILES_DIRS invalidates the index"""
+        with override_settings(STATICFILES_DIRS=[icon_root]):
+            assert icon_registry.get("test-icon", "test") is not None
+        other_root = tmp_path_factory.mktemp("other")
+        with override_settings(STATICFILES_DIRS=[str(other_root)]):
+            assert icon_registry.get("test-icon", "test") is None
+
+    def test_render_skips_static_finders(self, icon_root):
+        """Test that rendering an indexed icon does not scan the finders"""
+        with override_settings(STATICFILES_DIRS=[icon_root]):
+            icon_registry.build()
+            with mock.patch("django.contrib.staticfiles.finders.find") as find:
+                template = Template('{% load svg_icon_tags %}{% svg_icon "test-icon" library="test" %}')
+                result = template.render(Context({}))
+
+            assert 'path d="M0 0"' in result
+            find.assert_not_called()
+
+    @override_settings(SVG_ICON_REGISTRY=None)
+    def test_registry_disabled_uses_finders(self, icon_root):
+        """Test that disabling the registry falls back to per-call lookup"""
+        with override_settings(STATICFILES_DIRS=[icon_root]):
+            template = Template('{% load svg_icon_tags %}{% svg_icon "test-icon" library="test" %}')
+            result = template.render(Context({}))
+
+            assert 'path d="M0 0"' in result
+
+
+class TestInvalidation:
+    """Test the SVG_ICON_INVALIDATION strategies"""
+
+    def test_default_mode_is_stat(self):
+        """Test that edits are picked up by default, with or without DEBUG"""
+        with override_settings(DEBUG=False):
+            assert get_invalidation_mode() == 'stat'
+        with override_settings(DEBUG=True):
+            assert get_invalidation_mode() == 'stat'
+
+    @override_settings(DEBUG=True, SVG_ICON_INVALIDATION='none')
+    def test_none_mode_never_stats(self, icon_root):
+        """Test that 'none' serves the indexed entry without a stat() call"""
+        with override_settings(STATICFILES_DIRS=[icon_root]):
+            icon_registry.build()
+            svg_icon_tags.svg_icon("test-icon", library="test")
+            with mock.patch("django_svg_icon_tags.templatetags.svg_icon_tags.Path.stat") as stat:
+                result = svg_icon_tags.svg_icon("test-icon", library="test")
+
+            assert 'path d="M0 0"' in result
+            stat.assert_not_called()
+
+    def test_refresh_reports_changes(self, icon_root):
+        """Test that refresh() diffs the index and sends icon_changed"""
+        received = []
+
+        def listener(key, old, new, **kwargs):
+            received.append((key, old is None, new is None))
+
+        with override_settings(STATICFILES_DIRS=[icon_root]):
+            icon_registry.build()
+            lib_dir = Path(icon_root) / "icons" / "test"
+            (lib_dir / "test-icon.svg").unlink()
+            (lib_dir / "new-icon.svg").write_text('<svg/>')
+
+            icon_changed.connect(listener)
+            try:
+                changes = icon_registry.refresh()
+            finally:
+                icon_changed.disconnect(listener)
+
+            assert len(changes) == 2
+            assert sorted(received) == [(('test', 'new-icon'), True, False), (('test', 'test-icon'), False, True)]
+            assert icon_registry.get("new-icon", "test") is not None
+
+    def test_poll_rescans_only_changed_directories(self, icon_root):
+        """Test that poll() re-stats files and runs the finders only after a directory changed"""
+        with override_settings(STATICFILES_DIRS=[icon_root]):
+            icon_registry.build()
+            icon_path = Path(icon_root) / "icons" / "test" / "test-icon.svg"
+            stat = icon_path.stat()
+            os.utime(icon_path, (stat.st_atime, stat.st_mtime + 10))
+
+            with mock.patch.object(icon_registry, "_scan", wraps=icon_registry._scan) as scan:
+                changes = icon_registry.poll()
+                assert [key for key, old, new in changes] == [("test", "test-icon")]
+                scan.assert_not_called()
+
+                lib_dir = icon_path.parent
+                (lib_dir / "new-icon.svg").write_text('<svg/>')
+                stat = lib_dir.stat()
+                os.utime(lib_dir, (stat.st_atime, stat.st_mtime + 10))
+                changes = icon_registry.poll()
+                assert [key for key, old, new in changes] == [("test", "new-icon")]
+                scan.assert_called_once()
+
+    @override_settings(SVG_ICON_INVALIDATION='watch')
+    def test_watcher_poll_invalidates_edited_icon(self, icon_root):
+        """Test that a poll picks up an edit and drops the stale cache entry"""
+        with override_settings(STATICFILES_DIRS=[icon_root]):
+            icon_registry.build()
+            template = Template('{% load svg_icon_tags %}{% svg_icon "test-icon" library="test" %}')
+            assert 'd="M0 0"' in template.render(Context({}))
+
+            icon_path = Path(icon_root) / "icons" / "test" / "test-icon.svg"
+            icon_path.write_text('<svg><path d="M9 9"/></svg>')
+            stat = icon_path.stat()
+            os.utime(icon_path, (stat.st_atime, stat.st_mtime + 10))
+
+            assert 'd="M0 0"' in template.render(Context({}))
+            assert IconWatcher(icon_registry).poll() == 1
+            assert 'd="M9 9"' in template.render(Context({}))
+
+    @pytest.mark.parametrize('argv, environ, expected', [
+        (['gunicorn', 'project.wsgi'], {}, True),
+        (['manage.py', 'migrate'], {}, False),
+        (['/venv/bin/django-admin', 'collectstatic'], {}, False),
+        (['manage.py', 'check_svg_icons'], {}, False),
+        (['/venv/lib/django/__main__.py', 'test'], {}, False),
+        (['manage.py', 'runserver'], {}, False),
+        (['manage.py', 'runserver'], {'RUN_MAIN': 'true'}, True),
+        (['manage.py', 'runserver', '--noreload'], {}, True),
+    ])
+    def test_watcher_autostarts_in_server_processes_only(self, argv, environ, expected):
+        """Test that management commands and the autoreloader parent do not start the watcher"""
+        env = {key: value for key, value in os.environ.items() if key != 'RUN_MAIN'}
+        with mock.patch.dict(os.environ, {**env, **environ}, clear=True):
+            assert should_autostart(argv) is expected
+
+    @pytest.mark.parametrize('setting, expected', [(True, True), (False, False)])
+    def test_watcher_autostart_setting(self, setting, expected):
+        """Test that SVG_ICON_WATCH_AUTOSTART overrides process detection"""
+        with override_settings(SVG_ICON_WATCH_AUTOSTART=setting):
+            assert should_autostart(['manage.py', 'migrate']) is expected
+            assert should_autostart(['gunicorn']) is expected
@@ -0,0 +1,101 @@
+"""
+Tests for the allowlist SVG sanitizer
+"""
+import time
+
+from django_svg_icon_tags.sanitizer import sanitize_svg
+
+
+class TestSanitizeSvg:
+    """Test sanitize_svg()"""
+
+    def test_clean_icon_unchanged(self):
+        """Test that a plain icon passes through untouched"""
+        svg = (
+            '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 16 16" fill="currentColor">'
+            '<path d="M8 0a8 8 0 1 0 0 16"/></svg>'
+        )
+        assert sanitize_svg(f"  {svg}\n") == svg
+
+    def test_prolog_and_comments_removed(self):
+        """Test that declarations, doctypes and comments are dropped"""
+        result = sanitize_svg(
+            '<?xml version="1.0"?><!DOCTYPE svg [<!ENTITY x "boom">]>'
+            '<svg><!-- <script>alert(1)</script> --><path d="M0 0"/></svg>'
+        )
+        assert result == '<svg><path d="M0 0"/></svg>'
+
+    def test_active_elements_dropped_with_content(self):
+        """Test that script and foreignObject are removed with their children"""
+        result = sanitize_svg(
+            '<svg><SCRIPT type="text/javascript">alert(1)</SCRIPT>'
+            '<foreignObject><iframe src="x"></iframe>text</foreignObject><g/></svg>'
+        )
+        assert result == '<svg><g/></svg>'
+
+    def test_unknown_elements_unwrapped(self):
+        """Test that unknown elements are removed but their children kept"""
+        assert sanitize_svg('<svg><a><path d="M0 0"/></a></svg>') == '<svg><path d="M0 0"/></svg>'
+
+    def test_attribute_allowlist(self):
+        """Test that handlers and unknown attributes are dropped in any quoting"""
+        result = sanitize_svg(
+            "<svg onload=alert(1) ONCLICK='alert(2)' class='a \"b\"' data-slot=\"icon\">"
+            '<path d="M0 0" onmouseover="alert(3)"/></svg>'
+        )
+        assert 'alert' not in result
+        assert '<svg class="a &quot;b&quot;" data-slot="icon">' in result
+
+    def test_unsafe_references_dropped(self):
+        """Test that script URLs and external references are removed"""
+        result = sanitize_svg(
+            '<svg><use href="#ok"/><use xlink:href="&#106;avascript:alert(1)"/>'
+            '<path fill="url(#grad)" style="background: url(http://evil/x)"/>'
+            '<rect style="width: expression(alert(1))"/></svg>'
+        )
+        assert result == '<svg><use href="#ok"/><use/><path fill="url(#grad)"/><rect/></svg>'
+
+    def test_style_element_checked_like_style_attribute(self):
+        """Test that <style> text goes through the CSS value check"""
+        removed = []
+        result = sanitize_svg(
+            '<svg><style>@import url(//evil.com/x.css)</style>'
+            '<style>rect { width: expression(alert(1)) }</style>'
+            '<style>.a { fill: url(#grad) }</style><path d="M0 0"/></svg>',
+            removed,
+        )
+        assert result == '<svg><style>.a { fill: url(#grad) }</style><path d="M0 0"/></svg>'
+        assert removed == ['value:style', 'value:style']
+
+    def test_unquoted_value_keeps_self_closing_slash(self):
+        """Test that a bare value does not swallow the / of a self-closing tag"""
+        assert sanitize_svg('<svg><path d=M0 onclick=x/></svg>') == '<svg><path d="M0"/></svg>'
+        assert sanitize_svg('<svg><path d=M0/1/></svg>') == '<svg><path d="M0/1"/></svg>'
+
+    def test_href_animation_dropped(self):
+        """Test that animations retargeting href or handlers are removed"""
+        result = sanitize_svg(
+            '<svg><set attributeName="href" to="javascript:alert(1)"/>'
+            '<animate attributeName="onbegin" values="alert(1)"/>'
+            '<animate attributeName="opacity" values="0;1"/></svg>'
+        )
+        assert result == '<svg><animate attributeName="opacity" values="0;1"/></svg>'
+
+    def test_stray_markup_escaped(self):
+        """Test that malformed tags end up as escaped text"""
+        result = sanitize_svg('<svg><text>1 < 2</text><path d="x" "onclick="alert(1)"></svg>')
+        assert result.startswith('<svg><text>1 &lt; 2</text>&lt;path')
+        assert '<path' not in result
+
+    def test_removed_report(self):
+        """Test that dropped constructs are reported"""
+        removed = []
+        sanitize_svg('<svg onclick="x"><script>y</script></svg>', removed)
+        assert removed == ['attribute:onclick', 'element:script']
+
+    def test_pathological_input_is_linear(self):
+        """Test that malformed input cannot trigger catastrophic backtracking"""
+        for payload in ('<a b="' * 20000, '<script>' * 50000, '<svg ' + 'a=b ' * 50000, '<' * 100000):
+            start = time.perf_counter()
+            sanitize_svg(payload)
+            assert time.perf_counter() - start < 2
\ No newline at end of file
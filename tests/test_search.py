@@ -0,0 +1,126 @@
+"""
+Tests for icon name search
+"""
+import json
+
+import pytest
+from django.test import override_settings
+from django.urls import include, path
+
+from django_svg_icon_tags.registry import icon_registry
+from django_svg_icon_tags.search import IconSearchIndex, get_search_index, search_icons
+from django_svg_icon_tags.templatetags import svg_icon_tags
+
+urlpatterns = [
+    path('icons/', include('django_svg_icon_tags.urls')),
+]
+
+KEYS = [
+    ("bootstrap", "house"),
+    ("bootstrap", "house-fill"),
+    ("bootstrap", "arrow-down"),
+    ("bootstrap", "arrow-down-circle"),
+    ("bootstrap", "cloud-arrow-down"),
+    ("heroicons-outline", "home"),
+    ("heroicons-outline", "arrow-down"),
+]
+
+
+@pytest.fixture
+def index():
+    return IconSearchIndex(KEYS, tags={("heroicons-outline", "home"): ["house", "building"]})
+
+
+def specs(page):
+    return [result.spec for result in page.results]
+
+
+class TestIconSearchIndex:
+    """Test IconSearchIndex"""
+
+    def test_ranking(self, index):
+        """Test exact, prefix, word, tag and substring matches in that order"""
+        assert specs(index.search("house")) == [
+            "bootstrap:house", "bootstrap:house-fill", "heroicons-outline:home",
+        ]
+        assert specs(index.search("down")) == [
+            "bootstrap:arrow-down", "heroicons-outline:arrow-down",
+            "bootstrap:cloud-arrow-down", "bootstrap:arrow-down-circle",
+        ]
+        assert specs(index.search("ouse")) == ["bootstrap:house", "bootstrap:house-fill"]
+
+    def test_all_terms_must_match(self, index):
+        """Test that multiple terms narrow the results"""
+        assert specs(index.search("arrow circle")) == ["bootstrap:arrow-down-circle"]
+        assert index.search("arrow nothing").total == 0
+
+    def test_library_filter(self, index):
+        """Test the library argument and the library:term syntax"""
+        assert specs(index.search("arrow", library="heroicons-outline")) == ["heroicons-outline:arrow-down"]
+        assert specs(index.search("heroicons-outline:arr")) == ["heroicons-outline:arrow-down"]
+        assert index.search("", library="bootstrap").total == 5
+        assert index.search("house", library="unknown").total == 0
+
+    def test_paging(self, index):
+        """Test offset, limit and has_more"""
+        first = index.search("", limit=3)
+        rest = index.search("", offset=3, limit=10)
+
+        assert (first.total, len(first.results), first.has_more) == (7, 3, True)
+        assert (len(rest.results), rest.has_more) == (4, False)
+        assert not set(specs(first)) & set(specs(rest))
+
+    def test_short_terms_match_prefixes_only(self, index):
+        """Test that terms under three characters skip substring matching"""
+        assert specs(index.search("ho")) == [
+            "heroicons-outline:home", "bootstrap:house", "bootstrap:house-fill",
+        ]
+        assert index.search("ow").total == 0
+
+
+class TestSearchIcons:
+    """Test the registry-backed search API and view"""
+
+    @pytest.fixture
+    def icon_dir(self, tmp_path):
+        for library, name in KEYS:
+            icon_dir = tmp_path / "icons" / library
+            icon_dir.mkdir(parents=True, exist_ok=True)
+            (icon_dir / f"{name}.svg").write_text('<svg viewBox="0 0 1 1"/>')
+        tags = tmp_path / "tags.json"
+        tags.write_text(json.dumps({"heroicons-outline/home": ["building"]}))
+        with override_settings(STATICFILES_DIRS=[str(tmp_path)], SVG_ICON_SEARCH_TAGS=str(tags)):
+            yield tmp_path
+
+    def test_search_icons(self, icon_dir):
+        """Test searching the registry with tags from a file"""
+        assert specs(search_icons("build")) == ["heroicons-outline:home"]
+        assert search_icons("", limit=1000).limit == 50
+        assert get_search_index() is get_search_index()
+
+    def test_index_follows_new_icons(self, icon_dir):
+        """Test that the index is rebuilt when icons are added"""
+        assert search_icons("star").total == 0
+        (icon_dir / "icons" / "bootstrap" / "star.svg").write_text('<svg viewBox="0 0 1 1"/>')
+        icon_registry.refresh()
+
+        assert specs(search_icons("star")) == ["bootstrap:star"]
+
+    def test_index_follows_icons_found_on_fallback_path(self, icon_dir):
+        """Test that icons indexed by a render-time lookup become searchable"""
+        with override_settings(SVG_ICON_INVALIDATION='stat'):
+            assert search_icons("star").total == 0
+            (icon_dir / "icons" / "bootstrap" / "star.svg").write_text('<svg viewBox="0 0 1 1"/>')
+            assert '<svg' in svg_icon_tags.svg_icon("star", library="bootstrap")
+
+            assert specs(search_icons("star")) == ["bootstrap:star"]
+
+    @override_settings(ROOT_URLCONF=__name__)
+    def test_view(self, icon_dir, client):
+        """Test the JSON search endpoint"""
+        data = client.get('/icons/search.json', {'q': 'arrow', 'library': 'bootstrap', 'limit': 2}).json()
+
+        assert data['total'] == 3
+        assert data['next'] == 2
+        assert data['results'][0] == {'icon': 'bootstrap:arrow-down', 'library': 'bootstrap', 'name': 'arrow-down'}
+        assert client.get('/icons/search.json', {'offset': 'x'}).status_code == 400
\ No newline at end of file
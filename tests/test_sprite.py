@@ -0,0 +1,97 @@
+"""
+Tests for SVG sprite rendering
+"""
+import pytest
+from django.template import Template, Context
+from django.test import override_settings
+
+from django_svg_icon_tags.templatetags import svg_icon_tags
+
+
+@pytest.fixture
+def mock_icon_dir(tmp_path):
+    """Create mock icons for sprite testing"""
+    icon_dir = tmp_path / "icons" / "test"
+    icon_dir.mkdir(parents=True)
+    (icon_dir / "star.svg").write_text(
+        '<svg xmlns="http://www.w3.org/2000/svg" width="16" height="16" fill="currentColor" viewBox="0 0 16 16">'
+        '<path d="M1 1"/></svg>'
+    )
+    (icon_dir / "heart.svg").write_text(
+        '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24"><path d="M2 2"/></svg>'
+    )
+    return str(tmp_path)
+
+
+class TestSpriteMode:
+    """Test sprite references and the svg_sprite tag"""
+
+    def test_sprite_icon_renders_use_reference(self, mock_icon_dir):
+        """Test that sprite mode emits a <use> instead of the path data"""
+        with override_settings(STATICFILES_DIRS=[mock_icon_dir]):
+            template = Template(
+                '{% load svg_icon_tags %}{% svg_icon "star" library="test" sprite=True class_name="w-4" %}'
+            )
+            result = template.render(Context({}))
+
+            assert '<use href="#test:star"></use>' in result
+            assert 'class="w-4"' in result
+            assert 'path d=' not in result
+
+    def test_sprite_contains_only_used_icons(self, mock_icon_dir):
+        """Test that svg_sprite emits one symbol per used icon"""
+        with override_settings(STATICFILES_DIRS=[mock_icon_dir]):
+            template = Template(
+                '{% load svg_icon_tags %}'
+                '{% svg_icon "star" library="test" sprite=True %}'
+                '{% svg_icon "test:star" sprite=True %}'
+                '{% svg_icon "heart" library="test" %}'
+                '{% svg_sprite %}'
+            )
+            result = template.render(Context({}))
+
+            assert result.count('<symbol') == 1
+            assert '<symbol id="test:star" viewBox="0 0 16 16"><path d="M1 1"/></symbol>' in result
+            assert 'id="test:heart"' not in result
+
+    def test_sprite_is_per_render(self, mock_icon_dir):
+        """Test that symbols do not leak between renders"""
+        with override_settings(STATICFILES_DIRS=[mock_icon_dir]):
+            Template('{% load svg_icon_tags %}{% svg_icon "heart" library="test" sprite=True %}').render(Context({}))
+            result = Template('{% load svg_icon_tags %}{% svg_sprite %}').render(Context({}))
+
+            assert result == ''
+
+    def test_sprite_collects_icons_from_loops(self, mock_icon_dir):
+        """Test that icons used in a for loop are all collected"""
+        with override_settings(STATICFILES_DIRS=[mock_icon_dir]):
+            template = Template(
+                '{% load svg_icon_tags %}'
+                '{% for name in names %}{% svg_icon name library="test" sprite=True %}{% endfor %}'
+                '{% svg_sprite %}'
+            )
+            result = template.render(Context({'names': ['star', 'heart']}))
+
+            assert 'id="test:star"' in result
+            assert 'id="test:heart"' in result
+
+    def test_sprite_collects_icons_from_isolated_includes(self, mock_icon_dir):
+        """Test that icons rendered in {% include ... only %} still reach svg_sprite"""
+        templates = {
+            'icon.html': '{% load svg_icon_tags %}{% svg_icon "test:heart" sprite=True %}',
+        }
+        loaders = [('django.template.loaders.locmem.Loader', templates)]
+        with override_settings(
+            STATICFILES_DIRS=[mock_icon_dir],
+            TEMPLATES=[{'BACKEND': 'django.template.backends.django.DjangoTemplates', 'OPTIONS': {'loaders': loaders}}],
+        ):
+            template = Template('{% load svg_icon_tags %}{% include "icon.html" only %}{% svg_sprite %}')
+            result = template.render(Context({}))
+
+            assert '<use href="#test:heart"></use>' in result
+            assert '<symbol id="test:heart"' in result
+
+    def test_symbol_ids_do_not_collide(self):
+        """Test that library and icon names cannot combine into the same symbol id"""
+        assert svg_icon_tags._sprite_symbol_id("c", "a-b") != svg_icon_tags._sprite_symbol_id("b-c", "a")
+        assert svg_icon_tags._sprite_symbol_id("a.b", None) != svg_icon_tags._sprite_symbol_id("b", "a")
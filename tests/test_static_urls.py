@@ -0,0 +1,71 @@
+"""
+Tests for content-hashed <img> icon URLs
+"""
+import hashlib
+import json
+from unittest import mock
+
+import pytest
+from django.core.management import call_command
+from django.test import override_settings
+
+from django_svg_icon_tags import static_urls
+from django_svg_icon_tags.templatetags import svg_icon_tags
+
+ICON = b'<svg viewBox="0 0 1 1"><path d="M0 0"/></svg>'
+
+
+@pytest.fixture
+def mock_icon_dir(tmp_path):
+    """Create a mock icon"""
+    icon_dir = tmp_path / "static" / "icons" / "test"
+    icon_dir.mkdir(parents=True)
+    (icon_dir / "star.svg").write_bytes(ICON)
+    return tmp_path
+
+
+class TestHashedImgUrls:
+    """Test <img> mode URLs"""
+
+    def test_url_carries_content_hash(self, mock_icon_dir):
+        """Test that the URL is versioned by the file content"""
+        with override_settings(STATICFILES_DIRS=[str(mock_icon_dir / "static")]):
+            result = svg_icon_tags.svg_icon("test:star", inline=False)
+
+            digest = hashlib.sha256(ICON).hexdigest()[:12]
+            assert f'src="/static/icons/test/star.svg?v={digest}"' in result
+
+    @override_settings(SVG_ICON_RENDER_CACHE_SIZE=0)
+    def test_url_memoized_per_icon(self, mock_icon_dir):
+        """Test that the URL is computed once per icon"""
+        with override_settings(STATICFILES_DIRS=[str(mock_icon_dir / "static")]):
+            with mock.patch.object(svg_icon_tags, "hashed_icon_url", wraps=svg_icon_tags.hashed_icon_url) as build:
+                svg_icon_tags.svg_icon("test:star", inline=False, class_name="a")
+                svg_icon_tags.svg_icon("test:star", inline=False, class_name="b")
+
+            build.assert_called_once()
+
+    @override_settings(SVG_ICON_HASHED_URLS=False)
+    def test_hashing_can_be_disabled(self, mock_icon_dir):
+        """Test that SVG_ICON_HASHED_URLS=False keeps plain static URLs"""
+        with override_settings(STATICFILES_DIRS=[str(mock_icon_dir / "static")]):
+            result = svg_icon_tags.svg_icon("test:star", inline=False)
+
+            assert 'src="/static/icons/test/star.svg"' in result
+
+    def test_precomputed_manifest(self, mock_icon_dir):
+        """Test that build_svg_icons writes a manifest the URLs are read from"""
+        manifest = mock_icon_dir / "urls.json"
+        with override_settings(STATICFILES_DIRS=[str(mock_icon_dir / "static")]):
+            call_command('build_svg_icons', url_manifest=str(manifest), stdout=None)
+            assert json.loads(manifest.read_text())['icons'] == {
+                'icons/test/star.svg': static_urls.content_hash(ICON),
+            }
+
+            manifest.write_text(json.dumps({'icons': {'icons/test/star.svg': 'abc123'}}))
+            with override_settings(SVG_ICON_URL_MANIFEST=str(manifest)):
+                with mock.patch.object(static_urls, "file_hash") as file_hash:
+                    result = svg_icon_tags.svg_icon("test:star", inline=False)
+
+            assert 'star.svg?v=abc123"' in result
+            file_hash.assert_not_called()
\ No newline at end of file
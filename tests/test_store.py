@@ -0,0 +1,94 @@
+"""
+Tests for the content-addressed icon store
+"""
+from django.test import override_settings
+
+from django_svg_icon_tags.compiled import compile_svg
+from django_svg_icon_tags.store import IconStore
+from django_svg_icon_tags.templatetags import svg_icon_tags
+
+STAR = compile_svg('<svg viewBox="0 0 1 1"><path d="M0 0L1 1"/></svg>')
+DOT = compile_svg('<svg viewBox="0 0 2 2"><circle r="1"/></svg>')
+GRID = compile_svg('<svg viewBox="0 0 8 8">' + '<rect width="1" height="1"/>' * 8 + '</svg>')
+
+
+class TestIconStore:
+    """Test IconStore"""
+
+    def test_identical_icons_stored_once(self):
+        """Test that keys with identical content share one record"""
+        store = IconStore()
+        store.set(('a.svg', 1.0), STAR)
+        store.set(('b.svg', 1.0), compile_svg(STAR.render()))
+        store.set(('c.svg', 1.0), DOT)
+
+        memory = store.memory()
+        assert (memory.keys, memory.records) == (3, 2)
+        assert memory.stored_bytes == STAR.size + DOT.size
+        assert memory.logical_bytes == 2 * STAR.size + DOT.size
+        assert store.get(('b.svg', 1.0)) == STAR
+
+    def test_record_freed_with_last_key(self):
+        """Test reference counting across deletes and evictions"""
+        store = IconStore(maxsize=2)
+        store.set('a', STAR)
+        store.set('b', STAR)
+        store.delete('a')
+        assert store.memory().records == 1
+
+        store.set('c', DOT)
+        store.set('d', DOT)
+        assert 'b' not in store
+        assert (store.memory().records, store.bytes) == (1, DOT.size)
+
+    def test_cold_records_compressed(self):
+        """Test that only hot_entries records stay expanded"""
+        store = IconStore(hot_entries=1)
+        store.set('grid', GRID)
+        store.set('dot', DOT)
+
+        memory = store.memory()
+        assert memory.compressed == 1
+        assert memory.stored_bytes < memory.unique_bytes
+
+        assert store.get('grid') == GRID
+        assert store.memory().compressed == 0
+        store.set('star', STAR)
+        assert store.get('dot') == DOT
+
+    def test_incompressible_records_stay_expanded(self):
+        """Test that compression never grows a record"""
+        store = IconStore(hot_entries=0)
+        store.set('dot', DOT)
+
+        assert store.memory().compressed == 0
+        assert store.bytes == DOT.size
+
+    def test_pinned_and_zero_size(self):
+        """Test the LRUCache-compatible pinning and disabled storage"""
+        store = IconStore(maxsize=0)
+        store.set('a', STAR)
+        store.set('b', DOT, pin=True)
+
+        assert 'a' not in store
+        assert store.info().pinned == 1
+
+
+class TestStoreSettings:
+    """Test the store behind the compiled-icon cache"""
+
+    def test_memory_report(self, tmp_path):
+        """Test that duplicate icon files share memory in the icon cache"""
+        for library in ("one", "two"):
+            icon_dir = tmp_path / "icons" / library
+            icon_dir.mkdir(parents=True)
+            (icon_dir / "star.svg").write_text(STAR.render())
+
+        with override_settings(STATICFILES_DIRS=[str(tmp_path)], SVG_ICON_CACHE_COMPRESS=True):
+            svg_icon_tags.svg_icon("one:star")
+            svg_icon_tags.svg_icon("two:star")
+
+            report = svg_icon_tags.icon_memory_report()
+            assert (report.keys, report.records) == (2, 1)
+            assert report.saved_bytes == STAR.size
+            assert svg_icon_tags._get_svg_cache().hot_entries == 256
\ No newline at end of file
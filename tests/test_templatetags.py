@@ -1,6 +1,8 @@
 """
 Unit tests for SVG icon template tags
 """
+from unittest import mock
+
 import pytest
 from django.template import Template, Context
 from django.test import override_settings
@@ -159,6 +161,52 @@ class TestIconInclusionTag:
             result = template.render(context)
             
             assert 'scale-y-[-1]' in result
+    
+    def test_icon_with_custom_presets(self, mock_icon_file):
+        """Test that presets can be extended and overridden through settings"""
+        with override_settings(
+            STATICFILES_DIRS=[mock_icon_file],
+            SVG_ICON_SIZE_PRESETS={'md': 'size-5', 'huge': 'size-24'},
+            SVG_ICON_COLOR_PRESETS={'brand': 'text-brand'},
+        ):
+            template = Template(
+                '{% load svg_icon_tags %}{% icon "test-icon" library="test" %}'
+                '{% icon "test-icon" library="test" size="huge" color="brand" %}'
+            )
+            result = template.render(Context({}))
+            
+            assert 'class="size-5 text-current"' in result
+            assert 'class="size-24 text-brand"' in result
+    
+    def test_icon_renders_without_subtemplate(self, mock_icon_file):
+        """Test that the icon tag does not load a template per call"""
+        with override_settings(STATICFILES_DIRS=[mock_icon_file]):
+            template = Template('{% load svg_icon_tags %}{% icon "test-icon" library="test" size="sm" %}')
+            with mock.patch('django.template.engine.Engine.get_template') as get_template:
+                result = template.render(Context({}))
+            
+            get_template.assert_not_called()
+            assert result.startswith('<svg class="w-4 h-4 text-current"')
+    
+    def test_icon_template_override_still_rendered(self, mock_icon_file, tmp_path):
+        """Test that a project override of the old icon.html is honoured, with a deprecation warning"""
+        override_dir = tmp_path / "templates" / "svg_icon_tags"
+        override_dir.mkdir(parents=True)
+        (override_dir / "icon.html").write_text(
+            '{% load svg_icon_tags %}<i>{% svg_icon icon_name library=library class_name=class_name %}</i>'
+        )
+        templates = [{
+            'BACKEND': 'django.template.backends.django.DjangoTemplates',
+            'DIRS': [str(tmp_path / "templates")],
+            'APP_DIRS': True,
+        }]
+        with override_settings(STATICFILES_DIRS=[mock_icon_file], TEMPLATES=templates):
+            template = Template('{% load svg_icon_tags %}{% icon "test-icon" library="test" size="sm" %}')
+            with pytest.warns(DeprecationWarning, match="icon.html"):
+                result = template.render(Context({}))
+        
+        assert result.startswith('<i><svg class="w-4 h-4 text-current"')
+        assert result.endswith('</svg></i>')
 
 
 class TestSvgIconFilter:
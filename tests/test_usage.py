@@ -0,0 +1,107 @@
+"""
+Tests for icon usage scanning and used-icon manifests
+"""
+import json
+
+import pytest
+from django.apps import apps
+from django.core.management import call_command
+from django.test import override_settings
+
+from django_svg_icon_tags.bundle import IconBundle
+from django_svg_icon_tags.templatetags import svg_icon_tags
+from django_svg_icon_tags.usage import IconUsage, load_usage_manifest, write_usage_manifest
+
+
+@pytest.fixture
+def mock_project(tmp_path):
+    """Create icons and a template directory using some of them"""
+    for library, names in (("alpha", ("home", "star", "unused")), (None, ("logo",))):
+        icon_dir = tmp_path / "static" / "icons" / (library or "")
+        icon_dir.mkdir(parents=True, exist_ok=True)
+        for name in names:
+            (icon_dir / f"{name}.svg").write_text(f'<svg><path id="{name}"/></svg>')
+
+    templates = tmp_path / "templates"
+    templates.mkdir()
+    (templates / "page.html").write_text(
+        '{% load svg_icon_tags %}\n'
+        '{% svg_icon "alpha:home" class_name="w-4" %}\n'
+        '{% icon "star" size="lg" library="alpha" %}\n'
+        '{{ "logo"|svg_icon_simple }}\n'
+        '{% svg_icon name %}\n'
+    )
+    return tmp_path
+
+
+class TestIconUsage:
+    """Test template scanning"""
+
+    def test_literal_usages(self):
+        """Test tag, keyword, positional library and filter forms"""
+        usage = IconUsage()
+        usage.add_template(
+            '{% svg_icon "home" "alpha" as home %}'
+            '{% svg_icon name="star" library=\'alpha\' %}'
+            '{% icon "menu" "lg" "current" "beta" %}'
+            '{% if x %}{{ "beta:close"|svg_icon_simple|safe }}{% endif %}',
+            'page.html',
+        )
+
+        assert set(usage.icons) == {("alpha", "home"), ("alpha", "star"), ("beta", "menu"), ("beta", "close")}
+        assert usage.icons["alpha", "home"] == ["page.html:1"]
+        assert usage.dynamic == []
+
+    def test_dynamic_usages(self):
+        """Test that variable names and libraries are reported, not guessed"""
+        usage = IconUsage()
+        usage.add_template(
+            '{% svg_icon name %}\n{% svg_icon "home" library=lib %}\n{% svg_icon "x"|lower %}\n'
+            '{% svg_icons toolbar library="alpha" %}'
+        )
+
+        assert usage.icons == {}
+        assert usage.dynamic == [":1", ":2", ":3", ":4"]
+
+    def test_manifest_round_trip(self, tmp_path):
+        """Test writing and reading a manifest"""
+        path = str(tmp_path / "used.json")
+        assert write_usage_manifest(path, [("alpha", "home"), (None, "logo"), ("alpha", "home")], 2) == 2
+
+        assert json.loads((tmp_path / "used.json").read_text()) == {"icons": ["/logo", "alpha/home"], "dynamic": 2}
+        assert load_usage_manifest(path) == {("alpha", "home"), (None, "logo")}
+
+
+class TestUsageCommands:
+    """Test scan_svg_icons and manifest-driven build and preload"""
+
+    def test_scan_build_and_preload(self, mock_project, capsys):
+        """Test that the scanned manifest limits bundles and preloading"""
+        manifest = str(mock_project / "used.json")
+        bundle_path = str(mock_project / "icons.bundle")
+        with override_settings(STATICFILES_DIRS=[str(mock_project / "static")]):
+            call_command('scan_svg_icons', str(mock_project / "templates"), output=manifest)
+            assert "Found 3 icons" in capsys.readouterr().out
+            assert load_usage_manifest(manifest) == {("alpha", "home"), ("alpha", "star"), (None, "logo")}
+
+            call_command('build_svg_icons', output=bundle_path, usage_manifest=manifest)
+            bundle = IconBundle(bundle_path)
+            assert set(bundle.keys()) == {("alpha", "home"), ("alpha", "star"), (None, "logo")}
+
+            with override_settings(SVG_ICON_USAGE_MANIFEST=manifest, SVG_ICON_PRELOAD_USED=True):
+                svg_icon_tags.clear_icon_cache()
+                apps.get_app_config("django_svg_icon_tags").ready()
+                assert svg_icon_tags.icon_cache_info().currsize == 3
+
+    def test_runtime_usage_log(self, mock_project, capsys):
+        """Test that rendered icons are logged once and merged by the scan"""
+        log = mock_project / "usage.log"
+        manifest = str(mock_project / "used.json")
+        with override_settings(STATICFILES_DIRS=[str(mock_project / "static")], SVG_ICON_USAGE_LOG=str(log)):
+            for _ in range(3):
+                svg_icon_tags.svg_icon("alpha:unused", class_name="a")
+
+            assert log.read_text() == "alpha/unused\n"
+            call_command('scan_svg_icons', output=manifest)
+
+        assert ("alpha", "unused") in load_usage_manifest(manifest)
\ No newline at end of file
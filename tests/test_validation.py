@@ -0,0 +1,107 @@
+"""
+Tests for icon validation and the check_svg_icons command
+"""
+import json
+from io import StringIO
+from unittest import mock
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.test import override_settings
+
+from django_svg_icon_tags import validation
+from django_svg_icon_tags.validation import check_icon_file, check_icons
+
+SMALL = '<svg viewBox="0 0 1 1"><path d="M0 0"/></svg>'
+LARGE = '<svg viewBox="0 0 9 9">' + '<rect width="1" height="1"/>' * 40 + '</svg>'
+UNSAFE = '<svg viewBox="0 0 1 1" onload="x()"><script>alert(1)</script><path d="M0 0"/></svg>'
+
+
+@pytest.fixture
+def icon_dir(tmp_path):
+    """Create mock icons, one of each kind"""
+    icon_dir = tmp_path / "icons" / "test"
+    icon_dir.mkdir(parents=True)
+    (icon_dir / "small.svg").write_text(SMALL)
+    (icon_dir / "large.svg").write_text(LARGE)
+    (icon_dir / "unsafe.svg").write_text(UNSAFE)
+    with override_settings(STATICFILES_DIRS=[str(tmp_path)]):
+        yield icon_dir
+
+
+class TestCheckIconFile:
+    """Test check_icon_file"""
+
+    def test_valid(self, icon_dir):
+        """Test sizes and timings of a clean icon"""
+        check = check_icon_file("test", "small", str(icon_dir / "small.svg"))
+
+        assert check.valid
+        assert check.removed == ()
+        assert check.raw_bytes == check.sanitized_bytes == len(SMALL)
+        assert check.parse_ms > 0 and check.sanitize_ms >= 0
+
+    def test_stripped(self, icon_dir):
+        """Test that sanitizer removals are reported"""
+        check = check_icon_file("test", "unsafe", str(icon_dir / "unsafe.svg"))
+
+        assert check.valid
+        assert set(check.removed) == {"attribute:onload", "element:script"}
+        assert check.sanitized_bytes < check.raw_bytes
+
+    def test_invalid(self, icon_dir):
+        """Test files failing the structure check or unreadable"""
+        (icon_dir / "text.svg").write_text("hello")
+        (icon_dir / "binary.svg").write_bytes(b"\xff\xfe")
+
+        assert check_icon_file("test", "text", str(icon_dir / "text.svg")).error == "not an SVG document"
+        assert check_icon_file("test", "binary", str(icon_dir / "binary.svg")).error.startswith("unreadable")
+        assert not check_icon_file("test", "gone", str(icon_dir / "gone.svg")).valid
+
+    def test_process_pool(self, icon_dir):
+        """Test that pooled checks match in-process ones, in order"""
+        icons = [("test", path.stem, str(path)) for path in sorted(icon_dir.iterdir())] * 3
+        pooled = check_icons(icons, workers=2)
+
+        assert [check.path for check in pooled] == [path for _, _, path in icons]
+        assert [check.removed for check in pooled] == [check.removed for check in check_icons(icons, workers=1)]
+
+    def test_pool_spawns_workers_without_db_connections(self, icon_dir):
+        """Test that workers are spawned, not forked, after closing database connections"""
+        icons = [("test", path.stem, str(path)) for path in sorted(icon_dir.iterdir())]
+        with mock.patch.object(validation, "connections") as connections, \
+                mock.patch.object(validation, "ProcessPoolExecutor", wraps=validation.ProcessPoolExecutor) as pool:
+            check_icons(icons, workers=2)
+
+        connections.close_all.assert_called_once()
+        assert pool.call_args.kwargs["mp_context"].get_start_method() == "spawn"
+
+
+class TestCheckCommand:
+    """Test manage.py check_svg_icons"""
+
+    def test_report(self, icon_dir, tmp_path):
+        """Test the ranking, heavy flag, stripped list and JSON report"""
+        out = StringIO()
+        report = tmp_path / "report.json"
+        call_command("check_svg_icons", "--workers", "1", "--max-bytes", "500", "--json", str(report), stdout=out)
+
+        output = out.getvalue()
+        assert "test:unsafe: " in output
+        lines = output.splitlines()
+        ranking = lines[lines.index("Heaviest icons by size:") + 2:]
+        assert ranking[0].endswith("test:large  heavy")
+        assert "3 valid, 0 invalid, 1 sanitized, 1 over 500 bytes" in output
+
+        icons = {icon["icon"]: icon for icon in json.loads(report.read_text())["icons"]}
+        assert icons["test:large"]["heavy"]
+        assert icons["test:unsafe"]["removed"]
+
+    def test_invalid_icons_fail(self, icon_dir):
+        """Test that invalid icons are listed and fail the command"""
+        (icon_dir / "broken.svg").write_text("not svg")
+        err = StringIO()
+        with pytest.raises(CommandError, match="1 invalid"):
+            call_command("check_svg_icons", "--workers", "1", stdout=StringIO(), stderr=err)
+
+        assert "Invalid icon test:broken: not an SVG document" in err.getvalue()
\ No newline at end of file
@@ -0,0 +1,187 @@
+"""
+Tests for the sprite and icon HTTP endpoints
+"""
+import gzip
+import json
+import os
+import time
+from unittest import mock
+
+import pytest
+from django.template import Context, Template
+from django.test import RequestFactory, override_settings
+from django.urls import include, path
+
+from django_svg_icon_tags import registry, views
+from django_svg_icon_tags.registry import icon_registry
+from django_svg_icon_tags.templatetags import svg_icon_tags
+
+urlpatterns = [
+    path('icons/', include('django_svg_icon_tags.urls')),
+]
+
+
+@pytest.fixture
+def mock_icon_dir(tmp_path):
+    """Create mock icons"""
+    icon_dir = tmp_path / "icons" / "test"
+    icon_dir.mkdir(parents=True)
+    (icon_dir / "star.svg").write_text('<svg viewBox="0 0 1 1"><path d="M0 0"/></svg>')
+    (icon_dir / "dot.svg").write_text('<svg viewBox="0 0 2 2"><circle r="1"/></svg>')
+    with override_settings(STATICFILES_DIRS=[str(tmp_path)], ROOT_URLCONF=__name__):
+        yield tmp_path
+
+
+@pytest.fixture
+def rf():
+    return RequestFactory()
+
+
+class TestSpriteView:
+    """Test the sprite endpoint"""
+
+    def test_library_sprite(self, mock_icon_dir, rf):
+        """Test that a library sprite holds one symbol per icon"""
+        response = views.sprite(rf.get('/icons/sprite/test.svg'), library='test')
+
+        assert response.status_code == 200
+        assert response['Content-Type'] == 'image/svg+xml'
+        body = response.content.decode()
+        assert body.startswith('<svg xmlns="http://www.w3.org/2000/svg">')
+        assert '<symbol id="test:dot"' in body and '<symbol id="test:star"' in body
+        assert 'Accept-Encoding' in response['Vary']
+        assert response['Cache-Control'] == 'public, max-age=3600'
+
+    def test_gzip(self, mock_icon_dir, rf):
+        """Test that gzip clients get the precompressed body and their own ETag"""
+        plain = views.sprite(rf.get('/'), library='test')
+        compressed = views.sprite(rf.get('/', HTTP_ACCEPT_ENCODING='br, gzip'), library='test')
+
+        assert compressed['Content-Encoding'] == 'gzip'
+        assert gzip.decompress(compressed.content) == plain.content
+        assert compressed['ETag'] != plain['ETag']
+
+    @pytest.mark.parametrize('header', ['gzip;q=0', 'identity, gzip; q=0.0', '*;q=0', 'gzip;q=x'])
+    def test_gzip_refused(self, mock_icon_dir, rf, header):
+        """Test that gzip with q=0 counts as a refusal"""
+        response = views.sprite(rf.get('/', HTTP_ACCEPT_ENCODING=header), library='test')
+
+        assert not response.has_header('Content-Encoding')
+        assert response.content.startswith(b'<svg')
+
+    @pytest.mark.parametrize('header', ['gzip;q=0.5', 'x-gzip', '*'])
+    def test_gzip_accepted(self, mock_icon_dir, rf, header):
+        """Test that any non-zero q-value for gzip or a wildcard accepts it"""
+        response = views.sprite(rf.get('/', HTTP_ACCEPT_ENCODING=header), library='test')
+
+        assert response['Content-Encoding'] == 'gzip'
+
+    def test_not_modified(self, mock_icon_dir, rf):
+        """Test that a matching If-None-Match answers 304"""
+        etag = views.sprite(rf.get('/'), library='test')['ETag']
+        response = views.sprite(rf.get('/', HTTP_IF_NONE_MATCH=etag), library='test')
+
+        assert response.status_code == 304
+        assert response['ETag'] == etag
+        assert not response.content
+
+    def test_versioned_url_immutable(self, mock_icon_dir, rf):
+        """Test that only the current version is cached as immutable"""
+        url = views.sprite_url('test')
+        path_ = url.partition('?')[0]
+        assert path_ == '/icons/sprite/test.svg'
+
+        response = views.sprite(rf.get(url), library='test')
+        assert response['Cache-Control'] == views.IMMUTABLE
+
+        stale = views.sprite(rf.get(path_ + '?v=0'), library='test')
+        assert 'immutable' not in stale['Cache-Control']
+
+    def test_rebuilt_after_icon_change(self, mock_icon_dir):
+        """Test that an edited icon changes the served version"""
+        version = views.sprite_payload('test').version
+        star = mock_icon_dir / "icons" / "test" / "star.svg"
+        star.write_text('<svg viewBox="0 0 1 1"><path d="M1 1"/></svg>')
+        os.utime(star, (1, 1))
+        icon_registry.refresh()
+
+        payload = views.sprite_payload('test')
+        assert payload.version != version
+        assert b'd="M1 1"' in payload.body
+
+    def test_stat_mode_polls_once_per_interval(self, mock_icon_dir):
+        """Test that 'stat' mode sprites poll the registry instead of stat()ing every icon"""
+        with override_settings(SVG_ICON_INVALIDATION='stat', SVG_ICON_WATCH_INTERVAL=60):
+            url = views.sprite_url('test')
+            with mock.patch.object(icon_registry, 'poll', wraps=icon_registry.poll) as poll, \
+                    mock.patch.object(svg_icon_tags, 'resolve_icon') as resolve:
+                assert views.sprite_url('test') == url
+                views.sprite_payload('test')
+
+            poll.assert_not_called()
+            resolve.assert_not_called()
+
+            star = mock_icon_dir / "icons" / "test" / "star.svg"
+            mtime = star.stat().st_mtime + 10
+            star.write_text('<svg viewBox="0 0 1 1"><path d="M2 2"/></svg>')
+            os.utime(star, (mtime, mtime))
+            with mock.patch.object(registry.time, 'monotonic', return_value=time.monotonic() + 61):
+                assert views.sprite_url('test') != url
+                assert b'd="M2 2"' in views.sprite_payload('test').body
+
+    def test_usage_manifest_sprite(self, mock_icon_dir, rf):
+        """Test that the default sprite holds the used icons"""
+        manifest = mock_icon_dir / "used.json"
+        manifest.write_text(json.dumps({"icons": ["test/star"], "dynamic": 0}))
+        with override_settings(SVG_ICON_USAGE_MANIFEST=str(manifest)):
+            body = views.sprite(rf.get('/icons/sprite.svg')).content.decode()
+
+        assert 'id="test:star"' in body
+        assert 'id="test:dot"' not in body
+
+    def test_missing(self, mock_icon_dir, client):
+        """Test 404 for unknown libraries, unset manifests and unsafe methods"""
+        assert client.get('/icons/sprite/nope.svg').status_code == 404
+        assert client.get('/icons/sprite.svg').status_code == 404
+        assert client.post('/icons/sprite/test.svg').status_code == 405
+
+    def test_sprite_url_tag(self, mock_icon_dir):
+        """Test the {% svg_sprite_url %} tag"""
+        result = Template('{% load svg_icon_tags %}{% svg_sprite_url "test" %}').render(Context())
+
+        assert result == views.sprite_url('test')
+        assert '?v=' in result
+
+
+class TestIconView:
+    """Test the single-icon endpoint"""
+
+    def test_icon(self, mock_icon_dir, client):
+        """Test that an icon is served as a standalone sanitized SVG"""
+        response = client.get(views.icon_url('test:star'))
+
+        assert response.status_code == 200
+        assert 'd="M0 0"' in response.content.decode()
+        assert response['Cache-Control'] == views.IMMUTABLE
+        assert response['X-Content-Type-Options'] == 'nosniff'
+        assert "default-src 'none'" in response['Content-Security-Policy']
+
+    def test_invalid_and_missing(self, mock_icon_dir, client):
+        """Test 404 for unknown and malformed icon names"""
+        assert client.get('/icons/icon/test/missing.svg').status_code == 404
+        assert client.get('/icons/icon/test/..%2Fstar.svg').status_code == 404
+
+    def test_rebuilt_after_edit_in_stat_mode(self, mock_icon_dir, rf):
+        """Test that 'stat' mode serves an edited icon without a registry refresh"""
+        with override_settings(SVG_ICON_INVALIDATION='stat'):
+            before = views.icon(rf.get('/'), name='star', library='test')
+            star = mock_icon_dir / "icons" / "test" / "star.svg"
+            mtime = star.stat().st_mtime + 10
+            star.write_text('<svg viewBox="0 0 1 1"><path d="M9 9"/></svg>')
+            os.utime(star, (mtime, mtime))
+            after = views.icon(rf.get('/'), name='star', library='test')
+            sprite = views.sprite_payload('test')
+
+        assert b'd="M9 9"' in after.content
+        assert after['ETag'] != before['ETag']
+        assert b'd="M9 9"' in sprite.body
\ No newline at end of file